@@ -0,0 +1,138 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandera import DataFrameSchema
+
+from pandakeeper.dataloader import DataFrameAdapter
+from pandakeeper.dataprocessor import DataProcessor
+from pandakeeper.dataprocessor.cacher import RuntimeCacher
+from pandakeeper.node import Node
+from pandakeeper.validators import AnyDataFrame
+
+__all__ = (
+    'make_frame',
+    'Combine',
+    'CachedCombine',
+    'make_chain',
+    'make_fan_in',
+    'make_diamond'
+)
+
+
+def make_frame(n_rows: int, n_columns: int = 4) -> pd.DataFrame:
+    """
+    Creates numeric DataFrame with deterministic contents.
+
+    Args:
+        n_rows:     number of rows.
+        n_columns:  number of columns.
+    Returns:
+        DataFrame with columns 'c0', 'c1', ...
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({f'c{i}': rng.random(n_rows) for i in range(n_columns)})
+
+
+class Combine(DataProcessor):
+    """Non-cached DataProcessor that sums the DataFrames of its input Nodes."""
+    __slots__ = ()
+
+    def _load_non_cached(self) -> pd.DataFrame:
+        frames: List[pd.DataFrame] = [connection.extract_data() for connection in self.positional_input_nodes]
+        result = frames[0]
+        for frame in frames[1:]:
+            result = result + frame
+        return result
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    @property
+    def use_cached(self) -> bool:
+        return False
+
+    def _dump_to_cache(self, data: pd.DataFrame) -> None:
+        pass
+
+    def _clear_cache_storage(self) -> None:
+        pass
+
+    def _load_cached(self) -> pd.DataFrame:
+        raise ValueError("Cannot load non-cached data")
+
+
+class CachedCombine(RuntimeCacher):
+    """RuntimeCacher that sums the DataFrames of its input Nodes."""
+    __slots__ = ()
+
+    def _load_non_cached(self) -> pd.DataFrame:
+        return Combine._load_non_cached(self)  # type: ignore
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+
+def make_chain(source: Node, depth: int, cached: bool = False,
+               output_validator: DataFrameSchema = AnyDataFrame) -> Node:
+    """
+    Builds a chain of DataProcessors on top of the source Node.
+
+    Args:
+        source:            the first Node of the chain.
+        depth:             number of DataProcessors.
+        cached:            whether the DataProcessors cache their outputs.
+        output_validator:  output validator of the DataProcessors.
+    Returns:
+        The last Node of the chain.
+    """
+    processor_type = CachedCombine if cached else Combine
+    node = source
+    for _ in range(depth):
+        processor = processor_type(output_validator)
+        processor.connect_input_node(node)
+        node = processor
+    return node
+
+
+def make_fan_in(n_rows: int, width: int, cached: bool = False) -> Node:
+    """
+    Builds a DataProcessor with 'width' DataFrameAdapter inputs.
+
+    Args:
+        n_rows:  number of rows of every input.
+        width:   number of inputs.
+        cached:  whether the DataProcessor caches its output.
+    Returns:
+        The DataProcessor.
+    """
+    frame = make_frame(n_rows)
+    processor = CachedCombine() if cached else Combine()
+    processor.connect_input_nodes(*(DataFrameAdapter(frame) for _ in range(width)))
+    return processor
+
+
+def make_diamond(source: Node, layers: int, cached: bool = False) -> Node:
+    """
+    Builds a stack of diamonds on top of the source Node: every layer splits the previous Node
+    into two branches and joins them. Without caching or 'evaluation_scope' the number of extractions
+    doubles with every layer.
+
+    Args:
+        source:  the first Node of the stack.
+        layers:  number of diamonds.
+        cached:  whether the DataProcessors cache their outputs.
+    Returns:
+        The last join of the stack.
+    """
+    processor_type = CachedCombine if cached else Combine
+    node = source
+    for _ in range(layers):
+        left = processor_type()
+        left.connect_input_node(node)
+        right = processor_type()
+        right.connect_input_node(node)
+        join = processor_type()
+        join.connect_input_nodes(left, right)
+        node = join
+    return node
@@ -0,0 +1,104 @@
+import warnings
+
+from pandakeeper import evaluation_scope
+from pandakeeper.dataloader import DataFrameAdapter
+from pandakeeper.execution import GraphExecutor
+
+from .common import make_frame, make_chain, make_fan_in, make_diamond, Combine
+
+warnings.simplefilter('ignore', RuntimeWarning)
+
+
+class ChainSuite:
+    """Extraction from deep chains of DataProcessors."""
+    params = ([10, 50], [1_000, 100_000])
+    param_names = ['depth', 'n_rows']
+
+    def setup(self, depth, n_rows):
+        self.source = DataFrameAdapter(make_frame(n_rows))
+        self.chain = make_chain(self.source, depth)
+        self.cached_chain = make_chain(self.source, depth, cached=True)
+        self.cached_chain.extract_data()
+
+    def time_extract_cold(self, depth, n_rows):
+        self.chain.extract_data()
+
+    def time_extract_cached_hit(self, depth, n_rows):
+        self.cached_chain.extract_data()
+
+    def time_drop_cache_and_extract(self, depth, n_rows):
+        self.source.drop_cache()
+        self.cached_chain.extract_data()
+
+    def peakmem_extract_cold(self, depth, n_rows):
+        self.chain.extract_data()
+
+
+class FanInSuite:
+    """Extraction from a DataProcessor with many inputs."""
+    params = ([10, 100, 1_000],)
+    param_names = ['width']
+
+    def setup(self, width):
+        self.node = make_fan_in(1_000, width)
+        self.cached_node = make_fan_in(1_000, width, cached=True)
+        self.cached_node.extract_data()
+
+    def time_extract_cold(self, width):
+        self.node.extract_data()
+
+    def time_extract_cached_hit(self, width):
+        self.cached_node.extract_data()
+
+    def time_executor(self, width):
+        GraphExecutor(self.node, max_workers=4).extract_data()
+
+
+class DiamondSuite:
+    """Extraction from stacked diamonds, where every Node has several consumers."""
+    params = ([4, 8],)
+    param_names = ['layers']
+
+    def setup(self, layers):
+        self.source = DataFrameAdapter(make_frame(10_000))
+        self.node = make_diamond(self.source, layers)
+        self.cached_node = make_diamond(self.source, layers, cached=True)
+
+    def time_extract_in_evaluation_scope(self, layers):
+        with evaluation_scope():
+            self.node.extract_data()
+
+    def time_drop_cache_and_extract(self, layers):
+        # Dropping the cache of the source drops the caches of the whole stack.
+        self.source.drop_cache()
+        self.cached_node.extract_data()
+
+    def time_executor(self, layers):
+        GraphExecutor(self.node).extract_data()
+
+
+class ConstructionSuite:
+    """Building and tearing down large graphs."""
+    params = ([1_000, 5_000],)
+    param_names = ['n_nodes']
+
+    def setup(self, n_nodes):
+        self.source = DataFrameAdapter(make_frame(10))
+        self.wide_node = Combine()
+        self.wide_node.connect_input_nodes(*(DataFrameAdapter(make_frame(10)) for _ in range(n_nodes)))
+
+    def time_build_chain(self, n_nodes):
+        make_chain(self.source, n_nodes)
+
+    def time_connect_input_nodes(self, n_nodes):
+        processor = Combine()
+        processor.connect_input_nodes(*(Combine() for _ in range(n_nodes)))
+
+    def time_connect_input_node_one_by_one(self, n_nodes):
+        processor = Combine()
+        for _ in range(n_nodes):
+            processor.connect_input_node(Combine())
+
+    def time_drop_cache_wide(self, n_nodes):
+        for connection in self.wide_node.positional_input_nodes:
+            connection.node.drop_cache()
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+import warnings
+from contextlib import closing, ExitStack
+
+import pandera as pa
+
+from pandakeeper.dataloader import CsvLoader, PickleLoader
+from pandakeeper.dataloader.sql import SqlLoader
+
+from .common import make_frame
+
+warnings.simplefilter('ignore', RuntimeWarning)
+
+
+def connect_sqlite(stack: ExitStack, path: str) -> sqlite3.Connection:
+    """
+    Context creator of SqlLoader that connects to an SQLite database.
+
+    Args:
+        stack:  ExitStack that closes the connection.
+        path:   path of the database.
+    Returns:
+        Connection.
+    """
+    return stack.enter_context(closing(sqlite3.connect(path)))
+
+
+def connect_sqlite_shared(stack: ExitStack, path: str) -> sqlite3.Connection:
+    """
+    Context creator of pooled SqlLoaders that connects to an SQLite database from any thread.
+
+    Args:
+        stack:  ExitStack that closes the connection.
+        path:   path of the database.
+    Returns:
+        Connection.
+    """
+    return stack.enter_context(closing(sqlite3.connect(path, check_same_thread=False)))
+
+
+class LoaderSuite:
+    """Loading CSV, pickle and SQLite sources of several sizes."""
+    params = ([1_000, 100_000, 1_000_000],)
+    param_names = ['n_rows']
+
+    def setup_cache(self):
+        # asv runs 'setup_cache' in a temporary directory that it removes after the benchmarks.
+        directory = os.path.abspath('.')
+        for n_rows in self.params[0]:
+            frame = make_frame(n_rows)
+            frame.to_csv(os.path.join(directory, f'{n_rows}.csv'), index=False)
+            frame.to_pickle(os.path.join(directory, f'{n_rows}.pkl'))
+            with closing(sqlite3.connect(os.path.join(directory, f'{n_rows}.sqlite'))) as connection:
+                frame.to_sql('data', connection, index=False)
+        return directory
+
+    def setup(self, directory, n_rows):
+        self.csv_loader = CsvLoader(os.path.join(directory, f'{n_rows}.csv'))
+        self.pickle_loader = PickleLoader(os.path.join(directory, f'{n_rows}.pkl'))
+        self.sql_loader = SqlLoader(
+            connect_sqlite,
+            'SELECT * FROM data',
+            context_creator_args=(os.path.join(directory, f'{n_rows}.sqlite'),),
+            output_validator=pa.DataFrameSchema()
+        )
+
+    def time_csv(self, directory, n_rows):
+        self.csv_loader.extract_data()
+
+    def time_pickle(self, directory, n_rows):
+        self.pickle_loader.extract_data()
+
+    def time_sqlite(self, directory, n_rows):
+        self.sql_loader.extract_data()
+
+    def peakmem_csv(self, directory, n_rows):
+        self.csv_loader.extract_data()
+
+
+class PooledSqlSuite:
+    """Latency of small SQLite queries with and without pooled DB-connections."""
+
+    def setup_cache(self):
+        directory = os.path.abspath('.')
+        with closing(sqlite3.connect(os.path.join(directory, 'small.sqlite'))) as connection:
+            make_frame(100).to_sql('data', connection, index=False)
+        return directory
+
+    def setup(self, directory):
+        path = os.path.join(directory, 'small.sqlite')
+        self.loader = SqlLoader(
+            connect_sqlite_shared,
+            'SELECT * FROM data LIMIT 10',
+            context_creator_args=(path,),
+            output_validator=pa.DataFrameSchema()
+        )
+        self.pooled_loader = SqlLoader(
+            connect_sqlite_shared,
+            'SELECT * FROM data LIMIT 10',
+            context_creator_args=(path,),
+            pooled=True,
+            output_validator=pa.DataFrameSchema()
+        )
+        # The first query of the pooled loader opens the DB-connection that later queries reuse.
+        self.pooled_loader.extract_data()
+
+    def time_unpooled(self, directory):
+        self.loader.extract_data()
+
+    def time_pooled(self, directory):
+        self.pooled_loader.extract_data()
@@ -0,0 +1,80 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandakeeper import ValidationPolicy, validation_scope
+from pandakeeper.dataloader import DataFrameAdapter
+from pandakeeper.dataprocessor import NodeConnection
+from pandakeeper.validators import AnyDataFrame
+
+from .common import Combine
+
+warnings.simplefilter('ignore', RuntimeWarning)
+
+REALISTIC_SCHEMA = pa.DataFrameSchema(
+    {
+        'id': pa.Column(int, pa.Check.ge(0), nullable=False, unique=True),
+        'price': pa.Column(float, pa.Check.in_range(0, 1_000)),
+        'quantity': pa.Column(int, pa.Check.gt(0)),
+        'side': pa.Column(str, pa.Check.isin(['buy', 'sell'])),
+        'timestamp': pa.Column('datetime64[ns]', nullable=False),
+    },
+    strict=True
+)
+
+
+def make_trades(n_rows: int) -> pd.DataFrame:
+    """
+    Creates DataFrame that satisfies REALISTIC_SCHEMA.
+
+    Args:
+        n_rows:  number of rows.
+    Returns:
+        DataFrame.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'id': np.arange(n_rows),
+        'price': rng.random(n_rows) * 1_000,
+        'quantity': rng.integers(1, 100, n_rows),
+        'side': np.where(rng.random(n_rows) < 0.5, 'buy', 'sell'),
+        'timestamp': pd.date_range('2020-01-01', periods=n_rows, freq='s'),
+    })
+
+
+class ValidatorSuite:
+    """Cost of output and input validation with AnyDataFrame and with a realistic schema."""
+    params = (['any', 'realistic'], [10_000, 1_000_000])
+    param_names = ['schema', 'n_rows']
+
+    def setup(self, schema, n_rows):
+        validator = AnyDataFrame if schema == 'any' else REALISTIC_SCHEMA
+        self.frame = make_trades(n_rows)
+        self.loader = DataFrameAdapter(self.frame, output_validator=validator)
+        self.processor = Combine()
+        self.processor.connect_input_node(NodeConnection(self.loader, validator))
+
+    def time_output_validation(self, schema, n_rows):
+        self.loader.extract_data()
+
+    def time_input_and_output_validation(self, schema, n_rows):
+        self.processor.extract_data()
+
+    def time_pandera_validate(self, schema, n_rows):
+        (AnyDataFrame if schema == 'any' else REALISTIC_SCHEMA).validate(self.frame)
+
+
+class ValidationPolicySuite:
+    """Cost of validating a realistic schema under different ValidationPolicies."""
+    params = (['full', 'head:1000', 'sample:1000', 'schema_only', 'off'],)
+    param_names = ['policy']
+
+    def setup(self, policy):
+        self.policy = ValidationPolicy.parse(policy)
+        self.loader = DataFrameAdapter(make_trades(1_000_000), output_validator=REALISTIC_SCHEMA)
+
+    def time_extract(self, policy):
+        with validation_scope(self.policy):
+            self.loader.extract_data()
@@ -1 +1,5 @@
 __version__ = "0.0.29"
+
+from pandakeeper.node import evaluation_scope, streaming_scope
+from pandakeeper.profiling import Profiler, profiling_scope
+from pandakeeper.validation import ValidationPolicy, validation_scope
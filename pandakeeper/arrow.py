@@ -0,0 +1,121 @@
+import os
+from os import PathLike
+from threading import get_ident
+from typing import Union, Any
+
+import pandas as pd
+
+__all__ = (
+    'write_feather',
+    'read_feather',
+    'write_parquet',
+    'read_parquet'
+)
+
+
+def _import_pyarrow() -> Any:
+    """
+    Imports optional 'pyarrow' dependency.
+
+    Returns:
+        pyarrow module.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow-based storage requires 'pyarrow'. Install it with 'pip install pandakeeper[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _temporary_path(path: Union[str, PathLike]) -> str:
+    """
+    Returns path of the temporary file to write before moving it to the destination.
+
+    Args:
+        path:  destination path.
+    Returns:
+        Temporary path unique for the current process and thread.
+    """
+    return f'{os.fspath(path)}.{os.getpid()}-{get_ident()}.tmp'
+
+
+def _replace_atomically(tmp_path: str, path: Union[str, PathLike]) -> None:
+    """
+    Moves written temporary file to its destination, so that readers never see partially written files.
+
+    Args:
+        tmp_path:  path to the written temporary file.
+        path:      destination path.
+    """
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def write_feather(df: pd.DataFrame, path: Union[str, PathLike]) -> None:
+    """
+    Writes DataFrame to the uncompressed Feather (Arrow IPC) file, so that it can be read without copying.
+
+    Args:
+        df:    DataFrame to write.
+        path:  destination path.
+    """
+    pa = _import_pyarrow()
+    from pyarrow import feather
+
+    tmp_path = _temporary_path(path)
+    feather.write_feather(pa.Table.from_pandas(df), tmp_path, compression='uncompressed')
+    _replace_atomically(tmp_path, path)
+
+
+def read_feather(path: Union[str, PathLike], memory_map: bool = True) -> pd.DataFrame:
+    """
+    Reads DataFrame from the Feather (Arrow IPC) file.
+
+    Args:
+        path:        path to read from.
+        memory_map:  whether to memory-map the file. Columns of the resulting DataFrame
+                     may then be read-only views of the mapped file.
+    Returns:
+        Loaded DataFrame.
+    """
+    _import_pyarrow()
+    from pyarrow import feather
+
+    return feather.read_table(path, memory_map=memory_map).to_pandas(split_blocks=True)
+
+
+def write_parquet(df: pd.DataFrame, path: Union[str, PathLike]) -> None:
+    """
+    Writes DataFrame to the Parquet file.
+
+    Args:
+        df:    DataFrame to write.
+        path:  destination path.
+    """
+    pa = _import_pyarrow()
+    from pyarrow import parquet
+
+    tmp_path = _temporary_path(path)
+    parquet.write_table(pa.Table.from_pandas(df), tmp_path)
+    _replace_atomically(tmp_path, path)
+
+
+def read_parquet(path: Union[str, PathLike], memory_map: bool = True) -> pd.DataFrame:
+    """
+    Reads DataFrame from the Parquet file.
+
+    Args:
+        path:        path to read from.
+        memory_map:  whether to memory-map the file instead of reading it through buffered I/O.
+    Returns:
+        Loaded DataFrame.
+    """
+    _import_pyarrow()
+    from pyarrow import parquet
+
+    return parquet.read_table(path, memory_map=memory_map).to_pandas(split_blocks=True)
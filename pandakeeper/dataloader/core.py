@@ -1,17 +1,29 @@
+import os
+from abc import abstractmethod
 from collections.abc import Callable as _Callable
+from functools import partial
+from hashlib import sha256
+from io import BytesIO
+from os import PathLike
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Lock
 from types import MappingProxyType
-from typing import Any, Optional, Mapping, Callable, Tuple
+from typing import Any, Optional, Mapping, Callable, Tuple, Iterator, Union, Dict, Hashable, Iterable
 from warnings import warn
 
 import pandera as pa
-from pandas import DataFrame, read_pickle, read_excel, read_csv
+from pandas import DataFrame, RangeIndex, read_pickle, read_excel, read_csv
 from typing_extensions import final
 from varutils.plugs.functional import pass_through_one
 from varutils.typing import check_type_compatibility
 
-from pandakeeper.node import Node
+from pandakeeper.arrow import _import_pyarrow, write_feather, read_feather, write_parquet, read_parquet
+from pandakeeper.fingerprint import make_fingerprint
+from pandakeeper.node import Node, _iter_slices, _run_in_executor
+from pandakeeper.protection import protect_frame, frame_view
 from pandakeeper.typing import PD_READ_PICKLE_ANNOTATION
-from pandakeeper.validators import AnyDataFrame
+from pandakeeper.validators import AnyDataFrame, schema_read_options
 
 __all__ = (
     'DataLoader',
@@ -19,16 +31,42 @@ __all__ = (
     'DataFrameAdapter',
     'PickleLoader',
     'ExcelLoader',
-    'CsvLoader'
+    'CsvLoader',
+    'FileCachedLoader',
+    'CachedPickleLoader',
+    'CachedExcelLoader',
+    'CachedCsvLoader'
 )
 
 
+def _select_columns(df: DataFrame, columns: Tuple[Hashable, ...]) -> DataFrame:
+    """
+    Selects the given columns of the DataFrame, keeping their order in the DataFrame. Absent columns are skipped.
+
+    Args:
+        df:       DataFrame to select columns from.
+        columns:  columns to select.
+    Returns:
+        DataFrame with selected columns.
+    """
+    selected = set(columns)
+    return df[[column for column in df.columns if column in selected]]
+
+
 class DataLoader(Node):
     """
     Abstract class that defines an interface common to all data loaders,
     i.e. Nodes that can only generate data but not receive from other Nodes.
     """
-    __slots__ = ('__loader', '__loader_args', '__loader_kwargs')
+    __slots__ = (
+        '__loader',
+        '__loader_args',
+        '__loader_kwargs',
+        '__projection',
+        '__tracks_delta',
+        '__delta_baseline',
+        '__delta_rows'
+    )
 
     def __init__(self,
                  loader: Callable[..., DataFrame],
@@ -48,6 +86,10 @@ class DataLoader(Node):
         self.__loader = loader
         self.__loader_args = loader_args
         self.__loader_kwargs = loader_kwargs
+        self.__projection: Optional[Tuple[Hashable, ...]] = None
+        self.__tracks_delta = False
+        self.__delta_baseline: Any = None
+        self.__delta_rows = 0
 
     @final
     def _load_default(self) -> DataFrame:
@@ -59,6 +101,197 @@ class DataLoader(Node):
         """
         return self.__loader(*self.__loader_args, **self.__loader_kwargs)
 
+    async def _aload_default(self) -> DataFrame:
+        """
+        Asynchronous counterpart of the '_load_default' method.
+        Runs '_load_default' in the default executor by default.
+        Should be overridden by DataLoaders whose loader function can be awaited.
+
+        Returns:
+            Resulting DataFrame.
+        """
+        return await _run_in_executor(self._load_default)
+
+    def _load_default_chunks(self, chunksize: int) -> Iterator[DataFrame]:
+        """
+        Returns the result of the loader function chunk by chunk. Splits the output of '_load_default' by default.
+        Should be overridden by DataLoaders whose loader function can read data in chunks.
+
+        Args:
+            chunksize:  number of rows per chunk.
+        Returns:
+            Iterator of chunks.
+        """
+        return _iter_slices(self._load_default(), chunksize)
+
+    def _load_projected(self, columns: Tuple[Hashable, ...]) -> DataFrame:
+        """
+        Returns the given columns of the result of the loader function. Used instead of '_load_default'
+        when the projection is set. Selects the columns from the output of '_load_default' by default.
+        Should be overridden by DataLoaders whose loader function can read only the given columns.
+
+        Args:
+            columns:  columns to load. Absent columns are skipped.
+        Returns:
+            Resulting DataFrame.
+        """
+        return _select_columns(self._load_default(), columns)
+
+    def _load_projected_chunks(self, columns: Tuple[Hashable, ...], chunksize: int) -> Iterator[DataFrame]:
+        """
+        Chunked counterpart of the '_load_projected' method.
+        Selects the columns from the chunks returned by '_load_default_chunks' by default.
+
+        Args:
+            columns:    columns to load. Absent columns are skipped.
+            chunksize:  number of rows per chunk.
+        Returns:
+            Iterator of chunks.
+        """
+        for chunk in self._load_default_chunks(chunksize):
+            yield _select_columns(chunk, columns)
+
+    async def _aload_projected(self, columns: Tuple[Hashable, ...]) -> DataFrame:
+        """
+        Asynchronous counterpart of the '_load_projected' method.
+        Runs '_load_projected' in the default executor by default.
+
+        Args:
+            columns:  columns to load. Absent columns are skipped.
+        Returns:
+            Resulting DataFrame.
+        """
+        return await _run_in_executor(self._load_projected, columns)
+
+    @final
+    @property
+    def projection(self) -> Optional[Tuple[Hashable, ...]]:
+        """Columns the DataLoader loads or None if it loads all columns. See 'push_down_projections'."""
+        return self.__projection
+
+    @final
+    def _set_projection(self, columns: Optional[Iterable[Hashable]]) -> None:
+        """
+        Restricts the loaded data to the given columns. Evicts the cache if the set of columns changes.
+        Caches of child Nodes stay valid, since the columns they use are loaded either way.
+
+        Args:
+            columns:  columns to load or None to load all columns.
+        """
+        if columns is not None:
+            columns = tuple(columns)
+        old_columns = self.__projection
+        old_column_set = None if old_columns is None else frozenset(old_columns)
+        if old_column_set != (None if columns is None else frozenset(columns)):
+            self._evict_cache()
+        self.__projection = columns
+
+    @final
+    def _enable_delta_tracking(self) -> None:
+        """
+        Makes the DataLoader remember the state of the data source at every full load,
+        so that the rows appended since then can be loaded as a delta (see 'refresh_incrementally').
+        Should be called by the constructors of DataLoaders that implement '_load_default_delta'.
+        """
+        self.__tracks_delta = True
+
+    @property
+    def supports_delta(self) -> bool:
+        return self.__tracks_delta
+
+    def _get_delta_baseline(self) -> Any:
+        """
+        Returns the state of the data source right before a full load, from which the next delta is loaded.
+        None by default.
+
+        Returns:
+            State of the data source.
+        """
+        return None
+
+    def _update_delta_baseline(self, baseline: Any, data: DataFrame) -> Any:
+        """
+        Updates the state of the data source with the fully loaded data. Returns the state unchanged by default.
+
+        Args:
+            baseline:  the output of the '_get_delta_baseline' method.
+            data:      fully loaded data.
+        Returns:
+            State of the data source or None if no delta can be loaded from it.
+        """
+        return baseline
+
+    def _load_default_delta(self, baseline: Any) -> Optional[Tuple[DataFrame, Any]]:
+        """
+        Loads the rows appended to the data source since the given state.
+        Should be overridden by DataLoaders that call '_enable_delta_tracking'.
+
+        Args:
+            baseline:  state of the data source after the previous load.
+        Returns:
+            (delta, new state) or None if the delta cannot be loaded.
+        """
+        return None
+
+    @final
+    def _track_delta_baseline(self, load: Callable[[], DataFrame]) -> DataFrame:
+        """
+        Runs a full load, remembering the state of the data source if the DataLoader tracks deltas.
+
+        Args:
+            load:  function that loads the data.
+        Returns:
+            Loaded data.
+        """
+        if not self.__tracks_delta:
+            return load()
+        self.__delta_baseline = None
+        baseline = self._get_delta_baseline()
+        data = load()
+        self.__delta_baseline = self._update_delta_baseline(baseline, data)
+        self.__delta_rows = len(data)
+        return data
+
+    def _before_load(self) -> None:
+        """
+        Called right before the data source is read by the 'extract_data' method or its chunked, asynchronous
+        and incremental counterparts, so that the state of the source is recorded before reading it.
+        Does nothing by default.
+        """
+
+    @final
+    def _reset_delta_baseline(self) -> None:
+        """Forgets the state of the data source, so that the next delta cannot be loaded."""
+        self.__delta_baseline = None
+
+    @final
+    def _load_delta(self, deltas: Mapping[Node, DataFrame]) -> Optional[DataFrame]:
+        baseline = self.__delta_baseline
+        if not self.__tracks_delta or baseline is None:
+            return None
+        self.__delta_baseline = None
+        self._before_load()
+        result = self._load_default_delta(baseline)
+        if result is None:
+            return None
+        delta, self.__delta_baseline = result
+        index = delta.index
+        if isinstance(index, RangeIndex) and index.start == 0 and index.step == 1:
+            # The delta continues the default index of the fully loaded data.
+            delta.index = RangeIndex(self.__delta_rows, self.__delta_rows + len(delta))
+        self.__delta_rows += len(delta)
+        projection = self.__projection
+        return delta if projection is None else _select_columns(delta, projection)
+
+    def _fingerprint_parts(self) -> Optional[Tuple[Any, ...]]:
+        parts = super()._fingerprint_parts()
+        if parts is None:
+            return None
+        projection = self.__projection
+        if projection is not None:
+            projection = sorted(map(repr, projection))
+        return parts + (self.__loader, self.__loader_args, self.__loader_kwargs, projection)
+
     @final
     @property
     def _loader(self) -> Callable[..., DataFrame]:
@@ -94,7 +327,30 @@ class StaticDataLoader(DataLoader):
 
     @final
     def _load_non_cached(self) -> DataFrame:
-        return self._load_default()
+        self._before_load()
+        projection = self.projection
+        if projection is None:
+            return self._track_delta_baseline(self._load_default)
+        return self._track_delta_baseline(partial(self._load_projected, projection))
+
+    @final
+    def _load_non_cached_chunks(self, chunksize: int) -> Iterator[DataFrame]:
+        # The state of the data source is not tracked while it is read in chunks.
+        self._reset_delta_baseline()
+        self._before_load()
+        projection = self.projection
+        if projection is None:
+            return self._load_default_chunks(chunksize)
+        return self._load_projected_chunks(projection, chunksize)
+
+    @final
+    async def _aload_non_cached(self) -> DataFrame:
+        self._reset_delta_baseline()
+        self._before_load()
+        projection = self.projection
+        if projection is None:
+            return await self._aload_default()
+        return await self._aload_projected(projection)
 
     def _clear_cache_storage(self) -> None:
         warn("'_clear_cache_storage' does nothing for StaticDataLoader instances", RuntimeWarning)
@@ -110,13 +366,14 @@ class StaticDataLoader(DataLoader):
 
 class DataFrameAdapter(StaticDataLoader):
     """DataLoader adapter for existing DataFrames."""
-    __slots__ = ('__copy',)
+    __slots__ = ('__copy', '__protect_output')
 
     def __init__(self,
                  df: DataFrame,
                  *,
                  output_validator: pa.DataFrameSchema = AnyDataFrame,
-                 copy: bool = False) -> None:
+                 copy: bool = False,
+                 protect_output: bool = False) -> None:
         """
         DataLoader adapter for existing DataFrames.
 
@@ -124,20 +381,34 @@ class DataFrameAdapter(StaticDataLoader):
             df:                input DataFrame.
             output_validator:  output validator.
             copy:              whether to copy input DataFrame.
+            protect_output:    whether consumers get views of the input DataFrame that cannot modify it
+                               instead of the DataFrame itself. Under pandas Copy-on-Write, unlike 'copy',
+                               the data is not copied upfront. See 'protect_frame'.
         """
         check_type_compatibility(df, DataFrame)
         check_type_compatibility(copy, bool)
+        check_type_compatibility(protect_output, bool)
         if copy:
             df = df.copy()
-        super().__init__(pass_through_one, df)
+        if protect_output:
+            super().__init__(frame_view, protect_frame(df))
+        else:
+            super().__init__(pass_through_one, df)
         self.set_output_validator(output_validator)
         self.__copy = copy
+        self.__protect_output = protect_output
 
     @final
     @property
     def copy(self) -> bool:
         return self.__copy
 
+    @final
+    @property
+    def protect_output(self) -> bool:
+        """Whether consumers get views of the input DataFrame that cannot modify it."""
+        return self.__protect_output
+
     @final
     @property
     def dataframe(self) -> DataFrame:
@@ -175,25 +446,197 @@ class PickleLoader(StaticDataLoader):
         return self._loader_args[1]
 
 
+class _ExcelSidecarReader:
+    """
+    Replacement for pandas.read_excel that stores parsed sheets in columnar sidecar files.
+    Sidecar files are keyed by the content hash of the workbook together with the pandas.read_excel arguments,
+    so that they are reused by all processes while the workbook stays unchanged.
+    """
+    __slots__ = ('__sidecar_format', '__sidecar_dir', '__lock', '__content_digests')
+    __writers: Dict[str, Callable[[DataFrame, Union[str, PathLike]], None]] = {
+        'feather': write_feather,
+        'parquet': write_parquet
+    }
+    __readers: Dict[str, Callable[[Union[str, PathLike]], DataFrame]] = {
+        'feather': read_feather,
+        'parquet': read_parquet
+    }
+
+    def __init__(self, sidecar_format: str, sidecar_dir: Path) -> None:
+        """
+        Replacement for pandas.read_excel that stores parsed sheets in columnar sidecar files.
+
+        Args:
+            sidecar_format:  'feather' or 'parquet'.
+            sidecar_dir:     directory to store sidecar files in.
+        """
+        self.__sidecar_format = sidecar_format
+        self.__sidecar_dir = sidecar_dir
+        self.__lock = Lock()
+        self.__content_digests: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.__sidecar_format!r}, {os.fspath(self.__sidecar_dir)!r})'
+
+    @property
+    def sidecar_format(self) -> str:
+        """Format of sidecar files."""
+        return self.__sidecar_format
+
+    @property
+    def sidecar_dir(self) -> Path:
+        """Directory to store sidecar files in."""
+        return self.__sidecar_dir
+
+    def __get_content_digest(self, path: str) -> str:
+        """
+        Returns the content hash of the workbook. Hashes are reused while the file stat stays unchanged.
+
+        Args:
+            path:  absolute path to the workbook.
+        Returns:
+            Hexadecimal SHA-256 digest.
+        """
+        stat = os.stat(path)
+        file_stat = stat.st_mtime_ns, stat.st_size, stat.st_ino
+        with self.__lock:
+            known = self.__content_digests.get(path)
+        if known is not None and known[0] == file_stat:
+            return known[1]
+        content_hash = sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                content_hash.update(block)
+        digest = content_hash.hexdigest()
+        with self.__lock:
+            self.__content_digests[path] = file_stat, digest
+        return digest
+
+    def __get_sidecar_path(self, io: Any, args: Tuple[Any, ...], kwargs: Mapping[str, Any]) -> Optional[Path]:
+        """
+        Returns path to the sidecar file for the given pandas.read_excel arguments.
+
+        Args:
+            io:      pandas.read_excel first argument.
+            args:    pandas.read_excel positional arguments.
+            kwargs:  pandas.read_excel keyword arguments.
+        Returns:
+            Path to the sidecar file or None if the workbook is not a file or the arguments cannot be fingerprinted.
+        """
+        if not isinstance(io, (str, PathLike)):
+            return None
+        path = os.path.abspath(io)
+        if not os.path.isfile(path):
+            return None
+        arguments_fingerprint = make_fingerprint(args, dict(kwargs))
+        if arguments_fingerprint is None:
+            return None
+        arguments_key = sha256(f'{path}:{arguments_fingerprint}'.encode()).hexdigest()[:16]
+        content_key = self.__get_content_digest(path)[:16]
+        return self.__sidecar_dir / f'{os.path.basename(path)}-{arguments_key}-{content_key}.{self.__sidecar_format}'
+
+    def __remove_outdated_sidecars(self, sidecar_path: Path) -> None:
+        """
+        Removes sidecar files written with the same arguments for previous versions of the workbook.
+
+        Args:
+            sidecar_path:  path to the actual sidecar file.
+        """
+        name = sidecar_path.name
+        prefix = name[:name.rindex('-') + 1]
+        suffix = sidecar_path.suffix
+        try:
+            entries = tuple(os.scandir(self.__sidecar_dir))
+        except OSError:
+            return
+        for entry in entries:
+            entry_name = entry.name
+            if (
+                    entry_name != name
+                    and entry_name.startswith(prefix)
+                    and entry_name.endswith(suffix)
+                    and len(entry_name) == len(name)
+            ):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def __call__(self, io: Any, *args: Any, **kwargs: Any) -> DataFrame:
+        """
+        Reads the workbook from the sidecar file if it exists, otherwise parses it and writes the sidecar file.
+        Results that are not DataFrames (e.g. several sheets read at once) are not stored.
+
+        Args:
+            io:        pandas.read_excel first argument.
+            *args:     pandas.read_excel positional arguments.
+            **kwargs:  pandas.read_excel keyword arguments.
+        Returns:
+            Loaded DataFrame.
+        """
+        sidecar_path = self.__get_sidecar_path(io, args, kwargs)
+        if sidecar_path is None:
+            return read_excel(io, *args, **kwargs)
+        try:
+            return self.__readers[self.__sidecar_format](sidecar_path)
+        except FileNotFoundError:
+            pass
+        df = read_excel(io, *args, **kwargs)
+        if isinstance(df, DataFrame):
+            try:
+                self.__writers[self.__sidecar_format](df, sidecar_path)
+            except Exception as e:
+                warn(f"Cannot write sidecar file for {io!r}: {e}", RuntimeWarning)
+            else:
+                self.__remove_outdated_sidecars(sidecar_path)
+        return df
+
+
 class ExcelLoader(StaticDataLoader):
-    """DataLoader that loads Excel files."""
+    """
+    DataLoader that loads Excel files.
+    Parsed sheets can be stored in Feather or Parquet sidecar files that are reused while the workbook is unchanged.
+    """
     __slots__ = ()
 
     def __init__(self,
                  io,
                  *loader_args: Any,
                  output_validator: pa.DataFrameSchema = AnyDataFrame,
+                 sidecar_format: Optional[str] = None,
+                 sidecar_dir: Optional[Union[str, PathLike]] = None,
                  **loader_kwargs: Any) -> None:
         """
         DataLoader that loads Excel files.
+        Parsed sheets can be stored in Feather or Parquet sidecar files that are reused while the workbook is unchanged.
 
         Args:
             io:                pandas.read_excel first argument.
             *loader_args:      pandas.read_excel positional arguments.
             output_validator:  output validator.
+            sidecar_format:    'feather' or 'parquet' to store parsed sheets in sidecar files,
+                               keyed by the workbook content and pandas.read_excel arguments. None disables sidecars.
+            sidecar_dir:       directory to store sidecar files in.
+                               Defaults to the 'pandakeeper' subdirectory of the system temporary directory.
             **loader_kwargs:   pandas.read_excel keyword arguments.
         """
-        super().__init__(read_excel, io, *loader_args, **loader_kwargs)
+        if sidecar_format is None:
+            if sidecar_dir is not None:
+                raise ValueError("'sidecar_dir' requires 'sidecar_format' to be set")
+            loader: Callable[..., DataFrame] = read_excel
+        else:
+            check_type_compatibility(sidecar_format, str)
+            if sidecar_format not in ('feather', 'parquet'):
+                raise ValueError(f"'sidecar_format' should be 'feather' or 'parquet'. Got: {sidecar_format!r}")
+            _import_pyarrow()
+            if sidecar_dir is None:
+                sidecar_dir = Path(gettempdir()) / 'pandakeeper'
+            else:
+                check_type_compatibility(sidecar_dir, (str, PathLike), 'str or PathLike')
+                sidecar_dir = Path(sidecar_dir)
+            sidecar_dir.mkdir(parents=True, exist_ok=True)
+            loader = _ExcelSidecarReader(sidecar_format, sidecar_dir)
+        super().__init__(loader, io, *loader_args, **loader_kwargs)
         self.set_output_validator(output_validator)
 
     @final
@@ -201,29 +644,325 @@ class ExcelLoader(StaticDataLoader):
     def io(self):
         return self._loader_args[0]
 
+    @final
+    @property
+    def sidecar_format(self) -> Optional[str]:
+        """'feather' or 'parquet' if parsed sheets are stored in sidecar files, otherwise None."""
+        loader = self._loader
+        return loader.sidecar_format if isinstance(loader, _ExcelSidecarReader) else None
+
+    @final
+    @property
+    def sidecar_dir(self) -> Optional[Path]:
+        """Directory to store sidecar files in or None if sidecar files are disabled."""
+        loader = self._loader
+        return loader.sidecar_dir if isinstance(loader, _ExcelSidecarReader) else None
+
+
+def _is_pyarrow_available() -> bool:
+    """
+    Checks whether optional 'pyarrow' dependency can be imported.
+
+    Returns:
+        Result of checking.
+    """
+    try:
+        _import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
 
 class CsvLoader(StaticDataLoader):
     """DataLoader that loads csv-files."""
     __slots__ = ()
+    __pyarrow_engine_options = frozenset((
+        'sep',
+        'delimiter',
+        'header',
+        'names',
+        'index_col',
+        'usecols',
+        'dtype',
+        'parse_dates',
+        'true_values',
+        'false_values',
+        'na_values',
+        'keep_default_na',
+        'skip_blank_lines',
+        'quotechar',
+        'encoding',
+        'dtype_backend'
+    ))
+
+    __incremental_disallowed_options = frozenset((
+        'header',
+        'names',
+        'index_col',
+        'skiprows',
+        'skipfooter',
+        'nrows',
+        'compression',
+        'iterator',
+        'chunksize'
+    ))
+    __compressed_suffixes = ('.gz', '.bz2', '.zip', '.xz', '.zst', '.tar')
 
     def __init__(self,
                  filepath_or_buffer,
                  *loader_args: Any,
                  output_validator: pa.DataFrameSchema = AnyDataFrame,
+                 derive_read_options: bool = False,
+                 incremental: bool = False,
                  **loader_kwargs: Any) -> None:
         """
         DataLoader that loads csv-files.
 
         Args:
-            filepath_or_buffer:  pandas.read_csv first argument.
-            *loader_args:        pandas.read_csv positional arguments.
-            output_validator:    output validator.
-            **loader_kwargs:     pandas.read_csv keyword arguments.
+            filepath_or_buffer:   pandas.read_csv first argument.
+            *loader_args:         pandas.read_csv positional arguments.
+            output_validator:     output validator.
+            derive_read_options:  whether to derive 'dtype', 'parse_dates' and 'usecols' from the output validator
+                                  (see 'schema_read_options'), so that parsed columns already have their final dtypes.
+                                  The pyarrow engine is also used if it is installed and supports the given arguments.
+                                  Explicitly passed pandas.read_csv keyword arguments take precedence.
+            incremental:          whether the csv-file is append-only, so that only the lines appended since
+                                  the last load are parsed by 'refresh_incrementally'. Requires a path to
+                                  an uncompressed file with a header line and the default index.
+            **loader_kwargs:      pandas.read_csv keyword arguments.
         """
+        check_type_compatibility(derive_read_options, bool)
+        check_type_compatibility(incremental, bool)
+        if incremental:
+            check_type_compatibility(filepath_or_buffer, (str, PathLike), 'str or PathLike')
+            if loader_args:
+                raise ValueError("Incremental CsvLoader does not accept positional pandas.read_csv arguments")
+            disallowed = self.__incremental_disallowed_options.intersection(loader_kwargs)
+            if disallowed:
+                raise ValueError(f"Incremental CsvLoader does not accept the arguments: {sorted(disallowed)}")
+            if os.fspath(filepath_or_buffer).lower().endswith(self.__compressed_suffixes):
+                raise ValueError("Incremental CsvLoader cannot load compressed csv-files")
+        if derive_read_options:
+            loader_kwargs = {**schema_read_options(output_validator), **loader_kwargs}
+            if (
+                    'engine' not in loader_kwargs
+                    and not loader_args
+                    and self.__pyarrow_engine_options.issuperset(loader_kwargs)
+                    and not callable(loader_kwargs.get('usecols'))
+                    and _is_pyarrow_available()
+            ):
+                loader_kwargs['engine'] = 'pyarrow'
         super().__init__(read_csv, filepath_or_buffer, *loader_args, **loader_kwargs)
         self.set_output_validator(output_validator)
+        if incremental:
+            self._enable_delta_tracking()
+
+    @property
+    def chunk_safe(self) -> bool:
+        return True
+
+    def _get_delta_baseline(self) -> Optional[Tuple[int, int]]:
+        # The size is taken before reading, so the file should not be appended to while it is loaded.
+        try:
+            stat = os.stat(self.filepath_or_buffer)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size
+
+    def _load_default_delta(self, baseline: Tuple[int, int]) -> Optional[Tuple[DataFrame, Tuple[int, int]]]:
+        inode, offset = baseline
+        try:
+            with open(self.filepath_or_buffer, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != inode or not 0 < offset <= stat.st_size:
+                    return None  # The file is replaced or truncated.
+                header = f.readline()
+                if f.tell() > offset:
+                    return None
+                f.seek(offset - 1)
+                if f.read(1) != b'\n':
+                    return None  # The last line read before is incomplete.
+                appended = f.read(stat.st_size - offset)
+        except FileNotFoundError:
+            return None
+        # The incomplete last line is left for the next delta.
+        appended = appended[:appended.rfind(b'\n') + 1]
+        delta = self._loader(BytesIO(header + appended), **self._loader_kwargs)
+        return delta, (inode, offset + len(appended))
+
+    def _load_default_chunks(self, chunksize: int) -> Iterator[DataFrame]:
+        loader_kwargs = self._loader_kwargs
+        if loader_kwargs.get('engine') == 'pyarrow':
+            # The pyarrow engine cannot read csv-files in chunks.
+            loader_kwargs = {key: value for key, value in loader_kwargs.items() if key != 'engine'}
+        reader = self._loader(*self._loader_args, chunksize=chunksize, **loader_kwargs)
+        try:
+            yield from reader
+        finally:
+            reader.close()
+
+    @final
+    def __get_projected_kwargs(self, columns: Tuple[Hashable, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Returns pandas.read_csv keyword arguments restricted to the given columns.
+        The columns requested by 'index_col' are loaded as well.
+
+        Args:
+            columns:  columns to load.
+        Returns:
+            Keyword arguments or None if 'usecols' or 'index_col' select columns by position,
+            so that they cannot be restricted.
+        """
+        loader_kwargs = dict(self._loader_kwargs)
+        index_col = loader_kwargs.get('index_col')
+        if index_col is not None and index_col is not False:
+            index_columns = index_col if isinstance(index_col, (list, tuple)) else (index_col,)
+            if not all(isinstance(column, str) for column in index_columns):
+                return None
+            columns += tuple(column for column in index_columns if column not in columns)
+        selected = frozenset(columns)
+        usecols = loader_kwargs.get('usecols')
+        if usecols is None:
+            if loader_kwargs.get('engine') == 'pyarrow':
+                loader_kwargs['usecols'] = list(columns)
+            else:
+                loader_kwargs['usecols'] = selected.__contains__
+        elif callable(usecols):
+            loader_kwargs['usecols'] = lambda column: column in selected and usecols(column)
+        elif all(isinstance(column, str) for column in usecols):
+            loader_kwargs['usecols'] = [column for column in usecols if column in selected]
+        else:
+            return None
+        parse_dates = loader_kwargs.get('parse_dates')
+        if isinstance(parse_dates, list) and all(isinstance(column, str) for column in parse_dates):
+            loader_kwargs['parse_dates'] = [column for column in parse_dates if column in selected]
+        return loader_kwargs
+
+    def _load_projected(self, columns: Tuple[Hashable, ...]) -> DataFrame:
+        loader_kwargs = self.__get_projected_kwargs(columns)
+        if loader_kwargs is None:
+            return super()._load_projected(columns)
+        return self._loader(*self._loader_args, **loader_kwargs)
+
+    def _load_projected_chunks(self, columns: Tuple[Hashable, ...], chunksize: int) -> Iterator[DataFrame]:
+        loader_kwargs = self.__get_projected_kwargs(columns)
+        if loader_kwargs is None:
+            yield from super()._load_projected_chunks(columns, chunksize)
+            return
+        if loader_kwargs.get('engine') == 'pyarrow':
+            del loader_kwargs['engine']
+        reader = self._loader(*self._loader_args, chunksize=chunksize, **loader_kwargs)
+        try:
+            yield from reader
+        finally:
+            reader.close()
 
     @final
     @property
     def filepath_or_buffer(self):
         return self._loader_args[0]
+
+
+class FileCachedLoader(StaticDataLoader):
+    """
+    Abstract StaticDataLoader that keeps the loaded file in RAM
+    and reloads it only when the modification time, size or inode of the file changes.
+    """
+    __slots__ = ('__dataframe', '__file_stat', '__loading_file_stat')
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Abstract StaticDataLoader that keeps the loaded file in RAM
+        and reloads it only when the modification time, size or inode of the file changes.
+
+        Args:
+            *args:     positional arguments of the file loader.
+            **kwargs:  keyword arguments of the file loader.
+        """
+        super().__init__(*args, **kwargs)
+        file_path = self._file_path
+        check_type_compatibility(file_path, (str, PathLike), 'str or PathLike')
+        self.__dataframe: Optional[DataFrame] = None
+        self.__file_stat: Optional[Tuple[int, int, int]] = None
+        self.__loading_file_stat: Optional[Tuple[int, int, int]] = None
+
+    @property
+    @abstractmethod
+    def _file_path(self) -> Union[str, PathLike]:
+        """Path to the loaded file."""
+
+    @final
+    def __get_file_stat(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the modification time, size and inode of the file.
+
+        Returns:
+            (st_mtime_ns, st_size, st_ino) or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(self._file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @final
+    @property
+    def _is_cache_stale(self) -> bool:
+        file_stat = self.__get_file_stat()
+        return file_stat is None or file_stat != self.__file_stat
+
+    @final
+    def _before_load(self) -> None:
+        # The file is stat-ed before reading, so that changes made while it is read make the cache stale.
+        self.__loading_file_stat = self.__get_file_stat()
+
+    @final
+    def _dump_to_cache(self, data: DataFrame) -> None:
+        file_stat = self.__loading_file_stat
+        self.__loading_file_stat = None
+        self.__dataframe = data
+        self.__file_stat = self.__get_file_stat() if file_stat is None else file_stat
+
+    @final
+    def _clear_cache_storage(self) -> None:
+        self.__dataframe = None
+        self.__file_stat = None
+
+    @final
+    def _load_cached(self) -> DataFrame:
+        df = self.__dataframe
+        if df is not None:
+            return df
+        raise ValueError("Cannot load non-cached data")
+
+    @final
+    @property
+    def use_cached(self) -> bool:
+        return True
+
+
+class CachedPickleLoader(FileCachedLoader, PickleLoader):
+    """PickleLoader that reloads the pickled DataFrame only when the file changes."""
+    __slots__ = ()
+
+    @property
+    def _file_path(self) -> Union[str, PathLike]:
+        return self.filepath_or_buffer  # type: ignore
+
+
+class CachedExcelLoader(FileCachedLoader, ExcelLoader):
+    """ExcelLoader that reloads the Excel file only when it changes."""
+    __slots__ = ()
+
+    @property
+    def _file_path(self) -> Union[str, PathLike]:
+        return self.io
+
+
+class CachedCsvLoader(FileCachedLoader, CsvLoader):
+    """CsvLoader that reloads the csv-file only when it changes."""
+    __slots__ = ()
+
+    @property
+    def _file_path(self) -> Union[str, PathLike]:
+        return self.filepath_or_buffer
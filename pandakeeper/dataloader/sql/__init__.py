@@ -1 +1,4 @@
 from pandakeeper.dataloader.sql.core import *
+from pandakeeper.dataloader.sql.pool import *
+from pandakeeper.dataloader.sql.utils import *
+from pandakeeper.dataloader.sql.relation import *
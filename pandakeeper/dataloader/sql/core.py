@@ -1,8 +1,13 @@
+import asyncio
 from collections.abc import Mapping as _Mapping, Callable as _Callable
-from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, AsyncExitStack
+from functools import partial
+from inspect import iscoroutinefunction
 from types import MappingProxyType
-from typing import Callable, Any, Tuple, Mapping
+from typing import Callable, Any, Tuple, Mapping, Optional, Iterator, Hashable, List
 
+import numpy as np
 import pandas as pd
 import pandera as pa
 from typing_extensions import final
@@ -10,13 +15,45 @@ from varutils.plugs.constants import empty_mapping_proxy
 from varutils.typing import check_type_compatibility
 
 from pandakeeper.dataloader.core import StaticDataLoader
+from pandakeeper.dataloader.sql.pool import SqlContextPool
+from pandakeeper.dataloader.sql.utils import wrap_query, quote_identifier, format_literal
+from pandakeeper.node import _run_in_executor
+from pandakeeper.validators import schema_read_options
 
 __all__ = ('SqlLoader',)
 
 
+def _concat_partitions(parts: List[pd.DataFrame],
+                       read_sql_args: Tuple[Any, ...],
+                       read_sql_kwargs: Mapping[str, Any]) -> pd.DataFrame:
+    """
+    Concatenates the results of partition queries in order. The default indices of the parts are renumbered,
+    while the index columns requested by 'index_col' (keyword or the first positional argument of pandas.read_sql)
+    are kept, so that the result equals the one of the unpartitioned SQL-query.
+
+    Args:
+        parts:            results of partition queries.
+        read_sql_args:    positional arguments for 'read_sql_fn'.
+        read_sql_kwargs:  keyword arguments for 'read_sql_fn'.
+    Returns:
+        Concatenated DataFrame.
+    """
+    if read_sql_kwargs.get('index_col') is not None or (read_sql_args and read_sql_args[0] is not None):
+        return pd.concat(parts)
+    return pd.concat(parts, ignore_index=True)
+
+
 class SqlLoader(StaticDataLoader):
     """DataLoader that loads data using SQL-connections."""
-    __slots__ = ('__context_creator', '__read_sql_fn')
+    __slots__ = (
+        '__context_creator',
+        '__read_sql_fn',
+        '__pooled',
+        '__partition_predicates',
+        '__max_partition_workers',
+        '__watermark_column',
+        '__projected_watermark'
+    )
 
     def __init__(
             self,
@@ -28,18 +65,41 @@ class SqlLoader(StaticDataLoader):
             read_sql_fn: Callable[..., pd.DataFrame] = pd.read_sql,
             read_sql_args: Tuple[Any, ...] = (),
             read_sql_kwargs: Mapping[str, Any] = empty_mapping_proxy,
+            pooled: bool = False,
+            partition_predicates: Tuple[str, ...] = (),
+            max_partition_workers: Optional[int] = None,
+            derive_read_options: bool = False,
+            watermark_column: Optional[str] = None,
             output_validator: pa.DataFrameSchema) -> None:
         """
         DataLoader that loads data using SQL-connections.
 
         Args:
             context_creator:         callable that should create a SQL context and return a DB-connection.
+                                     Coroutine functions are called with contextlib.AsyncExitStack
+                                     instead of contextlib.ExitStack and awaited.
             sql_query:               SQL-query to run.
             context_creator_args:    positional arguments for 'context_creator'.
             context_creator_kwargs:  keyword arguments for 'context_creator'.
             read_sql_fn:             function that creates pandas.DataFrame from the result of SQL-query.
+                                     May be a coroutine function if 'context_creator' is.
             read_sql_args:           positional arguments for 'read_sql_fn'.
             read_sql_kwargs:         keyword arguments for 'read_sql_fn'.
+            pooled:                  whether to borrow DB-connections from the SqlContextPool shared by all loaders
+                                     with the same 'context_creator' and its arguments. Pooled DB-connections
+                                     are reused across threads (see SqlContextPool).
+            partition_predicates:    SQL-predicates that split the result of SQL-query into disjoint parts
+                                     (see 'range_partitions'). If given, every part is read concurrently
+                                     over a separate DB-connection, and the parts are concatenated in order.
+            max_partition_workers:   maximum number of parts read at the same time.
+                                     Defaults to the number of partition predicates.
+            derive_read_options:     whether to pass 'dtype' and 'parse_dates' derived from the output validator
+                                     (see 'schema_read_options') to 'read_sql_fn', so that the resulting columns
+                                     already have their final dtypes. 'read_sql_fn' should then accept them
+                                     as pandas.read_sql does. Explicitly passed 'read_sql_kwargs' take precedence.
+            watermark_column:        column of the result of SQL-query that increases with every appended row,
+                                     e.g. an autoincrement ID or an insertion timestamp. If given,
+                                     'refresh_incrementally' reads only the rows above its last loaded maximum.
             output_validator:        output validator.
         """
         check_type_compatibility(context_creator, _Callable, 'Callable')  # type: ignore
@@ -49,6 +109,23 @@ class SqlLoader(StaticDataLoader):
         check_type_compatibility(read_sql_fn, _Callable, 'Callable')  # type: ignore
         check_type_compatibility(read_sql_args, tuple)
         check_type_compatibility(read_sql_kwargs, _Mapping, "dict or another Mapping")
+        check_type_compatibility(pooled, bool)
+        if pooled and iscoroutinefunction(context_creator):
+            raise ValueError("Asynchronous 'context_creator' cannot be pooled")
+        check_type_compatibility(partition_predicates, tuple)
+        for predicate in partition_predicates:
+            check_type_compatibility(predicate, str)
+        if max_partition_workers is not None:
+            check_type_compatibility(max_partition_workers, int)
+            if max_partition_workers <= 0:
+                raise ValueError(f"'max_partition_workers' should be positive. Got: {max_partition_workers}")
+        check_type_compatibility(derive_read_options, bool)
+        if watermark_column is not None:
+            check_type_compatibility(watermark_column, str)
+        if derive_read_options:
+            derived_options = schema_read_options(output_validator)
+            derived_options.pop('usecols', None)
+            read_sql_kwargs = {**derived_options, **read_sql_kwargs}
         super().__init__(
             self.__load_sql,
             sql_query,
@@ -60,9 +137,62 @@ class SqlLoader(StaticDataLoader):
         self.set_output_validator(output_validator)
         self.__read_sql_fn = read_sql_fn
         self.__context_creator = context_creator
+        self.__pooled = pooled
+        self.__partition_predicates = partition_predicates
+        self.__max_partition_workers = max_partition_workers
+        self.__watermark_column = watermark_column
+        self.__projected_watermark: Any = None
+        if watermark_column is not None:
+            self._enable_delta_tracking()
 
     @final
-    def __load_sql(
+    def __connect(self,
+                  exit_stack: ExitStack,
+                  context_creator_args: Tuple[Any, ...],
+                  context_creator_kwargs: Mapping[str, Any]) -> Any:
+        """
+        Creates SQL context or borrows it from the shared SqlContextPool.
+
+        Args:
+            exit_stack:              ExitStack of the SQL context.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+
+        Returns:
+            DB-connection.
+        """
+        if self.__pooled:
+            pool = SqlContextPool.shared(self.__context_creator, context_creator_args, context_creator_kwargs)
+            return pool(exit_stack)
+        return self.__context_creator(exit_stack, *context_creator_args, **context_creator_kwargs)
+
+    @final
+    def __get_partition_queries(self,
+                                sql_query: str,
+                                columns: Optional[Tuple[Hashable, ...]] = None) -> Tuple[str, ...]:
+        """
+        Returns SQL-queries that read the parts of the result of the SQL-query.
+
+        Args:
+            sql_query:  SQL-query to split.
+            columns:    columns to select or None to select all columns.
+        Returns:
+            SQL-query for every partition predicate, or the single SQL-query if there are none.
+        """
+        predicates = self.__partition_predicates
+        if columns is None:
+            if not predicates:
+                return sql_query,
+            select_list = '*'
+        else:
+            select_list = ', '.join(quote_identifier(str(column)) for column in columns)
+        source = wrap_query(sql_query, '_pandakeeper_partition')
+        if not predicates:
+            return f'SELECT {select_list} FROM {source}',
+        return tuple(f'SELECT {select_list} FROM {source} WHERE {predicate}' for predicate in predicates)
+
+    @final
+    def __read_query(
             self,
             sql_query: str,
             context_creator_args: Tuple[Any, ...],
@@ -70,7 +200,7 @@ class SqlLoader(StaticDataLoader):
             read_sql_args: Tuple[Any, ...],
             read_sql_kwargs: Mapping[str, Any]) -> pd.DataFrame:
         """
-        Builds necessary contexts and returns the result of the SQL-query.
+        Builds necessary contexts and returns the result of a single SQL-query.
 
         Args:
             sql_query:               SQL-query to run.
@@ -83,9 +213,279 @@ class SqlLoader(StaticDataLoader):
             Resulting DataFrame.
         """
         with ExitStack() as exit_stack:
-            conn = self.__context_creator(exit_stack, *context_creator_args, **context_creator_kwargs)
+            conn = self.__connect(exit_stack, context_creator_args, context_creator_kwargs)
             return self.__read_sql_fn(sql_query, conn, *read_sql_args, **read_sql_kwargs)
 
+    @final
+    def __load_sql(
+            self,
+            sql_query: str,
+            context_creator_args: Tuple[Any, ...],
+            context_creator_kwargs: Mapping[str, Any],
+            read_sql_args: Tuple[Any, ...],
+            read_sql_kwargs: Mapping[str, Any],
+            columns: Optional[Tuple[Hashable, ...]] = None) -> pd.DataFrame:
+        """
+        Builds necessary contexts and returns the result of the SQL-query.
+        Partitions of the SQL-query are read concurrently and concatenated in order.
+
+        Args:
+            sql_query:               SQL-query to run.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+            read_sql_args:           positional arguments for 'read_sql_fn'.
+            read_sql_kwargs:         keyword arguments for 'read_sql_fn'.
+            columns:                 columns to select or None to select all columns.
+
+        Returns:
+            Resulting DataFrame.
+        """
+        if self.is_async:
+            return asyncio.run(self.__aload_sql(
+                sql_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs, columns
+            ))
+        queries = self.__get_partition_queries(sql_query, columns)
+        if len(queries) == 1:
+            return self.__read_query(
+                queries[0], context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs
+            )
+
+        def read_partition(partition_query: str) -> pd.DataFrame:
+            return self.__read_query(
+                partition_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs
+            )
+
+        with ThreadPoolExecutor(self.__max_partition_workers or len(queries)) as pool:
+            parts = list(pool.map(read_partition, queries))
+        return _concat_partitions(parts, read_sql_args, read_sql_kwargs)
+
+    @final
+    async def __aread_query(
+            self,
+            sql_query: str,
+            context_creator_args: Tuple[Any, ...],
+            context_creator_kwargs: Mapping[str, Any],
+            read_sql_args: Tuple[Any, ...],
+            read_sql_kwargs: Mapping[str, Any]) -> pd.DataFrame:
+        """
+        Builds necessary asynchronous contexts and returns the result of a single SQL-query.
+        Blocking 'read_sql_fn' runs in the default executor.
+
+        Args:
+            sql_query:               SQL-query to run.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+            read_sql_args:           positional arguments for 'read_sql_fn'.
+            read_sql_kwargs:         keyword arguments for 'read_sql_fn'.
+
+        Returns:
+            Resulting DataFrame.
+        """
+        async with AsyncExitStack() as exit_stack:
+            conn = await self.__context_creator(exit_stack, *context_creator_args, **context_creator_kwargs)
+            read_sql_fn = self.__read_sql_fn
+            if iscoroutinefunction(read_sql_fn):
+                return await read_sql_fn(sql_query, conn, *read_sql_args, **read_sql_kwargs)
+            return await _run_in_executor(partial(read_sql_fn, sql_query, conn, *read_sql_args, **read_sql_kwargs))
+
+    @final
+    async def __aload_sql(
+            self,
+            sql_query: str,
+            context_creator_args: Tuple[Any, ...],
+            context_creator_kwargs: Mapping[str, Any],
+            read_sql_args: Tuple[Any, ...],
+            read_sql_kwargs: Mapping[str, Any],
+            columns: Optional[Tuple[Hashable, ...]] = None) -> pd.DataFrame:
+        """
+        Asynchronous counterpart of the '__load_sql' method. Partitions of the SQL-query are awaited concurrently.
+
+        Args:
+            sql_query:               SQL-query to run.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+            read_sql_args:           positional arguments for 'read_sql_fn'.
+            read_sql_kwargs:         keyword arguments for 'read_sql_fn'.
+            columns:                 columns to select or None to select all columns.
+
+        Returns:
+            Resulting DataFrame.
+        """
+        queries = self.__get_partition_queries(sql_query, columns)
+        parts = await asyncio.gather(*(
+            self.__aread_query(query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs)
+            for query in queries
+        ))
+        if len(parts) == 1:
+            return parts[0]
+        return _concat_partitions(parts, read_sql_args, read_sql_kwargs)
+
+    async def _aload_default(self) -> pd.DataFrame:
+        if self.is_async:
+            return await self.__aload_sql(*self._loader_args)
+        return await super()._aload_default()
+
+    @property
+    def chunk_safe(self) -> bool:
+        """
+        Whether 'read_sql_fn' is a pandas function that can read the result of SQL-query in chunks
+        and 'context_creator' is synchronous.
+        """
+        return not self.is_async and self.__read_sql_fn in (pd.read_sql, pd.read_sql_query)
+
+    def _load_default_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        return self.__load_sql_chunks(chunksize, *self._loader_args)
+
+    @final
+    def __get_projected_loader_args(self, columns: Tuple[Hashable, ...]) -> Tuple[Any, ...]:
+        """
+        Returns arguments of the '__load_sql' method with the 'dtype' keyword argument of 'read_sql_fn'
+        restricted to the given columns. The columns requested by 'index_col' are selected as well.
+
+        Args:
+            columns:  columns to select.
+        Returns:
+            Arguments of the '__load_sql' method.
+        """
+        sql_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs = self._loader_args
+        index_col = read_sql_kwargs.get('index_col')
+        if index_col is None and read_sql_args:
+            index_col = read_sql_args[0]
+        if index_col is not None:
+            index_columns = index_col if isinstance(index_col, (list, tuple)) else (index_col,)
+            columns += tuple(column for column in index_columns if column not in columns)
+        dtype = read_sql_kwargs.get('dtype')
+        if isinstance(dtype, _Mapping):
+            selected = frozenset(columns)
+            read_sql_kwargs = {
+                **read_sql_kwargs,
+                'dtype': {column: column_dtype for column, column_dtype in dtype.items() if column in selected}
+            }
+        return sql_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs, columns
+
+    def _load_projected(self, columns: Tuple[Hashable, ...]) -> pd.DataFrame:
+        watermark_column = self.__watermark_column
+        if watermark_column is None or watermark_column in columns:
+            return self.__load_sql(*self.__get_projected_loader_args(columns))
+        # The watermark column is selected anyway, so that the next delta can be loaded.
+        data = self.__load_sql(*self.__get_projected_loader_args(columns + (watermark_column,)))
+        self.__projected_watermark = self.__get_watermark(data)
+        return data.drop(columns=watermark_column)
+
+    def _load_projected_chunks(self, columns: Tuple[Hashable, ...], chunksize: int) -> Iterator[pd.DataFrame]:
+        return self.__load_sql_chunks(chunksize, *self.__get_projected_loader_args(columns))
+
+    async def _aload_projected(self, columns: Tuple[Hashable, ...]) -> pd.DataFrame:
+        if self.is_async:
+            return await self.__aload_sql(*self.__get_projected_loader_args(columns))
+        return await super()._aload_projected(columns)
+
+    @final
+    def __load_sql_chunks(
+            self,
+            chunksize: int,
+            sql_query: str,
+            context_creator_args: Tuple[Any, ...],
+            context_creator_kwargs: Mapping[str, Any],
+            read_sql_args: Tuple[Any, ...],
+            read_sql_kwargs: Mapping[str, Any],
+            columns: Optional[Tuple[Hashable, ...]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Chunked counterpart of the '__load_sql' method. Partitions of the SQL-query are read one by one.
+
+        Args:
+            chunksize:               number of rows per chunk.
+            sql_query:               SQL-query to run.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+            read_sql_args:           positional arguments for 'read_sql_fn'.
+            read_sql_kwargs:         keyword arguments for 'read_sql_fn'.
+            columns:                 columns to select or None to select all columns.
+
+        Returns:
+            Iterator of chunks.
+        """
+        for partition_query in self.__get_partition_queries(sql_query, columns):
+            with ExitStack() as exit_stack:
+                conn = self.__connect(exit_stack, context_creator_args, context_creator_kwargs)
+                yield from self.__read_sql_fn(
+                    partition_query, conn, *read_sql_args, chunksize=chunksize, **read_sql_kwargs
+                )
+
+    @final
+    def _read_sql(self, sql_query: str) -> pd.DataFrame:
+        """
+        Runs another SQL-query in the SQL context of the loader. Used by SqlRelation to run compiled queries.
+        Partition predicates, the projection and the 'dtype' keyword argument of 'read_sql_fn' are not applied,
+        since they refer to the result of the SQL-query of the loader.
+
+        Args:
+            sql_query:  SQL-query to run.
+        Returns:
+            Resulting DataFrame.
+        """
+        _, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs = self._loader_args
+        read_sql_kwargs = {key: value for key, value in read_sql_kwargs.items() if key != 'dtype'}
+        if self.is_async:
+            return asyncio.run(self.__aread_query(
+                sql_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs
+            ))
+        return self.__read_query(
+            sql_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs
+        )
+
+    @final
+    def __get_watermark(self, data: pd.DataFrame) -> Any:
+        """
+        Returns the maximum value of the watermark column.
+
+        Args:
+            data:  result of SQL-query.
+        Returns:
+            Maximum value or None if the column is not loaded or has no values.
+        """
+        column = self.__watermark_column
+        if column not in data.columns:
+            return None
+        watermark = data[column].max()
+        if pd.isna(watermark):
+            return None
+        return watermark.item() if isinstance(watermark, np.generic) else watermark
+
+    def _get_delta_baseline(self) -> Any:
+        self.__projected_watermark = None
+        return None
+
+    def _update_delta_baseline(self, baseline: Any, data: pd.DataFrame) -> Any:
+        if self.__watermark_column in data.columns:
+            return self.__get_watermark(data)
+        watermark = self.__projected_watermark
+        self.__projected_watermark = None
+        return watermark
+
+    def _load_default_delta(self, baseline: Any) -> Optional[Tuple[pd.DataFrame, Any]]:
+        sql_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs = self._loader_args
+        source = wrap_query(sql_query, '_pandakeeper_delta')
+        delta_query = (
+            f'SELECT * FROM {source} WHERE {quote_identifier(self.__watermark_column)} > {format_literal(baseline)}'
+        )
+        if self.is_async:
+            delta = asyncio.run(self.__aread_query(
+                delta_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs
+            ))
+        else:
+            delta = self.__read_query(
+                delta_query, context_creator_args, context_creator_kwargs, read_sql_args, read_sql_kwargs
+            )
+        watermark = self.__get_watermark(delta)
+        return delta, (baseline if watermark is None else watermark)
+
+    def _fingerprint_parts(self) -> Optional[Tuple[Any, ...]]:
+        parts = super()._fingerprint_parts()
+        if parts is None:
+            return None
+        return parts + (self.__context_creator, self.__read_sql_fn)
+
     @final
     @property
     def _read_sql_fn(self) -> Callable[..., pd.DataFrame]:
@@ -122,6 +522,36 @@ class SqlLoader(StaticDataLoader):
         """Keyword arguments for 'read_sql_fn'."""
         return MappingProxyType(self._loader_args[4])
 
+    @final
+    @property
+    def is_async(self) -> bool:
+        """Whether 'context_creator' is a coroutine function."""
+        return iscoroutinefunction(self.__context_creator)
+
+    @final
+    @property
+    def pooled(self) -> bool:
+        """Whether DB-connections are borrowed from the shared SqlContextPool."""
+        return self.__pooled
+
+    @final
+    @property
+    def partition_predicates(self) -> Tuple[str, ...]:
+        """SQL-predicates that split the result of SQL-query into parts read concurrently."""
+        return self.__partition_predicates
+
+    @final
+    @property
+    def max_partition_workers(self) -> Optional[int]:
+        """Maximum number of parts read at the same time."""
+        return self.__max_partition_workers
+
+    @final
+    @property
+    def watermark_column(self) -> Optional[str]:
+        """Column that increases with every appended row or None if deltas are not loaded."""
+        return self.__watermark_column
+
     @final
     @property
     def sql_query(self) -> str:
@@ -0,0 +1,245 @@
+from collections import deque
+from collections.abc import Mapping as _Mapping, Callable as _Callable
+from contextlib import ExitStack
+from threading import Lock, BoundedSemaphore
+from time import monotonic
+from types import TracebackType
+from typing import Callable, Any, Tuple, Mapping, Optional, Dict, Hashable, Type
+
+from varutils.plugs.constants import empty_mapping_proxy
+from varutils.typing import check_type_compatibility
+
+__all__ = ('SqlContextPool',)
+
+
+class _PooledContext:
+    """SQL context kept by SqlContextPool: DB-connection together with the ExitStack that closes it."""
+    __slots__ = ('connection', 'exit_stack', 'released_at')
+
+    def __init__(self, connection: Any, exit_stack: ExitStack) -> None:
+        self.connection = connection
+        self.exit_stack = exit_stack
+        self.released_at = monotonic()
+
+
+class SqlContextPool:
+    """
+    Bounded thread-safe pool of SQL contexts created by a context creator.
+    The pool itself can be used as a 'context_creator' of SqlLoader: it borrows a DB-connection
+    and returns it to the pool when the ExitStack of the loader is closed.
+    Idle DB-connections are reused by whichever thread borrows them next (e.g. GraphExecutor workers
+    or partition reads), so they should not be bound to the thread that created them: sqlite3 connections,
+    for instance, should be created with 'check_same_thread=False'.
+    """
+    __slots__ = (
+        '__context_creator',
+        '__context_creator_args',
+        '__context_creator_kwargs',
+        '__max_size',
+        '__max_idle_time',
+        '__health_check',
+        '__acquire_timeout',
+        '__semaphore',
+        '__lock',
+        '__idle',
+        '__closed'
+    )
+    __shared_pools: Dict[Hashable, 'SqlContextPool'] = {}
+    __shared_pools_lock = Lock()
+
+    def __init__(
+            self,
+            context_creator: Callable[..., Any],
+            *,
+            context_creator_args: Tuple[Any, ...] = (),
+            context_creator_kwargs: Mapping[str, Any] = empty_mapping_proxy,
+            max_size: int = 8,
+            max_idle_time: Optional[float] = 300.,
+            health_check: Optional[Callable[[Any], bool]] = None,
+            acquire_timeout: Optional[float] = None) -> None:
+        """
+        Bounded thread-safe pool of SQL contexts created by a context creator.
+
+        Args:
+            context_creator:         callable that should create a SQL context and return a DB-connection.
+                                     Has the same signature as the 'context_creator' of SqlLoader.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+            max_size:                maximum number of DB-connections created by the pool at the same time.
+            max_idle_time:           number of seconds after which idle DB-connections are closed.
+                                     None means that idle DB-connections are never closed.
+            health_check:            callable that checks whether an idle DB-connection can be reused.
+            acquire_timeout:         number of seconds to wait for a free DB-connection. None means no limit.
+        """
+        check_type_compatibility(context_creator, _Callable, 'Callable')  # type: ignore
+        check_type_compatibility(context_creator_args, tuple)
+        check_type_compatibility(context_creator_kwargs, _Mapping, "dict or another Mapping")
+        check_type_compatibility(max_size, int)
+        if max_size <= 0:
+            raise ValueError(f"'max_size' should be positive. Got: {max_size}")
+        if max_idle_time is not None:
+            check_type_compatibility(max_idle_time, (int, float))
+        if health_check is not None:
+            check_type_compatibility(health_check, _Callable, 'Callable')  # type: ignore
+        if acquire_timeout is not None:
+            check_type_compatibility(acquire_timeout, (int, float))
+        self.__context_creator = context_creator
+        self.__context_creator_args = context_creator_args
+        self.__context_creator_kwargs = context_creator_kwargs
+        self.__max_size = max_size
+        self.__max_idle_time = max_idle_time
+        self.__health_check = health_check
+        self.__acquire_timeout = acquire_timeout
+        self.__semaphore = BoundedSemaphore(max_size)
+        self.__lock = Lock()
+        self.__idle: 'deque[_PooledContext]' = deque()
+        self.__closed = False
+
+    @classmethod
+    def shared(cls,
+               context_creator: Callable[..., Any],
+               context_creator_args: Tuple[Any, ...] = (),
+               context_creator_kwargs: Mapping[str, Any] = empty_mapping_proxy) -> 'SqlContextPool':
+        """
+        Returns the process-wide pool for the given context creator and its arguments, creating it if needed.
+
+        Args:
+            context_creator:         callable that should create a SQL context and return a DB-connection.
+            context_creator_args:    positional arguments for 'context_creator'.
+            context_creator_kwargs:  keyword arguments for 'context_creator'.
+        Returns:
+            Shared SqlContextPool.
+        """
+        key = (context_creator, context_creator_args, tuple(sorted(context_creator_kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            raise TypeError("Arguments of the pooled 'context_creator' should be hashable") from None
+        with cls.__shared_pools_lock:
+            pool = cls.__shared_pools.get(key)
+            if pool is None or pool.__closed:
+                pool = cls.__shared_pools[key] = cls(
+                    context_creator,
+                    context_creator_args=context_creator_args,
+                    context_creator_kwargs=context_creator_kwargs
+                )
+            return pool
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of DB-connections created by the pool at the same time."""
+        return self.__max_size
+
+    @property
+    def max_idle_time(self) -> Optional[float]:
+        """Number of seconds after which idle DB-connections are closed."""
+        return self.__max_idle_time
+
+    @property
+    def idle_size(self) -> int:
+        """Number of idle DB-connections."""
+        return len(self.__idle)
+
+    def __is_reusable(self, context: _PooledContext) -> bool:
+        """
+        Checks whether the idle SQL context can be borrowed again.
+
+        Args:
+            context:  idle SQL context.
+        Returns:
+            Result of checking.
+        """
+        max_idle_time = self.__max_idle_time
+        if max_idle_time is not None and monotonic() - context.released_at > max_idle_time:
+            return False
+        health_check = self.__health_check
+        if health_check is None:
+            return True
+        try:
+            return bool(health_check(context.connection))
+        except Exception:
+            return False
+
+    def __acquire(self) -> _PooledContext:
+        """
+        Borrows an idle SQL context or creates a new one.
+
+        Returns:
+            Borrowed SQL context.
+        """
+        if self.__closed:
+            raise RuntimeError("Cannot borrow a DB-connection from the closed pool")
+        if not self.__semaphore.acquire(timeout=self.__acquire_timeout):  # type: ignore
+            raise TimeoutError(f"No DB-connection became free within {self.__acquire_timeout} seconds")
+        try:
+            while True:
+                with self.__lock:
+                    context = self.__idle.pop() if self.__idle else None
+                if context is None:
+                    break
+                if self.__is_reusable(context):
+                    return context
+                context.exit_stack.close()
+            exit_stack = ExitStack()
+            try:
+                connection = self.__context_creator(
+                    exit_stack,
+                    *self.__context_creator_args,
+                    **self.__context_creator_kwargs
+                )
+            except BaseException:
+                exit_stack.close()
+                raise
+            return _PooledContext(connection, exit_stack)
+        except BaseException:
+            self.__semaphore.release()
+            raise
+
+    def __release(self, context: _PooledContext, reusable: bool) -> None:
+        """
+        Returns the borrowed SQL context to the pool.
+
+        Args:
+            context:   borrowed SQL context.
+            reusable:  whether the SQL context can be borrowed again.
+        """
+        try:
+            if reusable:
+                with self.__lock:
+                    if not self.__closed:
+                        context.released_at = monotonic()
+                        self.__idle.append(context)
+                        return
+            context.exit_stack.close()
+        finally:
+            self.__semaphore.release()
+
+    def __call__(self, exit_stack: ExitStack) -> Any:
+        """
+        Borrows a DB-connection that is returned to the pool when the ExitStack is closed.
+        DB-connections used by code that raised an exception are closed instead.
+
+        Args:
+            exit_stack:  ExitStack of the SQL context.
+        Returns:
+            DB-connection.
+        """
+        context = self.__acquire()
+
+        def release(exc_type: Optional[Type[BaseException]],
+                    exc: Optional[BaseException],
+                    traceback: Optional[TracebackType]) -> bool:
+            self.__release(context, exc_type is None)
+            return False
+
+        exit_stack.push(release)
+        return context.connection
+
+    def close(self) -> None:
+        """Closes idle DB-connections. Borrowed DB-connections are closed when returned."""
+        with self.__lock:
+            self.__closed = True
+            idle = tuple(self.__idle)
+            self.__idle.clear()
+        for context in idle:
+            context.exit_stack.close()
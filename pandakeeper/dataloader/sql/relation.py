@@ -0,0 +1,778 @@
+from abc import ABCMeta, abstractmethod
+from collections.abc import Callable as _Callable
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+from warnings import warn
+
+import pandas as pd
+from pandera import DataFrameSchema
+from typing_extensions import final
+from varutils.typing import check_type_compatibility
+
+from pandakeeper.dataloader.sql.core import SqlLoader
+from pandakeeper.dataloader.sql.utils import quote_identifier, format_literal, wrap_query
+from pandakeeper.dataprocessor import DataProcessor
+from pandakeeper.validation import get_validation_policy
+from pandakeeper.validators import AnyDataFrame
+
+__all__ = (
+    'SqlRelation',
+    'SqlRelationProcessor'
+)
+
+_COMPARISON_OPERATORS = frozenset(('=', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'is null', 'is not null'))
+_SQL_AGGREGATIONS: Mapping[str, str] = {
+    'sum': 'SUM({})',
+    'mean': 'AVG({})',
+    'min': 'MIN({})',
+    'max': 'MAX({})',
+    'count': 'COUNT({})',
+    'nunique': 'COUNT(DISTINCT {})',
+    'size': 'COUNT(*)'
+}
+
+
+def _quote_columns(columns: Sequence[str]) -> str:
+    """
+    Quotes column names and joins them with commas.
+
+    Args:
+        columns:  column names.
+    Returns:
+        Comma-separated quoted column names.
+    """
+    return ', '.join(map(quote_identifier, columns))
+
+
+def _check_columns(columns: Sequence[str], arg_name: str) -> Tuple[str, ...]:
+    """
+    Checks that the column names are strings.
+
+    Args:
+        columns:   column names.
+        arg_name:  name of the checked argument used in error messages.
+    Returns:
+        Column names as tuple.
+    """
+    columns = tuple(columns)
+    for column in columns:
+        if not isinstance(column, str):
+            raise TypeError(f"'{arg_name}' should contain column names of type str. Got: {column!r}")
+    return columns
+
+
+def _get_order_clause(order: Optional['_OrderBy']) -> str:
+    """
+    Returns ORDER BY clause that keeps the sorting of the rows.
+
+    Args:
+        order:  sorting to keep or None if the rows are not ordered.
+    Returns:
+        ORDER BY clause preceded by space or empty string.
+    """
+    return '' if order is None else f' {order.clause}'
+
+
+class _Operation(metaclass=ABCMeta):
+    """Abstract relational operation that can be compiled into SQL and applied to a DataFrame."""
+    __slots__ = ()
+
+    @property
+    def pushable(self) -> bool:
+        """Whether the operation can be compiled into SQL."""
+        return True
+
+    @property
+    def preserves_values(self) -> bool:
+        """Whether the result consists of the values of the input rows, so that validators of the input apply to it."""
+        return True
+
+    @property
+    @abstractmethod
+    def parts(self) -> Tuple[Any, ...]:
+        """Values that define the operation. Used for fingerprinting."""
+
+    @abstractmethod
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        """
+        Compiles the operation into a SELECT statement.
+
+        Args:
+            source:  subquery expression to select from.
+            order:   sorting of the previous operations to keep or None if the rows are not ordered.
+        Returns:
+            SELECT statement.
+        """
+
+    @abstractmethod
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the operation to the DataFrame.
+
+        Args:
+            df:  input DataFrame.
+        Returns:
+            Resulting DataFrame.
+        """
+
+    def next_order(self, order: Optional['_OrderBy']) -> Optional['_OrderBy']:
+        """
+        Returns the sorting of the rows after the operation.
+
+        Args:
+            order:  sorting of the previous operations or None if the rows are not ordered.
+        Returns:
+            Sorting or None if the order is lost.
+        """
+        return None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}{self.parts!r}'
+
+
+class _Filter(_Operation):
+    """Keeps the rows where the comparison of the column with the value holds. Rows with NULL never match."""
+    __slots__ = ('__column', '__operator', '__value')
+
+    def __init__(self, column: str, operator: str, value: Any) -> None:
+        self.__column = column
+        self.__operator = operator
+        self.__value = value
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__column, self.__operator, self.__value
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        column = quote_identifier(self.__column)
+        operator = self.__operator
+        if operator in ('is null', 'is not null'):
+            predicate = f'{column} {operator.upper()}'
+        elif operator in ('in', 'not in'):
+            values = tuple(self.__value)
+            if values:
+                predicate = f"{column} {operator.upper()} ({', '.join(map(format_literal, values))})"
+            else:
+                predicate = '1 = 0' if operator == 'in' else f'{column} IS NOT NULL'
+        else:
+            predicate = f'{column} {"<>" if operator == "!=" else operator} {format_literal(self.__value)}'
+        return f'SELECT * FROM {source} WHERE {predicate}{_get_order_clause(order)}'
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        column = df[self.__column]
+        operator = self.__operator
+        value = self.__value
+        if operator == 'is null':
+            mask = column.isna()
+        elif operator == 'is not null':
+            mask = column.notna()
+        elif operator in ('in', 'not in'):
+            mask = column.isin(tuple(value))
+            if operator == 'not in':
+                mask = ~mask & column.notna()
+        elif operator == '=':
+            mask = column == value
+        elif operator == '!=':
+            mask = (column != value) & column.notna()
+        elif operator == '<':
+            mask = column < value
+        elif operator == '<=':
+            mask = column <= value
+        elif operator == '>':
+            mask = column > value
+        else:
+            mask = column >= value
+        return df[mask.fillna(False).astype(bool)]
+
+    def next_order(self, order: Optional['_OrderBy']) -> Optional['_OrderBy']:
+        return order
+
+
+class _Where(_Operation):
+    """Keeps the rows that satisfy raw SQL-predicate. Cannot be applied to DataFrames."""
+    __slots__ = ('__predicate',)
+
+    def __init__(self, predicate: str) -> None:
+        self.__predicate = predicate
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__predicate,
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        return f'SELECT * FROM {source} WHERE {self.__predicate}{_get_order_clause(order)}'
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        raise ValueError(f"Raw SQL-predicate cannot be applied to DataFrame: {self.__predicate!r}")
+
+    def next_order(self, order: Optional['_OrderBy']) -> Optional['_OrderBy']:
+        return order
+
+
+class _Select(_Operation):
+    """Selects the columns in the given order."""
+    __slots__ = ('__columns',)
+
+    def __init__(self, columns: Tuple[str, ...]) -> None:
+        self.__columns = columns
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__columns
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        return f'SELECT {_quote_columns(self.__columns)} FROM {source}{_get_order_clause(order)}'
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df[list(self.__columns)]
+
+    def next_order(self, order: Optional['_OrderBy']) -> Optional['_OrderBy']:
+        if order is not None and set(order.columns).issubset(self.__columns):
+            return order
+        return None
+
+
+class _OrderBy(_Operation):
+    """Sorts the rows by the columns. The order is kept by subsequent filters and limits."""
+    __slots__ = ('__columns', '__ascending')
+
+    def __init__(self, columns: Tuple[str, ...], ascending: bool) -> None:
+        self.__columns = columns
+        self.__ascending = ascending
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__columns, self.__ascending
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Columns to sort by."""
+        return self.__columns
+
+    @property
+    def clause(self) -> str:
+        """ORDER BY clause."""
+        direction = 'ASC' if self.__ascending else 'DESC'
+        return 'ORDER BY ' + ', '.join(f'{quote_identifier(column)} {direction}' for column in self.__columns)
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        return f'SELECT * FROM {source} {self.clause}'
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.sort_values(list(self.__columns), ascending=self.__ascending, kind='stable', ignore_index=True)
+
+    def next_order(self, order: Optional['_OrderBy']) -> Optional['_OrderBy']:
+        return self
+
+
+class _Limit(_Operation):
+    """Keeps the first rows."""
+    __slots__ = ('__n',)
+
+    def __init__(self, n: int) -> None:
+        self.__n = n
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__n,
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        return f'SELECT * FROM {source}{_get_order_clause(order)} LIMIT {self.__n}'
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.head(self.__n)
+
+    def next_order(self, order: Optional['_OrderBy']) -> Optional['_OrderBy']:
+        return order
+
+
+class _Aggregate(_Operation):
+    """Groups the rows by the columns and aggregates the groups. NULL keys form their own groups."""
+    __slots__ = ('__by', '__aggregations')
+
+    def __init__(self, by: Tuple[str, ...], aggregations: Tuple[Tuple[str, str, Any], ...]) -> None:
+        self.__by = by
+        self.__aggregations = aggregations
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__by, self.__aggregations
+
+    @property
+    def pushable(self) -> bool:
+        return all(
+            isinstance(function, str) and function in _SQL_AGGREGATIONS
+            for _, _, function in self.__aggregations
+        )
+
+    @property
+    def preserves_values(self) -> bool:
+        return False
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        select_list = [quote_identifier(column) for column in self.__by]
+        for name, column, function in self.__aggregations:
+            expression = _SQL_AGGREGATIONS[function].format(quote_identifier(column))
+            select_list.append(f'{expression} AS {quote_identifier(name)}')
+        sql = f"SELECT {', '.join(select_list)} FROM {source}"
+        if self.__by:
+            sql += f' GROUP BY {_quote_columns(self.__by)}'
+        return sql
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        by = self.__by
+        aggregations = {name: (column, function) for name, column, function in self.__aggregations}
+        if by:
+            return df.groupby(list(by), as_index=False, sort=False, dropna=False).agg(**aggregations)
+        return pd.DataFrame({
+            name: [df[column].agg(function)] for name, (column, function) in aggregations.items()
+        })
+
+
+class _Join(_Operation):
+    """Joins another SqlRelation on equal key columns. Non-key columns of the relations should not intersect."""
+    __slots__ = ('__other', '__on', '__how')
+
+    def __init__(self, other: 'SqlRelation', on: Tuple[str, ...], how: str) -> None:
+        self.__other = other
+        self.__on = on
+        self.__how = how
+
+    @property
+    def other(self) -> 'SqlRelation':
+        """Joined SqlRelation."""
+        return self.__other
+
+    @property
+    def preserves_values(self) -> bool:
+        return False
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        other = self.__other
+        return other.source._fingerprint, other._fingerprint_parts(), self.__on, self.__how
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        other_sql = self.__other.compile()[0]
+        join = 'LEFT JOIN' if self.__how == 'left' else 'JOIN'
+        other_source = wrap_query(other_sql, '_pandakeeper_join')
+        return f'SELECT * FROM {source} {join} {other_source} USING ({_quote_columns(self.__on)})'
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.merge(self.__other.evaluate(), on=list(self.__on), how=self.__how)
+
+
+class _Transform(_Operation):
+    """Applies arbitrary function to the DataFrame. Cannot be compiled into SQL."""
+    __slots__ = ('__function',)
+
+    def __init__(self, function: Callable[[pd.DataFrame], pd.DataFrame]) -> None:
+        self.__function = function
+
+    @property
+    def pushable(self) -> bool:
+        return False
+
+    @property
+    def parts(self) -> Tuple[Any, ...]:
+        return self.__function,
+
+    def to_sql(self, source: str, order: Optional['_OrderBy']) -> str:
+        raise ValueError("Transform cannot be compiled into SQL")
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.__function(df)
+
+
+def _share_database(left: SqlLoader, right: SqlLoader) -> bool:
+    """
+    Checks whether the SQL-queries of two SqlLoaders can be combined into one SQL-query.
+
+    Args:
+        left:   first SqlLoader.
+        right:  second SqlLoader.
+    Returns:
+        Result of checking.
+    """
+    return left is right or (
+        left._context_creator is right._context_creator
+        and left._context_creator_args == right._context_creator_args
+        and dict(left._context_creator_kwargs) == dict(right._context_creator_kwargs)
+        and left._read_sql_fn is right._read_sql_fn
+    )
+
+
+def _validates_nothing(loader: SqlLoader) -> bool:
+    """
+    Checks whether the output validator of the SqlLoader accepts any DataFrame.
+
+    Args:
+        loader:  SqlLoader to check.
+    Returns:
+        Result of checking.
+    """
+    return loader._output_validator == AnyDataFrame
+
+
+class SqlRelation:
+    """
+    Immutable lazy relation over the result of the SQL-query of a SqlLoader.
+    Operations are recorded and compiled into a single SQL-query run by the SqlLoader.
+    Operations that cannot be compiled into SQL, as well as all operations after them, are applied in pandas.
+    The result of the compiled SQL-query is validated by the output validator of the SqlLoader restricted
+    to the selected columns. Aggregations and joins change the values the validator applies to,
+    so they are compiled only if the output validators of the SqlLoaders involved accept any DataFrame.
+    """
+    __slots__ = ('__source', '__operations')
+
+    def __init__(self, source: SqlLoader) -> None:
+        """
+        Immutable lazy relation over the result of the SQL-query of a SqlLoader.
+
+        Args:
+            source:  SqlLoader whose SQL-query to select from.
+        """
+        check_type_compatibility(source, SqlLoader)
+        self.__source = source
+        self.__operations: Tuple[_Operation, ...] = ()
+
+    @final
+    def __with_operation(self, operation: _Operation) -> 'SqlRelation':
+        """
+        Returns new SqlRelation with the operation appended.
+
+        Args:
+            operation:  operation to append.
+        Returns:
+            New SqlRelation.
+        """
+        if isinstance(operation, _Where) and self.compile()[1]:
+            raise ValueError("Raw SQL-predicate cannot follow operations that are applied in pandas")
+        relation = SqlRelation(self.__source)
+        relation.__operations = self.__operations + (operation,)
+        return relation
+
+    @final
+    @property
+    def source(self) -> SqlLoader:
+        """SqlLoader whose SQL-query to select from."""
+        return self.__source
+
+    @final
+    @property
+    def source_loaders(self) -> Tuple[SqlLoader, ...]:
+        """SqlLoaders of the relation and of all joined relations."""
+        loaders: Dict[SqlLoader, None] = {self.__source: None}
+        for operation in self.__operations:
+            if isinstance(operation, _Join):
+                loaders.update(dict.fromkeys(operation.other.source_loaders))
+        return tuple(loaders)
+
+    @final
+    def filter(self, column: str, operator: str, value: Any = None) -> 'SqlRelation':
+        """
+        Keeps the rows where the comparison of the column with the value holds. Rows with NULL values never match.
+
+        Args:
+            column:    column to compare.
+            operator:  one of '=', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'is null', 'is not null'.
+            value:     value to compare with. Sequence of values for 'in' and 'not in'; ignored for null checks.
+        Returns:
+            New SqlRelation.
+        """
+        check_type_compatibility(column, str)
+        check_type_compatibility(operator, str)
+        operator = operator.lower()
+        if operator not in _COMPARISON_OPERATORS:
+            raise ValueError(f"Unknown comparison operator: {operator!r}")
+        if operator in ('in', 'not in'):
+            check_type_compatibility(value, (list, tuple, set, frozenset), 'list, tuple, set or frozenset')
+            value = tuple(value)
+        elif operator in ('is null', 'is not null'):
+            value = None
+        elif value is None:
+            raise ValueError("Use 'is null' or 'is not null' operators to compare with None")
+        return self.__with_operation(_Filter(column, operator, value))
+
+    @final
+    def where(self, predicate: str) -> 'SqlRelation':
+        """
+        Keeps the rows that satisfy raw SQL-predicate. Cannot follow operations that are applied in pandas.
+
+        Args:
+            predicate:  SQL-predicate.
+        Returns:
+            New SqlRelation.
+        """
+        check_type_compatibility(predicate, str)
+        return self.__with_operation(_Where(predicate))
+
+    @final
+    def select(self, *columns: str) -> 'SqlRelation':
+        """
+        Selects the columns in the given order.
+
+        Args:
+            *columns:  columns to select.
+        Returns:
+            New SqlRelation.
+        """
+        if not columns:
+            raise ValueError("At least one column should be selected")
+        return self.__with_operation(_Select(_check_columns(columns, 'columns')))
+
+    @final
+    def aggregate(self, by: Sequence[str] = (), **aggregations: Tuple[str, Any]) -> 'SqlRelation':
+        """
+        Groups the rows by the columns and aggregates the groups like pandas named aggregation.
+        Only 'sum', 'mean', 'min', 'max', 'count', 'nunique' and 'size' are compiled into SQL;
+        other aggregation functions make the aggregation run in pandas. The order of groups is not defined.
+
+        Args:
+            by:              columns to group by. All rows form a single group if empty.
+            **aggregations:  output column -> (input column, aggregation function).
+        Returns:
+            New SqlRelation.
+        """
+        by = _check_columns(by, 'by')
+        if not aggregations:
+            raise ValueError("At least one aggregation should be given")
+        parsed_aggregations = []
+        for name, aggregation in aggregations.items():
+            check_type_compatibility(aggregation, tuple)
+            if len(aggregation) != 2 or not isinstance(aggregation[0], str):
+                raise ValueError(f"Aggregation '{name}' should be a pair (input column, aggregation function)")
+            parsed_aggregations.append((name, aggregation[0], aggregation[1]))
+        return self.__with_operation(_Aggregate(by, tuple(parsed_aggregations)))
+
+    @final
+    def join(self, other: 'SqlRelation', on: Sequence[str], how: str = 'inner') -> 'SqlRelation':
+        """
+        Joins another SqlRelation on equal key columns. Non-key columns of the relations should not intersect.
+        The join is compiled into SQL if the other relation is fully compiled and reads from the same database.
+
+        Args:
+            other:  SqlRelation to join.
+            on:     key columns.
+            how:    'inner' or 'left'.
+        Returns:
+            New SqlRelation.
+        """
+        check_type_compatibility(other, SqlRelation)
+        on = _check_columns(on, 'on')
+        if not on:
+            raise ValueError("At least one key column should be given")
+        if how not in ('inner', 'left'):
+            raise ValueError(f"'how' should be 'inner' or 'left'. Got: {how!r}")
+        return self.__with_operation(_Join(other, on, how))
+
+    @final
+    def order_by(self, *columns: str, ascending: bool = True) -> 'SqlRelation':
+        """
+        Sorts the rows by the columns. The order is kept by subsequent 'filter', 'where' and 'limit' operations,
+        as well as by 'select' operations that keep the sorting columns.
+
+        Args:
+            *columns:   columns to sort by.
+            ascending:  sort direction.
+        Returns:
+            New SqlRelation.
+        """
+        if not columns:
+            raise ValueError("At least one column should be given")
+        check_type_compatibility(ascending, bool)
+        return self.__with_operation(_OrderBy(_check_columns(columns, 'columns'), ascending))
+
+    @final
+    def limit(self, n: int) -> 'SqlRelation':
+        """
+        Keeps the first rows.
+
+        Args:
+            n:  number of rows to keep.
+        Returns:
+            New SqlRelation.
+        """
+        check_type_compatibility(n, int)
+        if n < 0:
+            raise ValueError(f"'n' should be non-negative. Got: {n}")
+        return self.__with_operation(_Limit(n))
+
+    @final
+    def transform(self, function: Callable[[pd.DataFrame], pd.DataFrame]) -> 'SqlRelation':
+        """
+        Applies arbitrary function to the DataFrame. The function and all subsequent operations run in pandas.
+
+        Args:
+            function:  function that transforms DataFrame.
+        Returns:
+            New SqlRelation.
+        """
+        check_type_compatibility(function, _Callable, 'Callable')  # type: ignore
+        return self.__with_operation(_Transform(function))
+
+    @final
+    def __is_pushable(self, operation: _Operation) -> bool:
+        """
+        Checks whether the operation can be compiled into the SQL-query of the relation.
+
+        Args:
+            operation:  operation to check.
+        Returns:
+            Result of checking.
+        """
+        if not operation.pushable:
+            return False
+        if not operation.preserves_values and not _validates_nothing(self.__source):
+            return False
+        if isinstance(operation, _Join):
+            other = operation.other
+            return not other.compile()[1] and all(
+                _share_database(self.__source, loader) and _validates_nothing(loader)
+                for loader in other.source_loaders
+            )
+        return True
+
+    @final
+    def compile(self) -> Tuple[str, Tuple[_Operation, ...]]:
+        """
+        Compiles the longest prefix of the operations that can be run in the database.
+
+        Returns:
+            (SQL-query, operations left to apply in pandas)
+        """
+        sql_query = self.__source.sql_query
+        order: Optional[_OrderBy] = None
+        operations = self.__operations
+        for i, operation in enumerate(operations):
+            if not self.__is_pushable(operation):
+                return sql_query, operations[i:]
+            source = wrap_query(sql_query, f'_pandakeeper_relation_{i}')
+            sql_query = operation.to_sql(source, order)
+            order = operation.next_order(order)
+        return sql_query, ()
+
+    @final
+    def evaluate(self) -> pd.DataFrame:
+        """
+        Runs the compiled SQL-query and applies the remaining operations in pandas.
+        If no operation can be compiled, the data is extracted from the source SqlLoader instead.
+
+        Returns:
+            Resulting DataFrame.
+        """
+        sql_query, remaining_operations = self.compile()
+        operations = self.__operations
+        n_compiled = len(operations) - len(remaining_operations)
+        if n_compiled:
+            df = self.__source._read_sql(sql_query)
+            if all(operation.preserves_values for operation in operations[:n_compiled]):
+                df = self.__validate_compiled(df)
+        else:
+            df = self.__source.extract_data()
+        for operation in remaining_operations:
+            df = operation.apply(df)
+        return df
+
+    @final
+    def __validate_compiled(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Casts the result of the compiled SQL-query that keeps the values of the source SqlLoader
+        to the 'dtype' of its 'read_sql_fn' and validates it by the output validator of the SqlLoader
+        restricted to the columns of the result.
+
+        Args:
+            df:  result of the compiled SQL-query.
+        Returns:
+            Validated DataFrame.
+        """
+        source = self.__source
+        dtype = source._read_sql_kwargs.get('dtype')
+        if isinstance(dtype, Mapping):
+            dtype = {column: column_dtype for column, column_dtype in dtype.items() if column in df.columns}
+        if dtype:
+            df = df.astype(dtype)
+        if _validates_nothing(source):
+            return df
+        validator = source._output_validator
+        validator = validator.select_columns([column for column in validator.columns if column in df.columns])
+        policy = source.validation_policy
+        if policy is None:
+            policy = get_validation_policy()
+        return policy.validate(validator, df)
+
+    @final
+    def _fingerprint_parts(self) -> Tuple[Any, ...]:
+        """
+        Returns values the result of the relation depends on, except the data of the source SqlLoaders.
+
+        Returns:
+            Tuple of values.
+        """
+        return tuple((type(operation).__name__,) + operation.parts for operation in self.__operations)
+
+    def __repr__(self) -> str:
+        operations = ', '.join(map(repr, self.__operations))
+        return f'{type(self).__name__}(source={self.__source}, operations=[{operations}])'
+
+
+class SqlRelationProcessor(DataProcessor):
+    """
+    DataProcessor that evaluates SqlRelation. It reads the result of the compiled SQL-query
+    instead of the data of the SqlLoaders of the relation, so it is not connected to them in the connection graph,
+    and graph executors do not load the whole source tables before running the query.
+    """
+    __slots__ = ('__relation',)
+
+    def __init__(self, relation: SqlRelation, output_validator: DataFrameSchema = AnyDataFrame) -> None:
+        """
+        DataProcessor that evaluates SqlRelation.
+
+        Args:
+            relation:          SqlRelation to evaluate.
+            output_validator:  DataFrameSchema that validates the data coming from the 'extract_data' method.
+        """
+        check_type_compatibility(relation, SqlRelation)
+        super().__init__(output_validator)
+        self.__relation = relation
+
+    @final
+    @property
+    def relation(self) -> SqlRelation:
+        """Evaluated SqlRelation."""
+        return self.__relation
+
+    def _fingerprint_parts(self) -> Optional[Tuple[Any, ...]]:
+        parts = super()._fingerprint_parts()
+        if parts is None:
+            return None
+        relation = self.__relation
+        for loader in relation.source_loaders:
+            loader_fingerprint = loader._fingerprint
+            if loader_fingerprint is None:
+                return None
+            parts += (loader_fingerprint,)
+        return parts + (relation._fingerprint_parts(),)
+
+    def _dump_to_cache(self, data: pd.DataFrame) -> None:
+        warn("'_dump_to_cache' does nothing for SqlRelationProcessor instances", RuntimeWarning)
+
+    def _load_cached(self) -> pd.DataFrame:
+        warn(
+            "'_load_cached' should not be called for SqlRelationProcessor instances. Switch to '_load_non_cached'",
+            RuntimeWarning
+        )
+        return self._load_non_cached()
+
+    @final
+    def _load_non_cached(self) -> pd.DataFrame:
+        return self.__relation.evaluate()
+
+    def _clear_cache_storage(self) -> None:
+        warn("'_clear_cache_storage' does nothing for SqlRelationProcessor instances", RuntimeWarning)
+
+    @property
+    def use_cached(self) -> bool:
+        return False
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
@@ -0,0 +1,80 @@
+from datetime import date, datetime
+from typing import Any, Sequence, Tuple
+
+__all__ = (
+    'quote_identifier',
+    'format_literal',
+    'wrap_query',
+    'range_partitions'
+)
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quotes SQL identifier.
+
+    Args:
+        name:  identifier to quote.
+    Returns:
+        Identifier in double quotes.
+    """
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def format_literal(value: Any) -> str:
+    """
+    Formats Python value as SQL literal.
+
+    Args:
+        value:  None, bool, int, float, str, datetime.date or datetime.datetime.
+    Returns:
+        SQL literal.
+    """
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat(' ') if isinstance(value, datetime) else value.isoformat()
+    if isinstance(value, str):
+        escaped = value.replace("'", "''")
+        return f"'{escaped}'"
+    raise TypeError(f"Cannot format value of type {type(value)} as SQL literal")
+
+
+def wrap_query(sql_query: str, alias: str) -> str:
+    """
+    Wraps SQL-query into a subquery that can be selected from.
+
+    Args:
+        sql_query:  SQL-query to wrap.
+        alias:      alias of the subquery.
+    Returns:
+        Subquery expression.
+    """
+    sql_query = sql_query.strip().rstrip(';')
+    return f'({sql_query}) AS {quote_identifier(alias)}'
+
+
+def range_partitions(column: str, boundaries: Sequence[Any]) -> Tuple[str, ...]:
+    """
+    Makes predicates that split rows by ranges of the column values. The first range includes NULL values.
+
+    Args:
+        column:      name of the column to split by.
+        boundaries:  ascending values that separate the ranges.
+    Returns:
+        Predicates for the 'partition_predicates' argument of SqlLoader, one more than the number of boundaries.
+    """
+    column = quote_identifier(column)
+    if not boundaries:
+        return '1 = 1',
+    literals = tuple(map(format_literal, boundaries))
+    predicates = [f'({column} < {literals[0]} OR {column} IS NULL)']
+    for lower, upper in zip(literals, literals[1:]):
+        predicates.append(f'{column} >= {lower} AND {column} < {upper}')
+    predicates.append(f'{column} >= {literals[-1]}')
+    return tuple(predicates)
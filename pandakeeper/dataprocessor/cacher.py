@@ -1,18 +1,53 @@
-from typing import Optional
+import os
+from abc import abstractmethod
+from collections import OrderedDict, deque
+from os import PathLike
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Lock
+from typing import Optional, Union, List
+from uuid import uuid4
+from weakref import ref, finalize
 
 from pandas import DataFrame
-from typing_extensions import final
+from pandera import DataFrameSchema
+from typing_extensions import final, Final
+from varutils.typing import check_type_compatibility
 
-from pandakeeper.dataprocessor import DataProcessor, NodeConnection
+from pandakeeper.arrow import write_feather, read_feather, write_parquet, read_parquet
+from pandakeeper.dataprocessor import DataProcessor
+from pandakeeper.node import _CacheEvicted
+from pandakeeper.protection import protect_frame, frame_view
+from pandakeeper.validators import AnyDataFrame
 
 __all__ = (
     'DataCacher',
+    'RuntimeCacheManager',
+    'runtime_cache_manager',
     'RuntimeCacher',
+    'FileCacher',
+    'FeatherCacher',
+    'ParquetCacher',
     'SingleInputCacher',
     'SingleInputRuntimeCacher',
+    'SingleInputFeatherCacher',
+    'SingleInputParquetCacher',
 )
 
 
+def _remove_quietly(path: Path) -> None:
+    """
+    Removes the file if it exists. Files that cannot be removed (e.g. memory-mapped ones on Windows) are left.
+
+    Args:
+        path:  path to the file.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class DataCacher(DataProcessor):
     """Abstract DataProcessor that caches input data."""
     __slots__ = ()
@@ -23,48 +58,355 @@ class DataCacher(DataProcessor):
         return True
 
 
+class RuntimeCacheManager:
+    """
+    Class that keeps track of the memory used by RuntimeCacher instances
+    and evicts least recently used caches when the memory budget is exceeded.
+    RuntimeCacher instances are referenced weakly.
+    """
+    __slots__ = (
+        '__lock',
+        '__budget',
+        '__entries',
+        '__collected',
+        '__used_bytes',
+        '__hits',
+        '__misses',
+        '__evictions'
+    )
+
+    def __init__(self, budget: Optional[int] = None) -> None:
+        """
+        Class that keeps track of the memory used by RuntimeCacher instances
+        and evicts least recently used caches when the memory budget is exceeded.
+
+        Args:
+            budget:  maximum number of bytes cached DataFrames can occupy. None means no limit.
+        """
+        self.__lock = Lock()
+        self.__budget: Optional[int] = None
+        self.__entries: 'OrderedDict[ref[RuntimeCacher], int]' = OrderedDict()
+        self.__collected: 'deque[ref[RuntimeCacher]]' = deque()
+        self.__used_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.set_budget(budget)
+
+    @property
+    def budget(self) -> Optional[int]:
+        """Maximum number of bytes cached DataFrames can occupy."""
+        return self.__budget
+
+    @property
+    def used_bytes(self) -> int:
+        """Number of bytes occupied by cached DataFrames."""
+        with self.__lock:
+            self.__forget_collected()
+            return self.__used_bytes
+
+    @property
+    def hits(self) -> int:
+        """Number of loads of cached data."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of dumps of computed data."""
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of caches dropped to stay within the budget."""
+        return self.__evictions
+
+    def reset_counters(self) -> None:
+        """Resets hit, miss and eviction counters."""
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def set_budget(self, budget: Optional[int]) -> 'RuntimeCacheManager':
+        """
+        Sets the memory budget, evicting least recently used caches if it is exceeded.
+
+        Args:
+            budget:  maximum number of bytes cached DataFrames can occupy. None means no limit.
+        Returns:
+            Self instance.
+        """
+        if budget is not None:
+            check_type_compatibility(budget, int)
+            if budget < 0:
+                raise ValueError(f"'budget' should be non-negative. Got: {budget}")
+        with self.__lock:
+            self.__budget = budget
+            self.__forget_collected()
+            victims = self.__pop_victims()
+        self.__evict(victims)
+        return self
+
+    def __forget_collected(self) -> None:
+        """Removes entries of garbage-collected RuntimeCachers. Must be called under the lock."""
+        collected = self.__collected
+        entries = self.__entries
+        while collected:
+            self.__used_bytes -= entries.pop(collected.popleft(), 0)
+
+    def __pop_victims(self, keep: Optional['RuntimeCacher'] = None) -> List['RuntimeCacher']:
+        """
+        Removes least recently used entries until the budget is met. Must be called under the lock.
+
+        Args:
+            keep:  RuntimeCacher that must not be evicted.
+        Returns:
+            RuntimeCachers to evict.
+        """
+        budget = self.__budget
+        victims = []
+        if budget is None:
+            return victims
+        entries = self.__entries
+        for cacher_ref in tuple(entries):
+            if self.__used_bytes <= budget:
+                break
+            cacher = cacher_ref()
+            if cacher is keep:
+                continue
+            self.__used_bytes -= entries.pop(cacher_ref)
+            if cacher is not None:
+                victims.append(cacher)
+        self.__evictions += len(victims)
+        return victims
+
+    @staticmethod
+    def __evict(victims: List['RuntimeCacher']) -> None:
+        """
+        Drops caches of the evicted RuntimeCachers.
+
+        Args:
+            victims:  RuntimeCachers to evict.
+        """
+        for cacher in victims:
+            cacher._evict_cache()
+
+    def _register(self, cacher: 'RuntimeCacher', data: DataFrame) -> None:
+        """
+        Registers the data dumped by the RuntimeCacher.
+
+        Args:
+            cacher:  RuntimeCacher that dumped data.
+            data:    dumped DataFrame.
+        """
+        nbytes = int(data.memory_usage(deep=True).sum())
+        cacher_ref = ref(cacher, self.__collected.append)
+        with self.__lock:
+            self.__forget_collected()
+            entries = self.__entries
+            self.__used_bytes += nbytes - entries.pop(cacher_ref, 0)
+            entries[cacher_ref] = nbytes
+            self.__misses += 1
+            victims = self.__pop_victims(keep=cacher)
+        self.__evict(victims)
+
+    def _touch(self, cacher: 'RuntimeCacher') -> None:
+        """
+        Marks the RuntimeCacher as the most recently used.
+
+        Args:
+            cacher:  RuntimeCacher whose data was loaded.
+        """
+        cacher_ref = ref(cacher)
+        with self.__lock:
+            self.__hits += 1
+            if cacher_ref in self.__entries:
+                self.__entries.move_to_end(cacher_ref)
+
+    def _unregister(self, cacher: 'RuntimeCacher') -> None:
+        """
+        Forgets the data of the RuntimeCacher whose cache storage was cleared.
+
+        Args:
+            cacher:  RuntimeCacher that cleared its cache storage.
+        """
+        cacher_ref = ref(cacher)
+        with self.__lock:
+            self.__used_bytes -= self.__entries.pop(cacher_ref, 0)
+
+
+runtime_cache_manager: Final = RuntimeCacheManager()
+
+
 class RuntimeCacher(DataCacher):
-    """Abstract DataCacher for caching Node outputs to RAM."""
-    __slots__ = ('__dataframe',)
+    """
+    Abstract DataCacher for caching Node outputs to RAM.
+    Cached data is registered with 'runtime_cache_manager' and can be evicted to stay within its budget.
+    """
+    __slots__ = ('__dataframe', '__protect_output')
     __dataframe: Optional[DataFrame]
 
+    def __init__(self, output_validator: DataFrameSchema = AnyDataFrame, *, protect_output: bool = False) -> None:
+        """
+        Abstract DataCacher for caching Node outputs to RAM.
+
+        Args:
+            output_validator:  DataFrameSchema that validates the data coming from the 'extract_data' method.
+            protect_output:    whether consumers get views of the cached DataFrame that cannot modify it,
+                               so that they do not need to copy it defensively. See 'protect_frame'.
+        """
+        check_type_compatibility(protect_output, bool)
+        super().__init__(output_validator)
+        self.__protect_output = protect_output
+
+    @final
+    @property
+    def protect_output(self) -> bool:
+        """Whether consumers get views of the cached DataFrame that cannot modify it."""
+        return self.__protect_output
+
     @final
     def _dump_to_cache(self, data: DataFrame) -> None:
+        if self.__protect_output:
+            data = protect_frame(data)
         self.__dataframe = data
+        runtime_cache_manager._register(self, data)
 
     @final
     def _clear_cache_storage(self) -> None:
         self.__dataframe = None
+        runtime_cache_manager._unregister(self)
 
     @final
     def _load_cached(self) -> DataFrame:
         df = self.__dataframe
         if df is not None:
-            return df
-        raise ValueError("Cannot load non-cached data")
+            runtime_cache_manager._touch(self)
+            return frame_view(df) if self.__protect_output else df
+        # The cache may be evicted by another thread after the Node has checked that it is cached.
+        raise _CacheEvicted("Cannot load non-cached data")
 
 
-class SingleInputCacher(DataCacher):
-    """DataCacher for caching single input Node."""
-    __slots__ = ()
+class FileCacher(DataCacher):
+    """
+    Abstract DataCacher for caching Node outputs to files.
+    The cache file is removed when the DataCacher is garbage-collected.
+    """
+    __slots__ = ('__cache_path',)
+
+    def __init__(self,
+                 output_validator: DataFrameSchema = AnyDataFrame,
+                 *,
+                 cache_dir: Optional[Union[str, PathLike]] = None) -> None:
+        """
+        Abstract DataCacher for caching Node outputs to files.
+
+        Args:
+            output_validator:  DataFrameSchema that validates the data coming from the 'extract_data' method.
+            cache_dir:         directory to store the cache file in.
+                               Defaults to the 'pandakeeper' subdirectory of the system temporary directory.
+        """
+        super().__init__(output_validator)
+        if cache_dir is None:
+            cache_dir = Path(gettempdir()) / 'pandakeeper'
+        else:
+            check_type_compatibility(cache_dir, (str, PathLike), 'str or PathLike')
+            cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        file_name = f'{type(self).__name__}-{self.gateway_id}-{uuid4().hex}{self._cache_file_suffix}'
+        self.__cache_path = cache_path = cache_dir / file_name
+        finalize(self, _remove_quietly, cache_path)
 
     @final
-    def _get_single_node_connection(self) -> NodeConnection:
-        """Returns single NodeConnection."""
-
-        pnc = self.positional_input_nodes
-        nnc = self.named_input_nodes
-        total_dfs = len(nnc) + len(pnc)
-        if total_dfs != 1:
-            raise ValueError(
-                "Cannot be connected to more or less than one Node. "
-                f"Actual number of connections: {total_dfs}"
-            )
+    @property
+    def cache_path(self) -> Path:
+        """Path to the cache file."""
+        return self.__cache_path
+
+    @property
+    @abstractmethod
+    def _cache_file_suffix(self) -> str:
+        """Suffix of the cache file name."""
+
+    @abstractmethod
+    def _write_cache_file(self, data: DataFrame, path: Path) -> None:
+        """
+        Writes data to the cache file.
+
+        Args:
+            data:  DataFrame to write.
+            path:  path to the cache file.
+        """
+
+    @abstractmethod
+    def _read_cache_file(self, path: Path) -> DataFrame:
+        """
+        Reads data from the cache file.
+
+        Args:
+            path:  path to the cache file.
+        Returns:
+            Loaded data.
+        """
+
+    @final
+    def _dump_to_cache(self, data: DataFrame) -> None:
+        self._write_cache_file(data, self.__cache_path)
+
+    @final
+    def _clear_cache_storage(self) -> None:
         try:
-            return pnc[0]
-        except IndexError:
+            os.remove(self.__cache_path)
+        except FileNotFoundError:
             pass
-        return next(iter(nnc.values()))
+
+    @final
+    def _load_cached(self) -> DataFrame:
+        try:
+            return self._read_cache_file(self.__cache_path)
+        except FileNotFoundError:
+            raise ValueError("Cannot load non-cached data") from None
+
+
+class FeatherCacher(FileCacher):
+    """
+    Abstract DataCacher for caching Node outputs to uncompressed Feather files.
+    Cached data is loaded through memory mapping without copying.
+    """
+    __slots__ = ()
+
+    @property
+    def _cache_file_suffix(self) -> str:
+        return '.feather'
+
+    def _write_cache_file(self, data: DataFrame, path: Path) -> None:
+        write_feather(data, path)
+
+    def _read_cache_file(self, path: Path) -> DataFrame:
+        return read_feather(path)
+
+
+class ParquetCacher(FileCacher):
+    """
+    Abstract DataCacher for caching Node outputs to Parquet files.
+    Cached data is loaded through memory mapping.
+    """
+    __slots__ = ()
+
+    @property
+    def _cache_file_suffix(self) -> str:
+        return '.parquet'
+
+    def _write_cache_file(self, data: DataFrame, path: Path) -> None:
+        write_parquet(data, path)
+
+    def _read_cache_file(self, path: Path) -> DataFrame:
+        return read_parquet(path)
+
+
+class SingleInputCacher(DataCacher):
+    """DataCacher for caching single input Node."""
+    __slots__ = ()
 
     @final
     def _load_non_cached(self) -> DataFrame:
@@ -74,3 +416,13 @@ class SingleInputCacher(DataCacher):
 class SingleInputRuntimeCacher(RuntimeCacher, SingleInputCacher):
     """RuntimeCacher for caching single input Node."""
     __slots__ = ()
+
+
+class SingleInputFeatherCacher(FeatherCacher, SingleInputCacher):
+    """FeatherCacher for caching single input Node."""
+    __slots__ = ()
+
+
+class SingleInputParquetCacher(ParquetCacher, SingleInputCacher):
+    """ParquetCacher for caching single input Node."""
+    __slots__ = ()
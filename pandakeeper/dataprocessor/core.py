@@ -1,13 +1,15 @@
 from itertools import chain, repeat
 from types import MappingProxyType
-from typing import Optional, Union, Dict, List, Tuple, Iterator, Iterable, Mapping
+from typing import Optional, Union, Dict, List, Tuple, Iterator, Iterable, Mapping, Any, Hashable, Sequence
 
 import pandas as pd
 from pandera import DataFrameSchema
 from typing_extensions import final
 from varutils.typing import check_type_compatibility
 
-from pandakeeper.node import Node
+from pandakeeper.node import Node, _run_in_executor
+from pandakeeper.profiling import _profile
+from pandakeeper.validation import ValidationPolicy, get_validation_policy
 from pandakeeper.validators import AnyDataFrame
 
 __all__ = (
@@ -18,20 +20,37 @@ __all__ = (
 
 class NodeConnection:
     """Class that encapsulates a connection to an input Node."""
-    __slots__ = ('__node', '__input_validator')
+    __slots__ = ('__node', '__input_validator', '__columns', '__validation_policy', '__validated_once')
 
-    def __init__(self, node: Node, input_validator: DataFrameSchema = AnyDataFrame) -> None:
+    def __init__(self,
+                 node: Node,
+                 input_validator: DataFrameSchema = AnyDataFrame,
+                 *,
+                 columns: Optional[Sequence[Hashable]] = None,
+                 validation_policy: Optional[ValidationPolicy] = None) -> None:
         """
         Class that encapsulates a connection to an input Node.
 
         Args:
-            node:             input Node to connect to.
-            input_validator:  DataFrameSchema that validates the data coming from the input Node.
+            node:               input Node to connect to.
+            input_validator:    DataFrameSchema that validates the data coming from the input Node.
+            columns:            columns of the input data used by the receiving Node. If given, only these columns
+                                are passed to the input validator and the receiving Node.
+            validation_policy:  ValidationPolicy of the input validator.
+                                Defaults to the current ValidationPolicy (see 'validation_scope').
         """
         check_type_compatibility(node, Node)
         check_type_compatibility(input_validator, DataFrameSchema)
+        if columns is not None:
+            check_type_compatibility(columns, (list, tuple), 'list or tuple')
+            columns = tuple(columns)
+        if validation_policy is not None:
+            check_type_compatibility(validation_policy, ValidationPolicy)
         self.__node = node
         self.__input_validator = input_validator
+        self.__columns: Optional[Tuple[Hashable, ...]] = columns
+        self.__validation_policy = validation_policy
+        self.__validated_once = False
 
     @final
     @property
@@ -45,11 +64,111 @@ class NodeConnection:
         """Input validator."""
         return self.__input_validator
 
+    @final
+    @property
+    def columns(self) -> Optional[Tuple[Hashable, ...]]:
+        """Columns of the input data used by the receiving Node or None if they are not declared."""
+        return self.__columns
+
+    @final
+    @property
+    def required_columns(self) -> Optional[Tuple[Hashable, ...]]:
+        """
+        Columns of the input data the receiving Node depends on: the declared columns or, if they are not declared,
+        the columns of the input validator that filters out other columns (strict='filter').
+        None means that all columns are required.
+        """
+        columns = self.__columns
+        if columns is not None:
+            return columns
+        input_validator = self.__input_validator
+        if getattr(input_validator, 'strict', False) != 'filter':
+            return None
+        validator_columns = input_validator.columns
+        if any(column.regex for column in validator_columns.values()):
+            return None
+        return tuple(validator_columns)
+
+    @final
+    @property
+    def validation_policy(self) -> Optional[ValidationPolicy]:
+        """ValidationPolicy of the input validator or None if the current ValidationPolicy is used."""
+        return self.__validation_policy
+
+    @final
+    def __get_validation_policy(self) -> ValidationPolicy:
+        """Returns ValidationPolicy of the input validator."""
+        policy = self.__validation_policy
+        return get_validation_policy() if policy is None else policy
+
     @final
     def extract_data(self) -> pd.DataFrame:
-        """Extracts and validates data from the input Node."""
-        data = self.__node.extract_data()
-        return self.__input_validator.validate(data)
+        """
+        Extracts and validates data from the input Node.
+        Data of cached input Nodes is fully validated only once until their cache is dropped.
+        """
+        columns = self.__columns
+        policy = self.__get_validation_policy()
+        input_validator = self.__input_validator
+        validated_before = self.__validated_once
+        node = self.__node
+        if columns is None:
+            data = node._extract_data_validated_by(input_validator, policy, validated_before)
+        else:
+            data = _profile(
+                node, 'validate_input', policy.validate,
+                input_validator, node.extract_data()[list(columns)], validated_before
+            )
+        if policy._validates_fully(input_validator, validated_before):
+            self.__validated_once = True
+        return data
+
+    @final
+    async def aextract_data(self) -> pd.DataFrame:
+        """Extracts and validates data from the input Node without blocking the event loop."""
+        await self.__node.aextract_data()
+        return await _run_in_executor(self.extract_data)
+
+    @final
+    def _validate_delta(self, delta: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validates the delta of the output of the input Node. Used by 'refresh_incrementally'.
+
+        Args:
+            delta:  rows appended to the output of the input Node.
+        Returns:
+            Validated delta.
+        """
+        columns = self.__columns
+        if columns is not None:
+            delta = delta[list(columns)]
+        return _profile(
+            self.__node, 'validate_input', self.__get_validation_policy().validate, self.__input_validator, delta
+        )
+
+    @final
+    def extract_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Extracts data from the input Node chunk by chunk, validating each chunk.
+
+        Args:
+            chunksize:  number of rows per chunk.
+        Returns:
+            Iterator of validated chunks.
+        """
+        input_validator = self.__input_validator
+        columns = self.__columns
+        policy = self.__get_validation_policy()
+        validated_before = self.__validated_once
+        validates_fully = policy._validates_fully(input_validator, validated_before)
+        node = self.__node
+        for chunk in node.extract_chunks(chunksize):
+            if columns is not None:
+                chunk = chunk[list(columns)]
+            chunk = _profile(node, 'validate_input', policy.validate, input_validator, chunk, validated_before)
+            if validates_fully:
+                self.__validated_once = True
+            yield chunk
 
 
 class DataProcessor(Node):
@@ -71,6 +190,77 @@ class DataProcessor(Node):
         self.__positional_node_connections: List[NodeConnection] = []
         self.__named_node_connections: Dict[str, NodeConnection] = {}
 
+    def _fingerprint_parts(self) -> Optional[Tuple[Any, ...]]:
+        parts = super()._fingerprint_parts()
+        if parts is None:
+            return None
+        connections = chain(
+            zip(repeat(None), self.__positional_node_connections),
+            sorted(self.__named_node_connections.items())
+        )
+        for keyword, node_connection in connections:
+            parent_fingerprint = node_connection.node._fingerprint
+            if parent_fingerprint is None:
+                return None
+            parts += (keyword, node_connection.input_validator, node_connection.columns, parent_fingerprint)
+        return parts
+
+    @final
+    def _get_single_node_connection(self) -> NodeConnection:
+        """Returns single NodeConnection."""
+
+        pnc = self.__positional_node_connections
+        nnc = self.__named_node_connections
+        total_dfs = len(nnc) + len(pnc)
+        if total_dfs != 1:
+            raise ValueError(
+                "Cannot be connected to more or less than one Node. "
+                f"Actual number of connections: {total_dfs}"
+            )
+        try:
+            return pnc[0]
+        except IndexError:
+            pass
+        return next(iter(nnc.values()))
+
+    def _load_non_cached_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Loads raw input data chunk by chunk. Used instead of the '_load_non_cached' by chunk-safe DataProcessors.
+        Streams the single input NodeConnection by default. Should be overridden by chunk-safe DataProcessors
+        that have several input NodeConnections.
+
+        Args:
+            chunksize:  number of rows per chunk.
+        Returns:
+            Iterator of chunks.
+        """
+        return self._get_single_node_connection().extract_chunks(chunksize)
+
+    @property
+    def supports_delta(self) -> bool:
+        """
+        Whether the DataProcessor is chunk-safe, so that the delta of its single input can be transformed alone.
+        DataProcessors with several input NodeConnections should override '_load_delta' to support deltas.
+        """
+        return self.chunk_safe
+
+    def _load_delta(self, deltas: Mapping[Node, pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Loads the delta of the raw input data. Passes the validated delta of the single input Node by default.
+
+        Args:
+            deltas:  deltas of the outputs of the changed parent Nodes.
+        Returns:
+            Delta of the raw input data or None if the DataProcessor has several input NodeConnections.
+        """
+        if len(self.__positional_node_connections) + len(self.__named_node_connections) != 1:
+            return None
+        connection = self._get_single_node_connection()
+        delta = deltas.get(connection.node)
+        if delta is None:
+            return None
+        return connection._validate_delta(delta)
+
     @final
     @property
     def positional_input_nodes(self) -> Tuple[NodeConnection, ...]:
@@ -94,14 +284,14 @@ class DataProcessor(Node):
             node_connection:  Node to connect to or NodeConnection to add.
             keyword:          Optional name of the NodeConnection.
         """
+        named_node_connections = self.__named_node_connections
+        if keyword in named_node_connections:
+            raise KeyError(f"Duplicate name '{keyword}' for named NodeConnection")
+        self._add_edge_to_connection_graph(node_connection.node)
         if keyword is None:
             self.__positional_node_connections.append(node_connection)
         else:
-            named_node_connections = self.__named_node_connections
-            if keyword in named_node_connections:
-                raise KeyError(f"Duplicate name '{keyword}' for named NodeConnection")
             named_node_connections[keyword] = node_connection
-        self._add_edge_to_connection_graph(node_connection.node)
 
     @staticmethod
     def __check_node_connection(node: Union[Node, NodeConnection],
@@ -165,7 +355,8 @@ class DataProcessor(Node):
                             *positional_nodes: Union[Node, NodeConnection],
                             **keyword_nodes: Union[Node, NodeConnection]) -> None:
         """
-        Connects multiple input Nodes.
+        Connects multiple input Nodes. If some of them cannot be connected (e.g. the connection creates a loop),
+        the Nodes connected by the call are disconnected before the exception is propagated.
 
         Args:
             positional_nodes:  positional Nodes to connect or NodeConnections to add.
@@ -181,5 +372,20 @@ class DataProcessor(Node):
                 )
             )
             self.drop_cache()
-            for args in nodes:
-                self.__connect_input_node_body(*args)
+            previous_parents = self._parent_nodes
+            positional_node_connections = self.__positional_node_connections
+            named_node_connections = self.__named_node_connections
+            n_positional = len(positional_node_connections)
+            connected: List[Tuple[NodeConnection, Optional[str]]] = []
+            try:
+                for node_connection, keyword in nodes:
+                    self.__connect_input_node_body(node_connection, keyword)
+                    connected.append((node_connection, keyword))
+            except BaseException:
+                del positional_node_connections[n_positional:]
+                for node_connection, keyword in connected:
+                    if keyword is not None:
+                        del named_node_connections[keyword]
+                for parent_node in {node_connection.node for node_connection, _ in connected} - previous_parents:
+                    self._remove_edge_from_connection_graph(parent_node)
+                raise
@@ -0,0 +1,281 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from contextlib import ExitStack
+from contextvars import copy_context
+from multiprocessing.context import BaseContext
+from typing import Optional, Dict, Set, List, Iterable, FrozenSet
+
+import pandas as pd
+from varutils.typing import check_type_compatibility
+
+from pandakeeper.dataprocessor.cacher import RuntimeCacher
+from pandakeeper.errors import LoopedGraphError
+from pandakeeper.node import Node, evaluation_scope, _evaluation_memo
+from pandakeeper.projection import push_down_projections
+from pandakeeper.transfer import _FrameTransfer, _dump_node, _extract_in_process
+from pandakeeper.validation import get_validation_policy
+
+__all__ = ('GraphExecutor',)
+
+
+class GraphExecutor:
+    """
+    Class that extracts data from a Node, running independent Nodes of its parental graph concurrently.
+    Selected Nodes can run in worker processes, so that CPU-bound transformations are not limited by the GIL.
+    """
+    __slots__ = ('__target_node', '__max_workers', '__project_columns', '__process_nodes', '__max_processes',
+                 '__mp_context', '__release_intermediates', '__evict_runtime_caches')
+
+    def __init__(self,
+                 target_node: Node,
+                 max_workers: Optional[int] = None,
+                 *,
+                 project_columns: bool = False,
+                 process_nodes: Iterable[Node] = (),
+                 max_processes: Optional[int] = None,
+                 mp_context: Optional[BaseContext] = None,
+                 release_intermediates: bool = False,
+                 evict_runtime_caches: bool = False) -> None:
+        """
+        Class that extracts data from a Node, running independent Nodes of its parental graph concurrently.
+        Selected Nodes can run in worker processes, so that CPU-bound transformations are not limited by the GIL.
+
+        Args:
+            target_node:            Node to extract data from.
+            max_workers:            maximum number of threads running Nodes at the same time.
+                                    See concurrent.futures.ThreadPoolExecutor for the default value.
+            project_columns:        whether to restrict DataLoaders to the columns used by their consumers
+                                    while extracting data. See 'push_down_projections'. The projections
+                                    are reset after the run.
+            process_nodes:          Nodes to run in worker processes. Each of them is pickled without its parents,
+                                    whose outputs are passed through uncompressed Arrow IPC files in shared memory
+                                    ('/dev/shm' if available) and memory-mapped without copying. The output is passed
+                                    back the same way and adopted by the Node of the main process, including its cache.
+                                    Requires 'pyarrow'.
+            max_processes:          maximum number of worker processes.
+                                    See concurrent.futures.ProcessPoolExecutor for the default value.
+            mp_context:             multiprocessing context to start worker processes with.
+                                    See concurrent.futures.ProcessPoolExecutor for the default value.
+            release_intermediates:  whether to drop the output of every Node from the evaluation memo as soon as
+                                    all its consumers in the parental graph are done, so that peak memory follows
+                                    the widest set of live outputs instead of their total. Released outputs
+                                    requested again within an outer 'evaluation_scope' are extracted anew.
+            evict_runtime_caches:   whether to evict the caches of RuntimeCachers as well when their outputs
+                                    are released. Requires 'release_intermediates'.
+        """
+        check_type_compatibility(target_node, Node)
+        check_type_compatibility(project_columns, bool)
+        if max_workers is not None:
+            check_type_compatibility(max_workers, int)
+            if max_workers <= 0:
+                raise ValueError(f"'max_workers' should be positive. Got: {max_workers}")
+        process_nodes = frozenset(process_nodes)
+        for node in process_nodes:
+            check_type_compatibility(node, Node)
+        if max_processes is not None:
+            check_type_compatibility(max_processes, int)
+            if max_processes <= 0:
+                raise ValueError(f"'max_processes' should be positive. Got: {max_processes}")
+        if mp_context is not None:
+            check_type_compatibility(mp_context, BaseContext)
+        check_type_compatibility(release_intermediates, bool)
+        check_type_compatibility(evict_runtime_caches, bool)
+        if evict_runtime_caches and not release_intermediates:
+            raise ValueError("'evict_runtime_caches' requires 'release_intermediates'")
+        self.__target_node = target_node
+        self.__max_workers = max_workers
+        self.__project_columns = project_columns
+        self.__process_nodes = process_nodes
+        self.__max_processes = max_processes
+        self.__mp_context = mp_context
+        self.__release_intermediates = release_intermediates
+        self.__evict_runtime_caches = evict_runtime_caches
+
+    @property
+    def target_node(self) -> Node:
+        """Node to extract data from."""
+        return self.__target_node
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Maximum number of threads running Nodes at the same time."""
+        return self.__max_workers
+
+    @property
+    def project_columns(self) -> bool:
+        """Whether DataLoaders are restricted to the columns used by their consumers."""
+        return self.__project_columns
+
+    @property
+    def process_nodes(self) -> FrozenSet[Node]:
+        """Nodes that run in worker processes."""
+        return self.__process_nodes
+
+    @property
+    def max_processes(self) -> Optional[int]:
+        """Maximum number of worker processes."""
+        return self.__max_processes
+
+    @property
+    def release_intermediates(self) -> bool:
+        """Whether outputs are dropped from the evaluation memo as soon as all their consumers are done."""
+        return self.__release_intermediates
+
+    @property
+    def evict_runtime_caches(self) -> bool:
+        """Whether the caches of RuntimeCachers are evicted when their outputs are released."""
+        return self.__evict_runtime_caches
+
+    def __release(self, node: Node, outputs: Dict[Node, pd.DataFrame]) -> None:
+        """
+        Releases the output of the Node whose consumers are all done.
+
+        Args:
+            node:     Node to release the output of.
+            outputs:  outputs of the already run Nodes.
+        """
+        outputs.pop(node, None)
+        if self.__evict_runtime_caches and isinstance(node, RuntimeCacher):
+            node._evict_cache()
+
+    @staticmethod
+    def __extract_in_process(node: Node,
+                             outputs: Dict[Node, pd.DataFrame],
+                             process_pool: ProcessPoolExecutor,
+                             transfer: _FrameTransfer) -> pd.DataFrame:
+        """
+        Extracts data from the Node in a worker process. Runs in a thread of the executor.
+
+        Args:
+            node:          Node to extract data from.
+            outputs:       outputs of the already run Nodes, including all parents of the Node.
+            process_pool:  pool of worker processes.
+            transfer:      _FrameTransfer to pass DataFrames through.
+        Returns:
+            Output of the Node backed by shared memory.
+        """
+        input_paths = {parent.gateway_id: transfer.export(parent, outputs[parent]) for parent in node._parent_nodes}
+        process_pool.submit(
+            _extract_in_process, _dump_node(node), input_paths, transfer.get_output_path(node), get_validation_policy()
+        ).result()
+        data = transfer.adopt(node)
+        node._adopt_output(data)
+        return data
+
+    def _plan(self, outputs: Dict[Node, pd.DataFrame]) -> Dict[Node, Set[Node]]:
+        """
+        Collects the part of the parental graph that has to be run to extract data from the target Node.
+        Already cached or already evaluated Nodes are not expanded, since they do not need their parents.
+
+        Args:
+            outputs:  outputs already evaluated in the current evaluation scope.
+        Returns:
+            Mapping from each Node to run to its parents that have to be run before it.
+        """
+        plan: Dict[Node, Set[Node]] = {}
+        nodes_to_visit = [self.__target_node]
+        while nodes_to_visit:
+            cur_node = nodes_to_visit.pop()
+            if cur_node in plan:
+                continue
+            if cur_node.already_cached or cur_node in outputs:
+                parents = set()
+            else:
+                parents = set(cur_node._parent_nodes)
+            plan[cur_node] = parents
+            nodes_to_visit.extend(parents)
+        return plan
+
+    def extract_data(self) -> pd.DataFrame:
+        """
+        Extracts data from the target Node. Every Node of the parental graph is run as soon as all its parents
+        are done, and its output is passed to its consumers instead of being extracted again.
+        If called within 'evaluation_scope', outputs are shared with the scope.
+
+        Returns:
+            Extracted DataFrame.
+        """
+        outputs = _evaluation_memo.get()
+        if outputs is None:
+            with evaluation_scope():
+                return self.extract_data()
+        if not self.__project_columns:
+            return self.__run(outputs)
+        projections = push_down_projections(self.__target_node)
+        try:
+            return self.__run(outputs)
+        finally:
+            # Projections only hold for this run: later consumers and extractions get all columns.
+            for loader, projection in projections.items():
+                if projection is not None:
+                    outputs.pop(loader, None)
+                    loader._set_projection(None)
+
+    def __run(self, outputs: Dict[Node, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Runs the parental graph of the target Node. See the 'extract_data' method.
+
+        Args:
+            outputs:  outputs of the Nodes evaluated in the current evaluation scope.
+        Returns:
+            Extracted DataFrame.
+        """
+        plan = self._plan(outputs)
+        consumers: Dict[Node, List[Node]] = {node: [] for node in plan}
+        pending_parents: Dict[Node, int] = {}
+        for node, parents in plan.items():
+            pending_parents[node] = len(parents)
+            for parent in parents:
+                consumers[parent].append(node)
+        pending_consumers: Optional[Dict[Node, int]] = None
+        if self.__release_intermediates:
+            pending_consumers = {node: len(node_consumers) for node, node_consumers in consumers.items()}
+
+        process_nodes = self.__process_nodes.intersection(
+            node for node in plan if not node.already_cached and node not in outputs
+        )
+        with ExitStack() as stack:
+            if process_nodes:
+                process_pool = stack.enter_context(ProcessPoolExecutor(self.__max_processes, self.__mp_context))
+                transfer = _FrameTransfer()
+                stack.callback(transfer.close)
+            pool = stack.enter_context(ThreadPoolExecutor(self.__max_workers))
+            running: Dict[Future, Node] = {}
+
+            def submit(node_to_run: Node) -> None:
+                if node_to_run in process_nodes:
+                    future = pool.submit(
+                        copy_context().run, GraphExecutor.__extract_in_process,
+                        node_to_run, outputs, process_pool, transfer
+                    )
+                else:
+                    future = pool.submit(copy_context().run, node_to_run.extract_data)
+                running[future] = node_to_run
+
+            for node, count in pending_parents.items():
+                if not count:
+                    submit(node)
+            if not running:
+                raise LoopedGraphError(f"Parental graph of Node {self.__target_node} has loops")
+            try:
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = running.pop(future)
+                        outputs[node] = future.result()
+                        for consumer in consumers[node]:
+                            pending_parents[consumer] -= 1
+                            if not pending_parents[consumer]:
+                                submit(consumer)
+                        if pending_consumers is not None:
+                            for parent in plan[node]:
+                                pending_consumers[parent] -= 1
+                                if not pending_consumers[parent] and parent is not self.__target_node:
+                                    self.__release(parent, outputs)
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+        try:
+            return outputs[self.__target_node]
+        except KeyError:
+            raise LoopedGraphError(f"Parental graph of Node {self.__target_node} has loops") from None
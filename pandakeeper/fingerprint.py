@@ -0,0 +1,199 @@
+import inspect
+import os
+from collections.abc import Mapping as _Mapping
+from hashlib import sha256
+from os import PathLike
+from types import FunctionType, MethodType, BuiltinFunctionType, CodeType
+from typing import Any, Optional, List, Set, Tuple
+from weakref import WeakKeyDictionary
+
+import pandas as pd
+from pandera import DataFrameSchema, SeriesSchema, Column, Index, MultiIndex, Check
+
+__all__ = ('make_fingerprint',)
+
+_CONSTANT_TYPES = (bool, int, float, complex, str, bytes, PathLike)
+_SCHEMA_TYPES = (DataFrameSchema, SeriesSchema, Column, Index, MultiIndex, Check)
+_class_encodings: 'WeakKeyDictionary[type, Tuple[str, ...]]' = WeakKeyDictionary()
+
+
+class _NotFingerprintable(Exception):
+    """Throws when the value cannot be represented by a fingerprint stable across processes."""
+    __slots__ = ()
+
+
+def _encode_code(code: CodeType, parts: List[str], names: Optional[Set[str]] = None) -> None:
+    """
+    Encodes code object together with its nested code objects.
+
+    Args:
+        code:   code object to encode.
+        parts:  list to append encoded parts to.
+        names:  set to add the names used by the code objects to.
+    """
+    parts.append(code.co_code.hex())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _encode_code(const, parts, names)
+        else:
+            parts.append(repr(const))
+    parts.append(repr(code.co_names))
+    if names is not None:
+        names.update(code.co_names)
+
+
+def _encode_class(cls: type, parts: List[str]) -> None:
+    """
+    Encodes class by its name and the source code of all classes of its MRO, so that changes of base classes
+    change the encoding as well. Module-level functions called by the methods are not encoded.
+    Encodings are memoized per class, since source code does not change within a process.
+
+    Args:
+        cls:    class to encode.
+        parts:  list to append encoded parts to.
+    """
+    encoded = _class_encodings.get(cls)
+    if encoded is None:
+        class_parts = [f'class:{cls.__module__}.{cls.__qualname__}']
+        for base in cls.__mro__:
+            if base.__module__ == 'builtins':
+                continue
+            class_parts.append(f'base:{base.__module__}.{base.__qualname__}')
+            try:
+                class_parts.append(inspect.getsource(base))
+            except (OSError, TypeError):
+                for name, attr in sorted(vars(base).items()):
+                    if isinstance(attr, (staticmethod, classmethod)):
+                        attr = attr.__func__
+                    elif isinstance(attr, property):
+                        attr = attr.fget
+                    if isinstance(attr, FunctionType):
+                        class_parts.append(name)
+                        _encode_code(attr.__code__, class_parts)
+        encoded = _class_encodings[cls] = tuple(class_parts)
+    parts.extend(encoded)
+
+
+def _encode_function(func: FunctionType, parts: List[str], active: Set[int]) -> None:
+    """
+    Encodes function by its name, byte code, defaults, closure cell contents
+    and the values of the global constants it refers to.
+
+    Args:
+        func:    function to encode.
+        parts:   list to append encoded parts to.
+        active:  IDs of the functions being encoded, so that recursive references are encoded by name.
+    """
+    parts.append(f'function:{func.__module__}.{func.__qualname__}')
+    if id(func) in active:
+        return
+    active.add(id(func))
+    names: Set[str] = set()
+    _encode_code(func.__code__, parts, names)
+    _encode(func.__defaults__, parts, active)
+    _encode(func.__kwdefaults__, parts, active)
+    closure = func.__closure__ or ()
+    parts.append(f'closure:{len(closure)}')
+    for cell in closure:
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            raise _NotFingerprintable from None
+        _encode(contents, parts, active)
+    func_globals = func.__globals__
+    for name in sorted(names):
+        value = func_globals.get(name)
+        # Only constants are encoded: functions and objects referred to globally are usually library internals.
+        if isinstance(value, _CONSTANT_TYPES):
+            parts.append(f'global:{name}')
+            _encode(value, parts, active)
+    active.discard(id(func))
+
+
+def _encode_path(path: str, parts: List[str]) -> None:
+    """
+    Encodes file path by its name, modification time and size.
+
+    Args:
+        path:   path to encode.
+        parts:  list to append encoded parts to.
+    """
+    stat = os.stat(path)
+    parts.append(f'file:{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}')
+
+
+def _encode(value: Any, parts: List[str], active: Optional[Set[int]] = None) -> None:
+    """
+    Encodes value as a sequence of strings that only depends on its content.
+
+    Args:
+        value:   value to encode.
+        parts:   list to append encoded parts to.
+        active:  IDs of the functions being encoded. See '_encode_function'.
+    """
+    if active is None:
+        active = set()
+    if value is None or isinstance(value, (bool, int, float, complex, bytes)):
+        parts.append(f'{type(value).__name__}:{value!r}')
+    elif isinstance(value, str):
+        parts.append(f'str:{value!r}')
+        if os.path.isfile(value):
+            _encode_path(value, parts)
+    elif isinstance(value, PathLike):
+        path = os.fspath(value)
+        parts.append(f'path:{path!r}')
+        if os.path.isfile(path):
+            _encode_path(path, parts)
+    elif isinstance(value, (tuple, list)):
+        parts.append(f'{type(value).__name__}:{len(value)}')
+        for item in value:
+            _encode(item, parts, active)
+    elif isinstance(value, _Mapping):
+        parts.append(f'mapping:{len(value)}')
+        for key, item in sorted(value.items(), key=lambda kv: repr(kv[0])):
+            _encode(key, parts, active)
+            _encode(item, parts, active)
+    elif isinstance(value, type):
+        _encode_class(value, parts)
+    elif isinstance(value, MethodType):
+        _encode(value.__func__, parts, active)
+    elif isinstance(value, FunctionType):
+        _encode_function(value, parts, active)
+    elif isinstance(value, BuiltinFunctionType):
+        parts.append(f'builtin:{value.__module__}.{value.__qualname__}')
+    elif isinstance(value, _SCHEMA_TYPES):
+        # The reprs of schemas omit checks, coercion and nullability, so schemas are encoded by all attributes.
+        parts.append(f'schema:{type(value).__module__}.{type(value).__qualname__}')
+        _encode(vars(value), parts, active)
+    elif isinstance(value, pd.DataFrame):
+        parts.append(f'dataframe:{list(map(repr, value.columns))}:{list(map(str, value.dtypes))}')
+        parts.append(sha256(pd.util.hash_pandas_object(value, index=True).values.tobytes()).hexdigest())
+    else:
+        if type(value).__repr__ is object.__repr__:
+            raise _NotFingerprintable
+        encoded = repr(value)
+        if ' at 0x' in encoded:
+            raise _NotFingerprintable
+        parts.append(f'{type(value).__module__}.{type(value).__qualname__}:{encoded}')
+
+
+def make_fingerprint(*values: Any) -> Optional[str]:
+    """
+    Makes a fingerprint of the values that stays the same across processes as long as the values do not change.
+    Files referred to by string or PathLike values are fingerprinted by path, modification time and size.
+    Classes are fingerprinted by the source code of their MRO. Functions are fingerprinted by their byte code,
+    defaults, closure cell contents and the global constants they refer to, so that functions that cannot be
+    fingerprinted by content (e.g. closures over DB-connections) make the whole fingerprint None.
+    Module-level functions called by the methods of classes are not fingerprinted.
+
+    Args:
+        *values:  values to fingerprint.
+    Returns:
+        Hexadecimal SHA-256 digest or None if some of the values cannot be fingerprinted.
+    """
+    parts: List[str] = []
+    try:
+        _encode(values, parts)
+    except (_NotFingerprintable, OSError):
+        return None
+    return sha256('\x00'.join(parts).encode()).hexdigest()
@@ -0,0 +1,70 @@
+from typing import Optional, Dict, Set, List
+
+import pandas as pd
+from varutils.typing import check_type_compatibility
+
+from pandakeeper.node import Node
+
+__all__ = ('refresh_incrementally',)
+
+
+def refresh_incrementally(target_node: Node) -> Dict[Node, Optional[int]]:
+    """
+    Brings the caches of the parental graph of the target Node up to date with the rows appended
+    to its append-only data sources, processing only these rows where possible.
+    Every DataLoader that supports deltas (e.g. incremental CsvLoader or SqlLoader with 'watermark_column')
+    loads the rows appended since its last load. The deltas are propagated in topological order through
+    the Nodes that support deltas (e.g. chunk-safe DataProcessors with a single input), which transform
+    and validate only the delta and merge it into their cache (see 'merge_delta').
+    The caches of all other Nodes reached by a delta are dropped, so that they are recomputed
+    from scratch by the next extraction. Outputs memoized by an enclosing 'evaluation_scope' are not updated.
+    Deltas of non-cached DataLoaders are relative to their last load, so they should be loaded
+    only by the extractions of the parental graph.
+
+    Args:
+        target_node:  Node whose parental graph to refresh.
+    Returns:
+        Mapping from every Node reached by a delta to the number of rows appended to its output
+        or None if it is to be recomputed.
+    """
+    check_type_compatibility(target_node, Node)
+    nodes: List[Node] = []
+    visited_nodes: Set[Node] = {target_node}
+    nodes_to_visit = [target_node]
+    while nodes_to_visit:
+        cur_node = nodes_to_visit.pop()
+        nodes.append(cur_node)
+        for parent in cur_node._parent_nodes:
+            if parent not in visited_nodes:
+                visited_nodes.add(parent)
+                nodes_to_visit.append(parent)
+    nodes.sort(key=lambda node: node._topological_index)
+
+    deltas: Dict[Node, pd.DataFrame] = {}
+    refreshed: Dict[Node, Optional[int]] = {}
+    for node in nodes:
+        parents = node._parent_nodes
+        if any(refreshed.get(parent, 0) is None for parent in parents):
+            node.drop_cache()
+            refreshed[node] = None
+            continue
+        parent_deltas = {parent: deltas[parent] for parent in parents if parent in deltas}
+        if parents and not parent_deltas:
+            continue
+        if not node.supports_delta:
+            if parent_deltas:
+                node.drop_cache()
+                refreshed[node] = None
+            continue
+        loaded = node._load_delta(parent_deltas)
+        if loaded is None:
+            node.drop_cache()
+            refreshed[node] = None
+            continue
+        if loaded.empty:
+            continue
+        delta = node._apply_delta(loaded)
+        refreshed[node] = len(delta)
+        if not delta.empty:
+            deltas[node] = delta
+    return refreshed
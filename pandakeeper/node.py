@@ -1,7 +1,11 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
-from typing import Dict, Set
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from itertools import chain
+from typing import Dict, Set, Optional, FrozenSet, Iterator, List, Tuple, Any, Callable, TypeVar, Mapping
 from warnings import warn
+from weakref import WeakKeyDictionary, WeakSet
 
 import pandas as pd
 from pandera import DataFrameSchema
@@ -9,17 +13,127 @@ from typing_extensions import final
 from varutils.typing import check_type_compatibility
 
 from pandakeeper.errors import LoopedGraphError
-
-__all__ = ('Node',)
+from pandakeeper.fingerprint import make_fingerprint
+from pandakeeper.persistence import get_persistent_store
+from pandakeeper.profiling import _profile, _set_cache_status, get_profiler
+from pandakeeper.validation import ValidationPolicy, get_validation_policy
+from pandakeeper.validators import is_data_preserving
+
+__all__ = (
+    'Node',
+    'evaluation_scope',
+    'streaming_scope'
+)
+
+_evaluation_memo: 'ContextVar[Optional[Dict[Node, pd.DataFrame]]]' = ContextVar('_evaluation_memo', default=None)
+_fingerprint_memo: 'ContextVar[Optional[Dict[Node, Optional[str]]]]' = ContextVar('_fingerprint_memo', default=None)
+
+
+_T = TypeVar('_T')
+
+
+class _CacheEvicted(ValueError):
+    """Throws when the cache of the Node is evicted by another thread after the Node was found cached."""
+    __slots__ = ()
+
+
+async def _run_in_executor(fn: Callable[..., _T], *args: Any) -> _T:
+    """
+    Runs blocking function in the default executor of the running event loop, preserving context variables.
+
+    Args:
+        fn:     function to run.
+        *args:  positional arguments of the function.
+    Returns:
+        The result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, copy_context().run, fn, *args)
+
+
+_streaming_chunksize: 'ContextVar[Optional[int]]' = ContextVar('_streaming_chunksize', default=None)
+
+
+def _check_chunksize(chunksize: int) -> None:
+    """
+    Checks that chunksize is a positive integer.
+
+    Args:
+        chunksize:  number of rows per chunk.
+    """
+    check_type_compatibility(chunksize, int)
+    if chunksize <= 0:
+        raise ValueError(f"'chunksize' should be positive. Got: {chunksize}")
+
+
+def _iter_slices(data: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Splits DataFrame into chunks. Empty DataFrames are yielded as a single empty chunk.
+
+    Args:
+        data:       DataFrame to split.
+        chunksize:  number of rows per chunk.
+    Returns:
+        Iterator of chunks.
+    """
+    for start in range(0, max(len(data), 1), chunksize):
+        yield data.iloc[start:start + chunksize]
+
+
+@contextmanager
+def streaming_scope(chunksize: int) -> Iterator[None]:
+    """
+    Context manager within which chunk-safe Nodes load, transform and concatenate their data chunk by chunk,
+    so that the whole input is materialized only by the Nodes that need the full DataFrame.
+
+    Args:
+        chunksize:  number of rows per chunk.
+    """
+    _check_chunksize(chunksize)
+    token = _streaming_chunksize.set(chunksize)
+    try:
+        yield
+    finally:
+        _streaming_chunksize.reset(token)
+
+
+@contextmanager
+def evaluation_scope() -> Iterator[None]:
+    """
+    Context manager within which the output of every Node is computed at most once.
+    Outputs are memoized for the duration of the scope only and are freed when it exits.
+    Nested scopes share the memo of the outermost one.
+    """
+    if _evaluation_memo.get() is not None:
+        yield
+        return
+    token = _evaluation_memo.set({})
+    try:
+        yield
+    finally:
+        _evaluation_memo.reset(token)
 
 
 class Node(metaclass=ABCMeta):
-    """Abstract class that defines an interface common to all data manipulators."""
-
-    __slots__ = ('__gateway_id', '__already_cached', '__output_validator')
+    """
+    Abstract class that defines an interface common to all data manipulators.
+    The connection graph references Nodes weakly, so unreachable Nodes are garbage-collected with their caches.
+    """
+
+    __slots__ = (
+        '__gateway_id',
+        '__topo_index',
+        '__already_cached',
+        '__output_validator',
+        '__cached_output_validator',
+        '__validation_memo',
+        '__validation_policy',
+        '__validated_once',
+        '__weakref__'
+    )
     __instance_counter = 0
-    __parental_graph: Dict['Node', Set['Node']] = defaultdict(set)
-    __children_graph: Dict['Node', Set['Node']] = defaultdict(set)
+    __parental_graph: 'WeakKeyDictionary[Node, Set[Node]]' = WeakKeyDictionary()
+    __children_graph: 'WeakKeyDictionary[Node, WeakSet[Node]]' = WeakKeyDictionary()
 
     def __init__(self, output_validator: DataFrameSchema) -> None:
         """
@@ -31,8 +145,13 @@ class Node(metaclass=ABCMeta):
         check_type_compatibility(output_validator, DataFrameSchema)
         self.__gateway_id = Node.__instance_counter
         Node.__instance_counter += 1
+        self.__topo_index = self.__gateway_id
         self.__already_cached = False
         self.__output_validator = output_validator
+        self.__cached_output_validator: Optional[DataFrameSchema] = None
+        self.__validation_memo: Dict[int, Tuple[DataFrameSchema, Optional[pd.DataFrame]]] = {}
+        self.__validation_policy: Optional[ValidationPolicy] = None
+        self.__validated_once = False
 
     @final
     def __hash__(self) -> int:
@@ -58,34 +177,140 @@ class Node(metaclass=ABCMeta):
     def _is_parental_graph_topo_sorted(self) -> bool:
         """
         Checks whether parental graph is topologically sorted.
+        The connection graph keeps a topological order of its Nodes and rejects edges that create loops,
+        so the check takes O(1).
 
         Returns:
             Result of checking.
         """
-        connection_graph = Node.__parental_graph
+        return True
 
-        visited_nodes = {self}
-        nodes_to_visit = connection_graph[self].copy()
+    @final
+    @property
+    def _fingerprint(self) -> Optional[str]:
+        """
+        Returns fingerprint of the Node that identifies its output across processes.
+        Fingerprints of the parental graph are memoized while the outermost fingerprint is computed,
+        so that every Node is fingerprinted once however many paths lead to it.
+
+        Returns:
+            Hexadecimal digest or None if the Node cannot be fingerprinted.
+        """
+        memo = _fingerprint_memo.get()
+        if memo is None:
+            token = _fingerprint_memo.set({})
+            try:
+                return self._fingerprint
+            finally:
+                _fingerprint_memo.reset(token)
         try:
-            while True:
-                cur_node = nodes_to_visit.pop()
-                if cur_node in visited_nodes:
-                    return False
-                visited_nodes.add(cur_node)
-                nodes_to_visit |= connection_graph[cur_node]
+            return memo[self]
         except KeyError:
-            return True
+            pass
+        parts = self._fingerprint_parts()
+        fingerprint = None if parts is None else make_fingerprint(*parts)
+        memo[self] = fingerprint
+        return fingerprint
+
+    def _fingerprint_parts(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Returns values the output of the Node depends on. Used by the '_fingerprint' property.
+        Subclasses should extend the result of the parent method.
+
+        Returns:
+            Tuple of values or None if the output of the Node cannot be fingerprinted.
+        """
+        return type(self), self.__output_validator
+
+    @final
+    @property
+    def _topological_index(self) -> int:
+        """
+        Returns the position of self in the topological order of the connection graph.
+        Every parent Node has a lower index than all its children.
+        """
+        return self.__topo_index
+
+    @staticmethod
+    def __reorder_connection_graph(child_node: 'Node', parent_node: 'Node') -> None:
+        """
+        Restores the topological order of the connection graph before adding edge {Child <- Parent}
+        (Pearce-Kelly dynamic topological sort). Only Nodes between the two in the current order are touched.
+
+        Args:
+            child_node:   child Node of the edge to add.
+            parent_node:  parent Node of the edge to add.
+        """
+        lower_bound = child_node.__topo_index
+        upper_bound = parent_node.__topo_index
+
+        children_graph = Node.__children_graph
+        forward_nodes: List[Node] = []
+        visited_nodes = {child_node}
+        nodes_to_visit = [child_node]
+        while nodes_to_visit:
+            cur_node = nodes_to_visit.pop()
+            forward_nodes.append(cur_node)
+            for child in children_graph.get(cur_node, ()):
+                if child is parent_node:
+                    raise LoopedGraphError(f"Connecting {child_node} to {parent_node} creates a loop")
+                if child not in visited_nodes and child.__topo_index < upper_bound:
+                    visited_nodes.add(child)
+                    nodes_to_visit.append(child)
+
+        parental_graph = Node.__parental_graph
+        backward_nodes: List[Node] = []
+        visited_nodes = {parent_node}
+        nodes_to_visit = [parent_node]
+        while nodes_to_visit:
+            cur_node = nodes_to_visit.pop()
+            backward_nodes.append(cur_node)
+            for parent in parental_graph.get(cur_node, ()):
+                if parent not in visited_nodes and parent.__topo_index > lower_bound:
+                    visited_nodes.add(parent)
+                    nodes_to_visit.append(parent)
+
+        def get_topo_index(node: Node) -> int:
+            return node.__topo_index
+
+        forward_nodes.sort(key=get_topo_index)
+        backward_nodes.sort(key=get_topo_index)
+        reordered_nodes = tuple(chain(backward_nodes, forward_nodes))
+        free_indices = sorted(map(get_topo_index, reordered_nodes))
+        for node, topo_index in zip(reordered_nodes, free_indices):
+            node.__topo_index = topo_index
+
+    @final
+    @property
+    def _parent_nodes(self) -> FrozenSet['Node']:
+        """Returns parent Nodes of self in the connection graph."""
+        return frozenset(Node.__parental_graph.get(self, ()))
+
+    @final
+    @property
+    def _child_nodes(self) -> FrozenSet['Node']:
+        """Returns child Nodes of self in the connection graph."""
+        return frozenset(Node.__children_graph.get(self, ()))
 
     @final
     def _add_edge_to_connection_graph(self, parent_node: 'Node') -> None:
         """
-        Adds directed edge {Self <- Parent} to the connection graph.
+        Adds directed edge {Self <- Parent} to the connection graph, keeping its topological order.
 
         Args:
             parent_node:  parent Node to connect self Node to.
+        Raises:
+            LoopedGraphError: if the edge creates a loop.
         """
-        Node.__parental_graph[self].add(parent_node)
-        Node.__children_graph[parent_node].add(self)
+        if parent_node is self:
+            raise LoopedGraphError(f"Node {self} cannot be connected to itself")
+        if self.__topo_index < parent_node.__topo_index:
+            Node.__reorder_connection_graph(self, parent_node)
+        Node.__parental_graph.setdefault(self, set()).add(parent_node)
+        children = Node.__children_graph.get(parent_node)
+        if children is None:
+            children = Node.__children_graph[parent_node] = WeakSet()
+        children.add(self)
 
     @final
     def _remove_edge_from_connection_graph(self, parent_node: 'Node') -> None:
@@ -95,8 +320,8 @@ class Node(metaclass=ABCMeta):
         Args:
             parent_node:  parent Node to untie self Node from.
         """
-        Node.__parental_graph[self].remove(parent_node)
-        Node.__children_graph[parent_node].remove(self)
+        Node.__parental_graph.get(self, set()).remove(parent_node)
+        Node.__children_graph.get(parent_node, set()).remove(self)
 
     @final
     @property
@@ -111,73 +336,355 @@ class Node(metaclass=ABCMeta):
         return self.__gateway_id
 
     @final
-    def __make_node_cached(self) -> None:
-        """Supplemental method for the 'make_node_cached' method."""
-        data = self._load_non_cached()
-        data = self.transform_data(data)
-        data = self.__output_validator.validate(data)
-        self._dump_to_cache(data)
+    def __validate_output(self, data: pd.DataFrame, validated_before: Optional[bool] = None) -> pd.DataFrame:
+        """
+        Validates data by the output validator according to the validation policy of the Node.
+        The Node counts as validated only once the whole data is checked, so that passes limited by
+        the policy (e.g. 'head' or 'off') do not make 'first_run' mode skip validation later.
+
+        Args:
+            data:              DataFrame to validate.
+            validated_before:  whether the Node has already validated data. Defaults to the state of the Node.
+        Returns:
+            Validated DataFrame.
+        """
+        policy = self.__validation_policy
+        if policy is None:
+            policy = get_validation_policy()
+        if validated_before is None:
+            validated_before = self.__validated_once
+        output_validator = self.__output_validator
+        data = _profile(self, 'validate_output', policy.validate, output_validator, data, validated_before)
+        if policy._validates_fully(output_validator, validated_before):
+            self.__validated_once = True
+        return data
+
+    @final
+    def __dump_validated(self, data: pd.DataFrame) -> None:
+        """
+        Dumps data validated by the current output validator to cache.
+
+        Args:
+            data: DataFrame to dump.
+        """
+        _profile(self, 'dump_cache', self._dump_to_cache, data)
         self.__already_cached = True
+        self.__cached_output_validator = self.__output_validator
+        self.__validation_memo.clear()
+
+    @final
+    def __clear_cache(self) -> None:
+        """Clears cache storage together with the memoized validation results."""
+        self._clear_cache_storage()
+        self.__already_cached = False
+        self.__cached_output_validator = None
+        self.__validation_memo.clear()
+
+    @final
+    def __compute(self, loaded: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Loads, transforms and validates data without using the cache.
+        Within 'streaming_scope' chunk-safe Nodes transform their data chunk by chunk.
+
+        Args:
+            loaded:  already loaded raw input data to use instead of calling '_load_non_cached'.
+        Returns:
+            Validated DataFrame.
+        """
+        chunksize = _streaming_chunksize.get()
+        if loaded is not None:
+            data = _profile(self, 'transform', self.transform_data, loaded)
+        elif chunksize is not None and self.chunk_safe:
+            chunks = [
+                _profile(self, 'transform', self.transform_data, chunk)
+                for chunk in self._load_non_cached_chunks(chunksize)
+            ]
+            if chunks:
+                data = pd.concat(chunks)
+            else:
+                data = _profile(self, 'transform', self.transform_data, _profile(self, 'load', self._load_non_cached))
+        else:
+            data = _profile(self, 'load', self._load_non_cached)
+            data = _profile(self, 'transform', self.transform_data, data)
+        return self.__validate_output(data)
+
+    @final
+    def __compute_and_cache(self, loaded: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Computes data and dumps it to cache. If a PersistentStore is in use,
+        data stored under the Node fingerprint is validated by the current output validator and reused,
+        and computed data is stored.
+
+        Args:
+            loaded:  already loaded raw input data to use instead of calling '_load_non_cached'.
+        Returns:
+            Validated DataFrame.
+        """
+        store = get_persistent_store()
+        key = None if store is None else self._fingerprint
+        data = None if key is None else _profile(self, 'store_load', store.load, key)  # type: ignore
+        if data is None:
+            data = self.__compute(loaded)
+            if key is not None:
+                _profile(self, 'store_dump', store.dump, key, data)  # type: ignore
+        else:
+            data = self.__validate_output(data)
+        self.__dump_validated(data)
+        return data
+
+    @final
+    def __drop_stale_cache(self) -> None:
+        """Drops the Node's cache if it is stale, dropping it in all child Nodes as well."""
+        if self.__already_cached and self._is_cache_stale:
+            self.drop_cache()
 
     @final
     def make_node_cached(self) -> None:
         """Caches self and all parent Nodes with True use_cached property."""
+        self.__drop_stale_cache()
         if self.__already_cached:
             return
-        if not self._is_parental_graph_topo_sorted:
-            raise LoopedGraphError(f"Parental graph of {self} has loops")
-        for parent in Node.__parental_graph[self]:
+        for parent in Node.__parental_graph.get(self, ()):
+            parent.__drop_stale_cache()
             if parent.use_cached and not parent.__already_cached:
-                parent.__make_node_cached()
+                parent.__compute_and_cache()
         if not self.use_cached:
             warn(f"'make_node_cached' called for Node {self} with False 'use_cached' property", RuntimeWarning)
             return
-        self.__make_node_cached()
+        self.__compute_and_cache()
 
     @final
     def drop_cache(self) -> None:
         """Drops the Node's cache, dropping it in all child Nodes as well."""
         if self.__already_cached:
-            self._clear_cache_storage()
-            self.__already_cached = False
+            self.__clear_cache()
 
         children_graph = Node.__children_graph
         visited_nodes = {self}
-        nodes_to_visit = children_graph[self].copy()
-        try:
-            while True:
-                cur_node = nodes_to_visit.pop()
-                if cur_node in visited_nodes:
-                    raise LoopedGraphError(f"Node {self} is child of itself")
-                if cur_node.__already_cached:
-                    cur_node._clear_cache_storage()
-                    cur_node.__already_cached = False
-                visited_nodes.add(cur_node)
-                nodes_to_visit |= children_graph[cur_node]
-        except KeyError:
-            pass
+        nodes_to_visit = set(children_graph.get(self, ()))
+        while nodes_to_visit:
+            cur_node = nodes_to_visit.pop()
+            visited_nodes.add(cur_node)
+            if cur_node.__already_cached:
+                cur_node.__clear_cache()
+            nodes_to_visit.update(
+                child for child in children_graph.get(cur_node, ()) if child not in visited_nodes
+            )
+
+    @final
+    def _evict_cache(self) -> None:
+        """
+        Drops the Node's cache without touching child Nodes, since their caches stay valid.
+        The next 'extract_data' call recomputes the data.
+        """
+        if self.__already_cached:
+            self.__clear_cache()
+
+    @final
+    def _apply_delta(self, loaded: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transforms and validates the delta of the raw input data and merges the result into the cache
+        if the Node is cached. Only the delta is validated. Used by 'refresh_incrementally'.
+
+        Args:
+            loaded:  the output of the '_load_delta' method.
+        Returns:
+            The delta of the output of the Node.
+        """
+        policy = self.__validation_policy
+        if policy is None:
+            policy = get_validation_policy()
+        delta = _profile(self, 'transform', self.transform_data, loaded)
+        delta = _profile(self, 'validate_output', policy.validate, self.__output_validator, delta)
+        if self.__already_cached:
+            try:
+                cached = _profile(self, 'load_cached', self._load_cached)
+            except _CacheEvicted:
+                return delta  # The next extraction recomputes the data.
+            self.__dump_validated(self.merge_delta(cached, delta))
+        return delta
+
+    @final
+    def _adopt_output(self, data: pd.DataFrame) -> None:
+        """
+        Takes data computed and validated by a copy of the Node elsewhere (e.g. in a worker process)
+        as the output of the Node, dumping it to cache if the Node uses cache.
+
+        Args:
+            data:  output of the copy of the Node.
+        """
+        policy = self.__validation_policy
+        if policy is None:
+            policy = get_validation_policy()
+        # The copy of the Node has validated data for the first time.
+        if policy._validates_fully(self.__output_validator):
+            self.__validated_once = True
+        if self.use_cached:
+            self.__dump_validated(data)
 
     @final
     def extract_data(self) -> pd.DataFrame:
         """
-        Extracts data from the Node.
+        Extracts data from the Node. Within 'evaluation_scope' the result is memoized until the scope exits.
+        Cached data is validated by the output validator only once, unless the validator is replaced.
+
+        Returns:
+            Extracted DataFrame.
+        """
+        profiler = get_profiler()
+        if profiler is None:
+            return self.__extract()
+        return profiler._run(self, 'extract', self.__extract, ())
 
+    @final
+    def __extract(self, loaded: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Supplemental method for the 'extract_data' and the 'aextract_data' methods.
+
+        Args:
+            loaded:  already loaded raw input data to use if the Node is not cached.
         Returns:
             Extracted DataFrame.
         """
+        memo = _evaluation_memo.get()
+        if memo is not None:
+            data = memo.get(self)
+            if data is not None:
+                _set_cache_status('memo')
+                return data
+        self.__drop_stale_cache()
+        data = None
         if self.__already_cached:
-            data = self._load_cached()
-            return self.__output_validator.validate(data)
-        if not self._is_parental_graph_topo_sorted:
-            raise LoopedGraphError(f"Parental graph of Node {self} has loops")
-        data = self._load_non_cached()
-        data = self.transform_data(data)
-        data = self.__output_validator.validate(data)
-        if self.use_cached:
-            self._dump_to_cache(data)
-            self.__already_cached = True
+            _set_cache_status('hit')
+            try:
+                data = _profile(self, 'load_cached', self._load_cached)
+            except _CacheEvicted:
+                pass
+            else:
+                if self.__cached_output_validator is not self.__output_validator:
+                    data = self.__validate_output(data)
+                    self.__dump_validated(data)
+        if data is None:
+            _set_cache_status('miss')
+            data = self.__compute_and_cache(loaded) if self.use_cached else self.__compute(loaded)
+        if memo is not None:
+            memo[self] = data
         return data
 
+    @final
+    async def aextract_data(self) -> pd.DataFrame:
+        """
+        Extracts data from the Node without blocking the event loop. Parent Nodes are extracted concurrently,
+        each of them once. Blocking loading, transformation and validation run in the default executor.
+
+        Returns:
+            Extracted DataFrame.
+        """
+        if _evaluation_memo.get() is None:
+            with evaluation_scope():
+                return await self.__aextract({})
+        return await self.__aextract({})
+
+    @final
+    def __schedule_aextract(self,
+                            tasks: Dict['Node', 'asyncio.Future[pd.DataFrame]']) -> 'asyncio.Future[pd.DataFrame]':
+        """
+        Returns the task that extracts data from the Node, creating it if needed.
+
+        Args:
+            tasks:  tasks already created within the current 'aextract_data' call.
+        Returns:
+            Extraction task.
+        """
+        task = tasks.get(self)
+        if task is None:
+            task = tasks[self] = asyncio.ensure_future(self.__aextract(tasks))
+        return task
+
+    @final
+    async def __aextract(self, tasks: Dict['Node', 'asyncio.Future[pd.DataFrame]']) -> pd.DataFrame:
+        """
+        Supplemental method for the 'aextract_data' method.
+
+        Args:
+            tasks:  tasks already created within the current 'aextract_data' call.
+        Returns:
+            Extracted DataFrame.
+        """
+        memo = _evaluation_memo.get()
+        self.__drop_stale_cache()
+        if self.__already_cached or (memo is not None and self in memo):
+            return await _run_in_executor(_profile, self, 'extract', self.__extract)
+        await asyncio.gather(*(parent.__schedule_aextract(tasks) for parent in self._parent_nodes))
+        loaded = await self._aload_non_cached()
+        return await _run_in_executor(_profile, self, 'extract', self.__extract, loaded)
+
+    @final
+    def _extract_data_validated_by(self,
+                                   validator: DataFrameSchema,
+                                   policy: Optional[ValidationPolicy] = None,
+                                   validated_before: bool = False) -> pd.DataFrame:
+        """
+        Extracts data from the Node and validates it with the given validator.
+        If the Node is cached, the result of full validation is memoized until the cache is dropped.
+
+        Args:
+            validator:         DataFrameSchema to validate the extracted data with.
+            policy:            ValidationPolicy to validate with. Defaults to the current ValidationPolicy.
+            validated_before:  whether the caller has already validated data (see 'first_run' validation mode).
+        Returns:
+            Validated DataFrame.
+        """
+        if policy is None:
+            policy = get_validation_policy()
+        data = self.extract_data()
+        if not self.__already_cached:
+            return _profile(self, 'validate_input', policy.validate, validator, data, validated_before)
+        key = id(validator)
+        memo = self.__validation_memo
+        try:
+            memo_validator, validated_data = memo[key]
+            if memo_validator is validator:
+                return data if validated_data is None else validated_data
+        except KeyError:
+            pass
+        validated_data = _profile(self, 'validate_input', policy.validate, validator, data, validated_before)
+        if not policy._validates_fully(validator, validated_before):
+            return validated_data
+        if is_data_preserving(validator):
+            validated_data = data
+            memo[key] = (validator, None)
+        else:
+            memo[key] = (validator, validated_data)
+        return validated_data
+
+    @final
+    def extract_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Extracts data from the Node chunk by chunk. Chunk-safe Nodes that are not cached load,
+        transform and validate each chunk separately; if they use cache, the concatenated validated chunks
+        are cached once the iterator is exhausted. Other Nodes extract the full DataFrame and split it.
+
+        Args:
+            chunksize:  number of rows per chunk.
+        Returns:
+            Iterator of validated chunks.
+        """
+        _check_chunksize(chunksize)
+        memo = _evaluation_memo.get()
+        if self.__already_cached or not self.chunk_safe or (memo is not None and self in memo):
+            yield from _iter_slices(self.extract_data(), chunksize)
+            return
+        cached_chunks: Optional[List[pd.DataFrame]] = [] if self.use_cached else None
+        validated_before = self.__validated_once
+        for chunk in self._load_non_cached_chunks(chunksize):
+            chunk = self.__validate_output(_profile(self, 'transform', self.transform_data, chunk), validated_before)
+            if cached_chunks is not None:
+                cached_chunks.append(chunk)
+            yield chunk
+        if cached_chunks:
+            self.__dump_validated(pd.concat(cached_chunks))
+
     @final
     def set_output_validator(self, output_validator: DataFrameSchema) -> 'Node':
         """
@@ -192,6 +699,28 @@ class Node(metaclass=ABCMeta):
         self.__output_validator = output_validator
         return self
 
+    @final
+    @property
+    def validation_policy(self) -> Optional[ValidationPolicy]:
+        """ValidationPolicy of the output validator or None if the current ValidationPolicy is used."""
+        return self.__validation_policy
+
+    @final
+    def set_validation_policy(self, policy: Optional[ValidationPolicy]) -> 'Node':
+        """
+        Sets the ValidationPolicy of the output validator.
+
+        Args:
+            policy:  ValidationPolicy to set or None to use the current ValidationPolicy
+                     (see 'validation_scope' and 'set_default_validation_policy').
+        Returns:
+            Self instance.
+        """
+        if policy is not None:
+            check_type_compatibility(policy, ValidationPolicy)
+        self.__validation_policy = policy
+        return self
+
     @abstractmethod
     def _dump_to_cache(self, data: pd.DataFrame) -> None:
         """
@@ -209,6 +738,8 @@ class Node(metaclass=ABCMeta):
     def _load_cached(self) -> pd.DataFrame:
         """
         Loads data previously dumped by '_dump_to_cache' method.
+        Nodes whose cache can be evicted concurrently (see RuntimeCacheManager) should raise '_CacheEvicted'
+        if the cache is gone, so that the data is recomputed.
 
         Returns:
             Loaded data.
@@ -223,6 +754,78 @@ class Node(metaclass=ABCMeta):
             Loaded data.
         """
 
+    @property
+    def _is_cache_stale(self) -> bool:
+        """
+        Whether the cached data no longer reflects the data source. Checked before the cache is used;
+        stale caches are dropped together with the caches of child Nodes. Never stale by default.
+        """
+        return False
+
+    @property
+    def chunk_safe(self) -> bool:
+        """
+        Whether the Node can load, transform and validate its data chunk by chunk,
+        i.e. the result of 'transform_data' on concatenated chunks equals the concatenation of its results on chunks.
+        """
+        return False
+
+    @property
+    def supports_delta(self) -> bool:
+        """
+        Whether the Node can process only the rows appended to its inputs (see 'refresh_incrementally'),
+        i.e. '_load_delta' can return the raw input delta and 'merge_delta' can merge the transformed delta
+        into the cached output. Nodes that do not support deltas are recomputed from scratch. False by default.
+        """
+        return False
+
+    def _load_delta(self, deltas: Mapping['Node', pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Loads the delta of the raw input data: the rows appended since the data was loaded last time.
+        Used instead of the '_load_non_cached' by 'refresh_incrementally' if 'supports_delta' is True.
+
+        Args:
+            deltas:  deltas of the outputs of the changed parent Nodes.
+        Returns:
+            Delta of the raw input data or None if it cannot be loaded, so that the Node has to be recomputed.
+        """
+        return None
+
+    def merge_delta(self, cached: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merges the transformed and validated delta into the cached output. Appends the delta by default.
+        Should be overridden by Nodes that aggregate their input.
+
+        Args:
+            cached:  cached output of the Node.
+            delta:   delta of the output of the Node.
+        Returns:
+            New output of the Node.
+        """
+        return pd.concat([cached, delta])
+
+    def _load_non_cached_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Loads raw input data chunk by chunk. Used instead of the '_load_non_cached' by chunk-safe Nodes.
+        Splits the output of the '_load_non_cached' method by default.
+
+        Args:
+            chunksize:  number of rows per chunk.
+        Returns:
+            Iterator of chunks.
+        """
+        return _iter_slices(self._load_non_cached(), chunksize)
+
+    async def _aload_non_cached(self) -> pd.DataFrame:
+        """
+        Asynchronous counterpart of the '_load_non_cached' method used by the 'aextract_data' method.
+        Runs '_load_non_cached' in the default executor by default.
+
+        Returns:
+            Loaded data.
+        """
+        return await _run_in_executor(self._load_non_cached)
+
     @property
     @abstractmethod
     def use_cached(self) -> bool:
@@ -0,0 +1,110 @@
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import PathLike
+from pathlib import Path
+from threading import get_ident
+from typing import Optional, Union, Iterator
+
+import pandas as pd
+from varutils.typing import check_type_compatibility
+
+__all__ = (
+    'PersistentStore',
+    'use_persistent_store',
+    'get_persistent_store'
+)
+
+
+class PersistentStore:
+    """Local content-addressed store of Node outputs that survives process restarts."""
+    __slots__ = ('__directory',)
+
+    def __init__(self, directory: Union[str, PathLike]) -> None:
+        """
+        Local content-addressed store of Node outputs that survives process restarts.
+
+        Args:
+            directory:  directory to keep stored DataFrames in.
+        """
+        check_type_compatibility(directory, (str, PathLike), 'str or PathLike')
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.__directory = directory
+
+    @property
+    def directory(self) -> Path:
+        """Directory to keep stored DataFrames in."""
+        return self.__directory
+
+    def _get_path(self, key: str) -> Path:
+        """
+        Returns the path of the file that stores data under the key.
+
+        Args:
+            key:  Node fingerprint.
+        Returns:
+            Path to the file.
+        """
+        return self.__directory / f'{key}.pkl'
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Loads data stored under the key.
+
+        Args:
+            key:  Node fingerprint.
+        Returns:
+            Stored DataFrame or None if nothing is stored under the key.
+        """
+        try:
+            return pd.read_pickle(self._get_path(key))
+        except FileNotFoundError:
+            return None
+
+    def dump(self, key: str, data: pd.DataFrame) -> None:
+        """
+        Stores data under the key.
+
+        Args:
+            key:   Node fingerprint.
+            data:  DataFrame to store.
+        """
+        path = self._get_path(key)
+        tmp_path = f'{path}.{os.getpid()}-{get_ident()}.tmp'
+        pd.to_pickle(data, tmp_path)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Removes all stored data."""
+        for path in self.__directory.glob('*.pkl'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+_persistent_store: 'ContextVar[Optional[PersistentStore]]' = ContextVar('_persistent_store', default=None)
+
+
+def get_persistent_store() -> Optional[PersistentStore]:
+    """Returns PersistentStore activated by 'use_persistent_store' or None."""
+    return _persistent_store.get()
+
+
+@contextmanager
+def use_persistent_store(store: PersistentStore) -> Iterator[PersistentStore]:
+    """
+    Context manager within which Nodes with True 'use_cached' property reuse outputs kept in the store.
+    Outputs are looked up by the Node fingerprint that covers its class code, loader arguments,
+    validators and the fingerprints of its parents.
+
+    Args:
+        store:  PersistentStore to use.
+    """
+    check_type_compatibility(store, PersistentStore)
+    token = _persistent_store.set(store)
+    try:
+        yield store
+    finally:
+        _persistent_store.reset(token)
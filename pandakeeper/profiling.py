@@ -0,0 +1,300 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter_ns, thread_time_ns
+from typing import Optional, Iterator, List, Dict, Any, Callable, TypeVar, NamedTuple, Union
+
+import pandas as pd
+from varutils.typing import check_type_compatibility
+
+__all__ = (
+    'ProfileEvent',
+    'Profiler',
+    'get_profiler',
+    'profiling_scope'
+)
+
+_T = TypeVar('_T')
+
+
+class ProfileEvent(NamedTuple):
+    """
+    Record of a single phase of extracting data from a Node:
+        'extract':          the whole 'extract_data' call, including the phases below and the extraction of parents;
+        'load':             '_load_non_cached';
+        'transform':        'transform_data';
+        'validate_output':  validation by the output validator;
+        'validate_input':   validation by the input validator of a NodeConnection to the Node;
+        'load_cached':      '_load_cached';
+        'dump_cache':       '_dump_to_cache';
+        'store_load':       loading from the PersistentStore;
+        'store_dump':       dumping to the PersistentStore.
+    """
+    node: str
+    gateway_id: int
+    phase: str
+    start: int
+    wall_time: int
+    cpu_time: int
+    thread_id: int
+    rows: Optional[int]
+    memory: Optional[int]
+    cache: Optional[str]
+
+
+def _frame_memory(data: pd.DataFrame, deep: bool) -> int:
+    """
+    Returns the memory used by DataFrame.
+
+    Args:
+        data:  DataFrame to measure.
+        deep:  whether to include the memory of the objects referenced by the DataFrame.
+    Returns:
+        Number of bytes.
+    """
+    if deep:
+        return int(data.memory_usage(index=True, deep=True).sum())
+    # Summing the sizes of the column arrays is an order of magnitude faster than 'DataFrame.memory_usage'.
+    return data.index.nbytes + sum(series.array.nbytes for _, series in data.items())
+
+
+class Profiler:
+    """
+    Collector of ProfileEvents of Nodes extracted within 'profiling_scope'.
+    Times are measured in nanoseconds: wall time by the performance counter and CPU time of the running thread.
+    Rows and memory are measured on the DataFrame the phase returns or, if it returns nothing, takes.
+    The 'cache' field of 'extract' events is 'memo' if the output is taken from 'evaluation_scope',
+    'hit' if it is taken from the cache of the Node and 'miss' if it is computed.
+    """
+    __slots__ = ('__events', '__deep_memory', '__origin', '__local')
+
+    def __init__(self, *, deep_memory: bool = False) -> None:
+        """
+        Collector of ProfileEvents of Nodes extracted within 'profiling_scope'.
+
+        Args:
+            deep_memory:  whether to measure the memory of DataFrames including the objects they reference.
+                          Introspecting object columns is slow, so only the buffers are measured by default.
+        """
+        check_type_compatibility(deep_memory, bool)
+        self.__events: List[ProfileEvent] = []
+        self.__deep_memory = deep_memory
+        self.__origin = perf_counter_ns()
+        self.__local = threading.local()
+
+    @property
+    def deep_memory(self) -> bool:
+        """Whether the memory of DataFrames includes the objects they reference."""
+        return self.__deep_memory
+
+    @property
+    def events(self) -> List[ProfileEvent]:
+        """Recorded ProfileEvents in the order of their completion."""
+        return list(self.__events)
+
+    def clear(self) -> None:
+        """Removes the recorded ProfileEvents."""
+        self.__events.clear()
+
+    def __get_stack(self) -> List[List[Optional[str]]]:
+        """Returns the stack of cache statuses of the phases running in the current thread."""
+        local = self.__local
+        try:
+            return local.stack
+        except AttributeError:
+            stack = local.stack = []
+            return stack
+
+    def _run(self, node: Any, phase: str, fn: Callable[..., _T], args: tuple) -> _T:
+        """
+        Runs a phase of extracting data from the Node, recording its ProfileEvent.
+
+        Args:
+            node:   Node the phase belongs to.
+            phase:  name of the phase.
+            fn:     function that runs the phase.
+            args:   positional arguments of the function.
+        Returns:
+            The result of the function.
+        """
+        stack = self.__get_stack()
+        cache: List[Optional[str]] = [None]
+        stack.append(cache)
+        start = perf_counter_ns()
+        cpu_start = thread_time_ns()
+        try:
+            result = fn(*args)
+        finally:
+            cpu_time = thread_time_ns() - cpu_start
+            wall_time = perf_counter_ns() - start
+            stack.pop()
+        if isinstance(result, pd.DataFrame):
+            measured: Optional[pd.DataFrame] = result
+        elif args and isinstance(args[0], pd.DataFrame):
+            measured = args[0]
+        else:
+            measured = None
+        if measured is None:
+            rows = memory = None
+        else:
+            rows = len(measured)
+            memory = _frame_memory(measured, self.__deep_memory)
+        self.__events.append(
+            ProfileEvent(
+                str(node), node.gateway_id, phase, start - self.__origin, wall_time, cpu_time,
+                threading.get_ident(), rows, memory, cache[0]
+            )
+        )
+        return result
+
+    def _set_cache_status(self, status: str) -> None:
+        """
+        Sets the cache status of the innermost phase running in the current thread.
+
+        Args:
+            status:  'memo', 'hit' or 'miss'.
+        """
+        stack = self.__get_stack()
+        if stack:
+            stack[-1][0] = status
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the recorded ProfileEvents as a DataFrame.
+
+        Returns:
+            DataFrame with a row per ProfileEvent and a column per its field.
+        """
+        return pd.DataFrame(self.__events, columns=ProfileEvent._fields)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Returns the summary table of the recorded ProfileEvents.
+
+        Returns:
+            DataFrame indexed by Node and phase with the number of calls, total and maximum wall time,
+            total CPU time in seconds, the maximum number of rows and memory in bytes, and the numbers of
+            cache hits (including outputs taken from 'evaluation_scope') and misses, sorted by total wall time.
+        """
+        events = self.to_frame()
+        events['wall_time'] /= 1e9
+        events['cpu_time'] /= 1e9
+        events['cache_hits'] = events['cache'].isin(('hit', 'memo'))
+        events['cache_misses'] = events['cache'] == 'miss'
+        summary = events.groupby(['node', 'phase'], sort=False).agg(
+            calls=('wall_time', 'size'),
+            wall_time=('wall_time', 'sum'),
+            max_wall_time=('wall_time', 'max'),
+            cpu_time=('cpu_time', 'sum'),
+            rows=('rows', 'max'),
+            memory=('memory', 'max'),
+            cache_hits=('cache_hits', 'sum'),
+            cache_misses=('cache_misses', 'sum')
+        )
+        return summary.sort_values('wall_time', ascending=False, kind='stable')
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the recorded ProfileEvents in the Chrome trace event format,
+        viewable in chrome://tracing and Perfetto. Nested phases are shown as nested slices of their thread.
+
+        Returns:
+            JSON-serializable trace.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for event in self.__events:
+            trace_args: Dict[str, Any] = {'gateway_id': event.gateway_id, 'cpu_time_us': event.cpu_time / 1e3}
+            if event.rows is not None:
+                trace_args['rows'] = event.rows
+                trace_args['memory'] = event.memory
+            if event.cache is not None:
+                trace_args['cache'] = event.cache
+            trace_events.append({
+                'name': f'{event.node}.{event.phase}',
+                'cat': event.phase,
+                'ph': 'X',
+                'ts': event.start / 1e3,
+                'dur': event.wall_time / 1e3,
+                'pid': pid,
+                'tid': event.thread_id,
+                'args': trace_args
+            })
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def dump_chrome_trace(self, path: Union[str, 'os.PathLike[str]']) -> None:
+        """
+        Writes the recorded ProfileEvents to a JSON file in the Chrome trace event format.
+
+        Args:
+            path:  path of the file to write.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+_profiler: 'ContextVar[Optional[Profiler]]' = ContextVar('_profiler', default=None)
+
+
+def get_profiler() -> Optional[Profiler]:
+    """
+    Returns Profiler of the innermost 'profiling_scope'.
+
+    Returns:
+        Current Profiler or None if profiling is disabled.
+    """
+    return _profiler.get()
+
+
+@contextmanager
+def profiling_scope(profiler: Optional[Profiler] = None) -> Iterator[Profiler]:
+    """
+    Context manager within which the phases of extracting data from Nodes are recorded by Profiler.
+    Outside of it profiling costs a single context variable lookup per phase.
+
+    Args:
+        profiler:  Profiler to record to. A new Profiler is created by default.
+    Returns:
+        Profiler in use.
+    """
+    if profiler is None:
+        profiler = Profiler()
+    else:
+        check_type_compatibility(profiler, Profiler)
+    token = _profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _profiler.reset(token)
+
+
+def _profile(node: Any, phase: str, fn: Callable[..., _T], *args: Any) -> _T:
+    """
+    Runs a phase of extracting data from the Node, recording it if profiling is enabled.
+
+    Args:
+        node:   Node the phase belongs to.
+        phase:  name of the phase. See ProfileEvent.
+        fn:     function that runs the phase.
+        *args:  positional arguments of the function.
+    Returns:
+        The result of the function.
+    """
+    profiler = _profiler.get()
+    if profiler is None:
+        return fn(*args)
+    return profiler._run(node, phase, fn, args)
+
+
+def _set_cache_status(status: str) -> None:
+    """
+    Sets the cache status of the 'extract' phase running in the current thread if profiling is enabled.
+
+    Args:
+        status:  'memo', 'hit' or 'miss'.
+    """
+    profiler = _profiler.get()
+    if profiler is not None:
+        profiler._set_cache_status(status)
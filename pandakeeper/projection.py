@@ -0,0 +1,75 @@
+from itertools import chain
+from typing import Optional, Dict, Tuple, Hashable, List, Set
+
+from varutils.typing import check_type_compatibility
+
+from pandakeeper.dataloader import DataLoader
+from pandakeeper.dataprocessor import DataProcessor
+from pandakeeper.node import Node
+
+__all__ = ('push_down_projections',)
+
+
+def _get_required_columns(loader: DataLoader) -> Optional[Tuple[Hashable, ...]]:
+    """
+    Returns the union of the columns required by all consumers of the DataLoader and by its output validator.
+
+    Args:
+        loader:  DataLoader to collect the required columns for.
+    Returns:
+        Required columns in the order of their first occurrence or None if all columns are required.
+    """
+    children = loader._child_nodes
+    if not children:
+        return None
+    output_validator_columns = loader._output_validator.columns
+    if any(column.regex for column in output_validator_columns.values()):
+        return None
+    columns: Dict[Hashable, None] = dict.fromkeys(output_validator_columns)
+    for child in sorted(children, key=lambda node: node.gateway_id):
+        if not isinstance(child, DataProcessor):
+            return None
+        for node_connection in chain(child.positional_input_nodes, child.named_input_nodes.values()):
+            if node_connection.node is not loader:
+                continue
+            required_columns = node_connection.required_columns
+            if required_columns is None:
+                return None
+            columns.update(dict.fromkeys(required_columns))
+    return tuple(columns)
+
+
+def push_down_projections(target_node: Node) -> Dict[DataLoader, Optional[Tuple[Hashable, ...]]]:
+    """
+    Restricts every DataLoader of the parental graph of the target Node to the columns used by its consumers,
+    so that only these columns are read and kept in memory.
+    The columns used by a consumer are taken from the 'required_columns' of its NodeConnections.
+    The projection of a DataLoader covers all its consumers, including ones outside the parental graph,
+    together with the columns of its output validator. DataLoaders having a consumer that uses all columns,
+    as well as the target Node itself, load all columns.
+    The projections stay in effect until they are pushed down again or reset with '_set_projection(None)',
+    so consumers connected afterwards may miss columns. GraphExecutor resets them after every run.
+
+    Args:
+        target_node:  Node whose parental graph to plan.
+    Returns:
+        Mapping from every DataLoader of the parental graph to its projection (None means all columns).
+    """
+    check_type_compatibility(target_node, Node)
+    loaders: List[DataLoader] = []
+    visited_nodes: Set[Node] = set()
+    nodes_to_visit = [target_node]
+    while nodes_to_visit:
+        cur_node = nodes_to_visit.pop()
+        if cur_node in visited_nodes:
+            continue
+        visited_nodes.add(cur_node)
+        if isinstance(cur_node, DataLoader):
+            loaders.append(cur_node)
+        nodes_to_visit.extend(cur_node._parent_nodes)
+    projections: Dict[DataLoader, Optional[Tuple[Hashable, ...]]] = {}
+    for loader in loaders:
+        projection = None if loader is target_node else _get_required_columns(loader)
+        loader._set_projection(projection)
+        projections[loader] = projection
+    return projections
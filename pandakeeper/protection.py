@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+__all__ = (
+    'is_copy_on_write_enabled',
+    'protect_frame',
+    'frame_view'
+)
+
+
+def is_copy_on_write_enabled() -> bool:
+    """
+    Checks whether pandas Copy-on-Write is in effect: always since pandas 3, opt-in since pandas 1.5.
+
+    Returns:
+        Result of checking.
+    """
+    if int(pd.__version__.split('.', 1)[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except (KeyError, AttributeError):
+        return False
+
+
+def protect_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns DataFrame to keep as the protected original: consumers get its views (see 'frame_view')
+    and cannot modify it. Under pandas Copy-on-Write, it is a shallow copy of the input DataFrame,
+    and the views copy only the columns they modify. Otherwise the input DataFrame is copied once,
+    and the NumPy arrays of the blocks of the copy are made read-only, so that modifications of the views
+    that would write to the shared arrays raise instead of silently corrupting the original.
+    Extension arrays are not locked.
+
+    Args:
+        data:  DataFrame to protect. It is left unchanged.
+    Returns:
+        Protected DataFrame.
+    """
+    if is_copy_on_write_enabled():
+        return data.copy(deep=False)
+    protected = data.copy()
+    for block in protected._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray):
+            values.setflags(write=False)
+    return protected
+
+
+def frame_view(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a new DataFrame object sharing data with the DataFrame protected by 'protect_frame'.
+    Adding, replacing or dropping columns of the view does not affect the protected DataFrame.
+
+    Args:
+        data:  DataFrame returned by 'protect_frame'.
+    Returns:
+        View of the DataFrame.
+    """
+    return data.copy(deep=False)
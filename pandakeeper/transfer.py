@@ -0,0 +1,206 @@
+import io
+import os
+import pickle
+import shutil
+import tempfile
+from threading import Lock
+from typing import Dict, Any, Optional
+
+import pandas as pd
+from typing_extensions import final
+
+from pandakeeper.arrow import _import_pyarrow, write_feather, read_feather
+from pandakeeper.node import Node, evaluation_scope
+from pandakeeper.validation import ValidationPolicy, validation_scope
+from pandakeeper.validators import AnyDataFrame
+
+__all__ = ()
+
+
+def _shared_memory_root() -> str:
+    """
+    Returns the directory to keep transferred DataFrames in: the RAM-backed '/dev/shm' if available,
+    otherwise the default temporary directory.
+
+    Returns:
+        Path to the directory.
+    """
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+class _FrameTransfer:
+    """
+    Directory of uncompressed Arrow IPC files that passes DataFrames between processes.
+    Every DataFrame is written once and read through memory mapping, so that readers do not copy it.
+    """
+    __slots__ = ('__directory', '__paths', '__lock')
+
+    def __init__(self) -> None:
+        """
+        Directory of uncompressed Arrow IPC files that passes DataFrames between processes.
+        """
+        _import_pyarrow()
+        self.__directory = tempfile.mkdtemp(prefix='pandakeeper-transfer-', dir=_shared_memory_root())
+        self.__paths: Dict[Node, str] = {}
+        self.__lock = Lock()
+
+    def get_output_path(self, node: Node) -> str:
+        """
+        Returns the path of the file to transfer the output of the Node through.
+
+        Args:
+            node:  Node whose output to transfer.
+        Returns:
+            Path to the file.
+        """
+        return os.path.join(self.__directory, f'{node.gateway_id}.arrow')
+
+    def export(self, node: Node, data: pd.DataFrame) -> str:
+        """
+        Writes the output of the Node unless it is already written.
+
+        Args:
+            node:  Node whose output to write.
+            data:  output of the Node.
+        Returns:
+            Path to the written file.
+        """
+        with self.__lock:
+            path = self.__paths.get(node)
+        if path is None:
+            path = self.get_output_path(node)
+            # Concurrent exports of the same output replace the file atomically with equal content.
+            write_feather(data, path)
+            with self.__lock:
+                self.__paths[node] = path
+        return path
+
+    def adopt(self, node: Node) -> pd.DataFrame:
+        """
+        Reads the output of the Node written by a worker process, so that it is not written again.
+
+        Args:
+            node:  Node whose output to read.
+        Returns:
+            DataFrame backed by the memory-mapped file.
+        """
+        path = self.get_output_path(node)
+        data = read_feather(path, memory_map=True)
+        with self.__lock:
+            self.__paths[node] = path
+        return data
+
+    def close(self) -> None:
+        """
+        Removes the transferred files. DataFrames that are still memory-mapped stay valid
+        until they are garbage-collected.
+        """
+        shutil.rmtree(self.__directory, ignore_errors=True)
+
+
+class _TransferredNode(Node):
+    """Node that substitutes a parent Node in a worker process and loads its transferred output."""
+    __slots__ = ('__path',)
+
+    def __init__(self, path: str) -> None:
+        """
+        Node that substitutes a parent Node in a worker process and loads its transferred output.
+
+        Args:
+            path:  path to the transferred output of the parent Node.
+        """
+        super().__init__(AnyDataFrame)
+        self.__path = path
+
+    @final
+    def _load_non_cached(self) -> pd.DataFrame:
+        return read_feather(self.__path, memory_map=True)
+
+    @final
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    @final
+    @property
+    def use_cached(self) -> bool:
+        return False
+
+    @final
+    def _dump_to_cache(self, data: pd.DataFrame) -> None:
+        raise ValueError("Transferred Nodes cannot be cached")
+
+    @final
+    def _clear_cache_storage(self) -> None:
+        pass
+
+    @final
+    def _load_cached(self) -> pd.DataFrame:
+        raise ValueError("Transferred Nodes cannot be cached")
+
+
+class _NodePickler(pickle.Pickler):
+    """Pickler of a single Node that replaces all other Nodes it references by their gateway IDs."""
+
+    def __init__(self, file: io.BytesIO, node: Node) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.__node = node
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        if isinstance(obj, Node) and obj is not self.__node:
+            return obj.gateway_id
+        return None
+
+
+class _NodeUnpickler(pickle.Unpickler):
+    """Unpickler that substitutes the parent Nodes referenced by their gateway IDs with _TransferredNodes."""
+
+    def __init__(self, file: io.BytesIO, input_paths: Dict[int, str]) -> None:
+        super().__init__(file)
+        self.__input_paths = input_paths
+        self.__nodes: Dict[int, _TransferredNode] = {}
+
+    def persistent_load(self, pid: Any) -> _TransferredNode:
+        node = self.__nodes.get(pid)
+        if node is None:
+            try:
+                path = self.__input_paths[pid]
+            except KeyError:
+                raise pickle.UnpicklingError(f"Output of the Node with gateway_id={pid} is not transferred") from None
+            node = self.__nodes[pid] = _TransferredNode(path)
+        return node
+
+
+def _dump_node(node: Node) -> bytes:
+    """
+    Pickles the Node without the other Nodes it references.
+
+    Args:
+        node:  Node to pickle.
+    Returns:
+        Pickled Node.
+    """
+    buffer = io.BytesIO()
+    _NodePickler(buffer, node).dump(node)
+    return buffer.getvalue()
+
+
+def _extract_in_process(payload: bytes,
+                        input_paths: Dict[int, str],
+                        output_path: str,
+                        validation_policy: ValidationPolicy) -> None:
+    """
+    Extracts data from the pickled Node in a worker process and writes it to the output file.
+
+    Args:
+        payload:            Node pickled by '_dump_node'.
+        input_paths:        mapping from the gateway IDs of the parent Nodes to the paths of their transferred outputs.
+        output_path:        path of the file to write the output to.
+        validation_policy:  ValidationPolicy of the main process.
+    """
+    node = _NodeUnpickler(io.BytesIO(payload), input_paths).load()
+    with validation_scope(validation_policy), evaluation_scope():
+        data = node.extract_data()
+    write_feather(data, output_path)
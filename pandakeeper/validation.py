@@ -0,0 +1,230 @@
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Iterator, Any
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+from pandera import DataFrameSchema
+from typing_extensions import Final
+from varutils.typing import check_type_compatibility
+
+from pandakeeper.validators import is_data_preserving, compile_validator
+
+__all__ = (
+    'ValidationPolicy',
+    'get_validation_policy',
+    'set_default_validation_policy',
+    'validation_scope'
+)
+
+VALIDATION_POLICY_ENV_VAR: Final = 'PANDAKEEPER_VALIDATION'
+
+
+class ValidationPolicy:
+    """
+    Immutable policy that defines how DataFrames are validated by DataFrameSchemas:
+        'full':         the whole DataFrame is validated;
+        'head':         checks run on the first 'n' rows only;
+        'sample':       checks run on 'n' randomly sampled rows only;
+        'first_run':    the whole DataFrame is validated only the first time the Node or NodeConnection validates;
+        'schema_only':  only columns and dtypes are checked, value checks are skipped;
+        'off':          DataFrames are not validated.
+    DataFrameSchemas that coerce, parse, filter or fill data are always fully applied,
+    since their result is a part of the validated data.
+    """
+    __slots__ = ('__mode', '__n', '__random_state')
+    __modes = ('full', 'head', 'sample', 'first_run', 'schema_only', 'off')
+
+    def __init__(self, mode: str = 'full', n: Optional[int] = None, *, random_state: Optional[int] = None) -> None:
+        """
+        Immutable policy that defines how DataFrames are validated by DataFrameSchemas.
+
+        Args:
+            mode:          one of 'full', 'head', 'sample', 'first_run', 'schema_only' and 'off'.
+            n:             number of rows to check. Required for 'head' and 'sample' modes only.
+            random_state:  random state of sampling for 'sample' mode.
+        """
+        check_type_compatibility(mode, str)
+        if mode not in ValidationPolicy.__modes:
+            raise ValueError(f"Unknown validation mode: {mode!r}. Expected one of {ValidationPolicy.__modes}")
+        if mode in ('head', 'sample'):
+            check_type_compatibility(n, int)
+            if n <= 0:  # type: ignore
+                raise ValueError(f"'n' should be positive. Got: {n}")
+        elif n is not None:
+            raise ValueError(f"'n' is only allowed for 'head' and 'sample' modes. Got mode: {mode!r}")
+        if random_state is not None:
+            check_type_compatibility(random_state, int)
+        if mode == 'schema_only':
+            try:
+                from pandera.config import config_context  # noqa: F401
+            except ImportError as e:
+                raise ImportError("'schema_only' validation mode requires pandera>=0.16") from e
+        self.__mode = mode
+        self.__n = n
+        self.__random_state = random_state
+
+    @classmethod
+    def parse(cls, spec: str) -> 'ValidationPolicy':
+        """
+        Creates ValidationPolicy from its string specification, e.g. 'full', 'off', 'head:100' or 'sample:1000'.
+
+        Args:
+            spec:  mode optionally followed by colon and the number of rows to check.
+        Returns:
+            ValidationPolicy.
+        """
+        check_type_compatibility(spec, str)
+        mode, sep, n = spec.strip().lower().partition(':')
+        if not sep:
+            return cls(mode)
+        try:
+            parsed_n = int(n)
+        except ValueError:
+            raise ValueError(f"Invalid number of rows in validation policy specification: {spec!r}") from None
+        return cls(mode, parsed_n)
+
+    @property
+    def mode(self) -> str:
+        """Validation mode."""
+        return self.__mode
+
+    @property
+    def n(self) -> Optional[int]:
+        """Number of rows to check in 'head' and 'sample' modes."""
+        return self.__n
+
+    @property
+    def random_state(self) -> Optional[int]:
+        """Random state of sampling in 'sample' mode."""
+        return self.__random_state
+
+    def validate(self, schema: DataFrameSchema, data: pd.DataFrame, validated_before: bool = False) -> pd.DataFrame:
+        """
+        Validates DataFrame according to the policy.
+
+        Args:
+            schema:            DataFrameSchema to validate with.
+            data:              DataFrame to validate.
+            validated_before:  whether the validating Node or NodeConnection has already validated data.
+        Returns:
+            Validated DataFrame.
+        """
+        validator = compile_validator(schema)
+        mode = self.__mode
+        if mode == 'full' or not is_data_preserving(schema):
+            return validator(data)
+        if mode == 'off':
+            return data
+        if mode == 'first_run':
+            return data if validated_before else validator(data)
+        if mode == 'head':
+            validator(data.head(self.__n))
+            return data
+        if mode == 'sample':
+            n_rows = len(data)
+            if n_rows <= self.__n:  # type: ignore
+                validator(data)
+            else:
+                # Drawing positions with replacement takes O(n) instead of O(len(data)) of pandas sampling.
+                positions = np.unique(np.random.default_rng(self.__random_state).integers(0, n_rows, self.__n))
+                validator(data.iloc[positions])
+            return data
+        from pandera.config import config_context
+
+        with config_context(validation_depth='SCHEMA_ONLY'):
+            schema.validate(data)
+        return data
+
+    def _validates_fully(self, schema: DataFrameSchema, validated_before: bool = False) -> bool:
+        """
+        Checks whether the 'validate' method called with the same arguments checks the whole DataFrame,
+        so that the caller can treat the DataFrame as validated under any policy.
+
+        Args:
+            schema:            DataFrameSchema to validate with.
+            validated_before:  whether the validating Node or NodeConnection has already validated data.
+        Returns:
+            Result of checking.
+        """
+        mode = self.__mode
+        return mode == 'full' or (mode == 'first_run' and not validated_before) or not is_data_preserving(schema)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ValidationPolicy):
+            return NotImplemented
+        return (self.__mode, self.__n, self.__random_state) == (other.__mode, other.__n, other.__random_state)
+
+    def __hash__(self) -> int:
+        return hash((self.__mode, self.__n, self.__random_state))
+
+    def __repr__(self) -> str:
+        n = '' if self.__n is None else f', {self.__n}'
+        random_state = '' if self.__random_state is None else f', random_state={self.__random_state}'
+        return f'{type(self).__name__}({self.__mode!r}{n}{random_state})'
+
+
+def _policy_from_environment() -> ValidationPolicy:
+    """
+    Reads the default ValidationPolicy from the PANDAKEEPER_VALIDATION environment variable.
+
+    Returns:
+        ValidationPolicy. 'full' if the variable is not set or invalid.
+    """
+    spec = os.environ.get(VALIDATION_POLICY_ENV_VAR)
+    if not spec:
+        return ValidationPolicy()
+    try:
+        return ValidationPolicy.parse(spec)
+    except (ValueError, ImportError) as e:
+        warn(f"Ignoring invalid {VALIDATION_POLICY_ENV_VAR}={spec!r}: {e}", RuntimeWarning)
+        return ValidationPolicy()
+
+
+_default_validation_policy = _policy_from_environment()
+_validation_policy: 'ContextVar[Optional[ValidationPolicy]]' = ContextVar('_validation_policy', default=None)
+
+
+def get_validation_policy() -> ValidationPolicy:
+    """
+    Returns ValidationPolicy used by Nodes and NodeConnections that do not set their own policy:
+    the policy of the innermost 'validation_scope' or the default policy.
+
+    Returns:
+        Current ValidationPolicy.
+    """
+    policy = _validation_policy.get()
+    return _default_validation_policy if policy is None else policy
+
+
+def set_default_validation_policy(policy: ValidationPolicy) -> None:
+    """
+    Sets the process-wide default ValidationPolicy.
+    Initially it is read from the PANDAKEEPER_VALIDATION environment variable (e.g. 'off' or 'sample:1000')
+    and is 'full' if the variable is not set.
+
+    Args:
+        policy:  ValidationPolicy to set.
+    """
+    global _default_validation_policy
+    check_type_compatibility(policy, ValidationPolicy)
+    _default_validation_policy = policy
+
+
+@contextmanager
+def validation_scope(policy: ValidationPolicy) -> Iterator[None]:
+    """
+    Context manager within which Nodes and NodeConnections that do not set their own policy
+    validate data according to the given ValidationPolicy.
+
+    Args:
+        policy:  ValidationPolicy to use.
+    """
+    check_type_compatibility(policy, ValidationPolicy)
+    token = _validation_policy.set(policy)
+    try:
+        yield
+    finally:
+        _validation_policy.reset(token)
@@ -1,8 +1,434 @@
-from pandera import DataFrameSchema
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Callable, List, Optional, Tuple
+from weakref import ref
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_dtype, is_datetime64_any_dtype, is_numeric_dtype, is_bool_dtype
+from pandera import DataFrameSchema, Column
 from typing_extensions import Final
 
+from pandakeeper.protection import is_copy_on_write_enabled
+
 __all__ = (
     'AnyDataFrame',
+    'is_data_preserving',
+    'schema_read_options',
+    'compile_validator'
 )
 
 AnyDataFrame: Final = DataFrameSchema()
+
+
+def is_data_preserving(schema: DataFrameSchema) -> bool:
+    """
+    Checks whether the 'validate' method of the schema can only pass or reject data,
+    i.e. returns DataFrames equal to the input ones.
+
+    Args:
+        schema:  DataFrameSchema to check.
+    Returns:
+        False if the schema can coerce, parse, filter or fill the validated data, True otherwise.
+    """
+    if getattr(schema, 'strict', False) == 'filter':
+        return False
+    for attr in ('add_missing_columns', 'drop_invalid_rows', 'parsers'):
+        if getattr(schema, attr, None):
+            return False
+    components = list(schema.columns.values())
+    index = schema.index
+    if index is not None:
+        components.extend(getattr(index, 'indexes', (index,)))
+    if getattr(schema, 'coerce', False):
+        return False
+    for component in components:
+        for attr in ('coerce', 'drop_invalid_rows', 'parsers'):
+            if getattr(component, attr, None):
+                return False
+        if getattr(component, 'default', None) is not None:
+            return False
+    return True
+
+
+class _ColumnFilter:
+    """Callable 'usecols' argument of pandas.read_csv that selects columns by name."""
+    __slots__ = ('__columns',)
+
+    def __init__(self, columns: FrozenSet[Any]) -> None:
+        """
+        Callable 'usecols' argument of pandas.read_csv that selects columns by name.
+
+        Args:
+            columns:  names of the columns to select.
+        """
+        self.__columns = columns
+
+    def __call__(self, column: Any) -> bool:
+        return column in self.__columns
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({sorted(map(repr, self.__columns))})'
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _ColumnFilter) and self.__columns == other.__columns
+
+    def __hash__(self) -> int:
+        return hash(self.__columns)
+
+
+def schema_read_options(schema: DataFrameSchema) -> Dict[str, Any]:
+    """
+    Derives reading options that make pandas readers produce the column dtypes declared by the schema,
+    so that the data is parsed in a single pass and validation only confirms the result.
+    Only required columns with fixed names are taken into account.
+    Non-nullable numpy integer and boolean dtypes are skipped for nullable columns,
+    because they cannot hold missing values.
+
+    Args:
+        schema:  DataFrameSchema to derive reading options from.
+    Returns:
+        Mapping that may contain the following keys:
+            'dtype':        column name -> dtype mapping for non-datetime columns;
+            'parse_dates':  list of the timezone-naive datetime columns;
+            'usecols':      schema columns if the schema filters out other columns.
+                            A callable that selects them is used if some of them are not required.
+    """
+    dtypes = {}
+    parse_dates = []
+    has_regex_columns = False
+    for name, column in schema.columns.items():
+        if column.regex:
+            has_regex_columns = True
+            continue
+        if not column.required or column.dtype is None:
+            continue
+        dtype = column.dtype.type
+        if is_datetime64_dtype(dtype):
+            parse_dates.append(name)
+            continue
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biu' and column.nullable:
+            continue
+        if not isinstance(dtype, np.dtype) and getattr(dtype, 'tz', None) is not None:
+            continue
+        dtypes[name] = dtype
+    options: Dict[str, Any] = {}
+    if dtypes:
+        options['dtype'] = dtypes
+    if parse_dates:
+        options['parse_dates'] = parse_dates
+    if getattr(schema, 'strict', False) == 'filter' and not has_regex_columns:
+        columns = schema.columns
+        if all(column.required for column in columns.values()):
+            options['usecols'] = list(columns)
+        else:
+            options['usecols'] = _ColumnFilter(frozenset(columns))
+    return options
+
+
+_BOUND_CHECKS: Final = {
+    'greater_than': (('min_value', False),),
+    'greater_than_or_equal_to': (('min_value', True),),
+    'less_than': (('max_value', False),),
+    'less_than_or_equal_to': (('max_value', True),),
+}
+_ELEMENT_CHECKS: Final = frozenset(('equal_to', 'not_equal_to', 'isin', 'notin'))
+
+
+class _ColumnPlan:
+    """Fast-path checks of a single column compiled from pandera.Column."""
+    __slots__ = (
+        'name',
+        'required',
+        'dtype',
+        'nullable',
+        'unique',
+        'bounds',
+        'element_checks',
+        'dtype_matches',
+        'accepts_objects'
+    )
+
+    def __init__(self, name: Any, column: Column) -> None:
+        from pandera.engines import numpy_engine
+
+        self.name = name
+        self.required: bool = column.required
+        self.dtype = column.dtype
+        self.nullable: bool = column.nullable
+        self.unique: bool = column.unique
+        # (bound value, is lower bound, is inclusive)
+        self.bounds: List[Tuple[Any, bool, bool]] = []
+        self.element_checks: List[Tuple[str, Dict[str, Any]]] = []
+        self.dtype_matches: Dict[Any, bool] = {}
+        self.accepts_objects = isinstance(column.dtype, numpy_engine.Object)
+
+    def check_dtype(self, series: pd.Series) -> bool:
+        """
+        Checks the dtype of the column like pandera does, memoizing the results for every pandas dtype.
+        Columns of object dtype are left to pandera unless the column is declared as object,
+        since pandera checks their values element by element against logical types such as 'str'.
+
+        Args:
+            series:  column to check.
+        Returns:
+            Result of checking.
+        """
+        if self.dtype is None:
+            return True
+        series_dtype = series.dtype
+        if series_dtype == object and not self.accepts_objects:
+            return False
+        matches = self.dtype_matches.get(series_dtype)
+        if matches is None:
+            from pandera.engines import pandas_engine
+
+            matches = self.dtype_matches[series_dtype] = bool(
+                self.dtype.check(pandas_engine.Engine.dtype(series_dtype))
+            )
+        return matches
+
+    def check_values(self, series: pd.Series) -> bool:
+        """
+        Checks nullability, uniqueness and the values of the column.
+        Range checks are fused into a single computation of the minimum and maximum of the column.
+
+        Args:
+            series:  column to check.
+        Returns:
+            Result of checking.
+        """
+        has_nulls: Optional[bool] = None
+        if not self.nullable:
+            has_nulls = bool(series.isna().any())
+            if has_nulls:
+                return False
+        if self.unique and not series.is_unique:
+            return False
+        if not series.size:
+            return True
+        bounds = self.bounds
+        element_checks = self.element_checks
+        if not bounds and not element_checks:
+            return True
+        if has_nulls is None:
+            has_nulls = bool(series.isna().any())
+        values = series.dropna() if has_nulls else series
+        if not values.size:
+            return True
+        if bounds:
+            if (is_numeric_dtype(values.dtype) or is_datetime64_any_dtype(values.dtype)) \
+                    and not is_bool_dtype(values.dtype):
+                min_value = values.min()
+                max_value = values.max()
+                for bound, is_lower, inclusive in bounds:
+                    if is_lower:
+                        if not (min_value >= bound if inclusive else min_value > bound):
+                            return False
+                    elif not (max_value <= bound if inclusive else max_value < bound):
+                        return False
+            else:
+                for bound, is_lower, inclusive in bounds:
+                    if is_lower:
+                        passed = values >= bound if inclusive else values > bound
+                    else:
+                        passed = values <= bound if inclusive else values < bound
+                    if not passed.all():
+                        return False
+        for name, statistics in element_checks:
+            if name == 'equal_to':
+                passed = values == statistics['value']
+            elif name == 'not_equal_to':
+                passed = values != statistics['value']
+            elif name == 'isin':
+                passed = values.isin(statistics['allowed_values'])
+            else:
+                passed = ~values.isin(statistics['forbidden_values'])
+            if not passed.all():
+                return False
+        return True
+
+
+class _CompiledValidator:
+    """
+    Validator that checks DataFrames with fused vectorized checks compiled from DataFrameSchema.
+    DataFrames that do not pass the fast path are validated by the DataFrameSchema itself,
+    so that errors are the same as pandera raises. Like pandera, the validator returns a copy of the DataFrame,
+    which is shallow under pandas Copy-on-Write.
+    """
+    __slots__ = ('__schema', '__columns', '__strict', '__unique_column_names')
+
+    def __init__(self, schema: DataFrameSchema, columns: List[_ColumnPlan]) -> None:
+        # The schema is referenced weakly, so that memoized validators do not keep their schemas alive.
+        self.__schema = ref(schema)
+        self.__columns = columns
+        self.__strict = bool(schema.strict)
+        self.__unique_column_names = bool(getattr(schema, 'unique_column_names', False))
+
+    def __check(self, data: pd.DataFrame) -> bool:
+        """
+        Runs the fast-path checks.
+
+        Args:
+            data:  DataFrame to check.
+        Returns:
+            True if the DataFrame is valid, False if it is invalid or the checks cannot decide.
+        """
+        data_columns = data.columns
+        if not self.__columns and not self.__strict and not self.__unique_column_names:
+            return True
+        if not data_columns.is_unique:
+            return False
+        if self.__strict and not data_columns.isin([plan.name for plan in self.__columns]).all():
+            return False
+        for plan in self.__columns:
+            if plan.name not in data_columns:
+                if plan.required:
+                    return False
+                continue
+            series = data[plan.name]
+            if not plan.check_dtype(series) or not plan.check_values(series):
+                return False
+        return True
+
+    def __call__(self, data: pd.DataFrame) -> pd.DataFrame:
+        if isinstance(data, pd.DataFrame):
+            try:
+                if self.__check(data):
+                    return data.copy(deep=not is_copy_on_write_enabled())
+            except Exception:  # checks that cannot be evaluated are left to pandera
+                pass
+        return self.__schema().validate(data)  # type: ignore
+
+
+def _is_element_wise_dtype(dtype: Any) -> bool:
+    """
+    Checks whether pandera checks the values of the column of the dtype element by element,
+    so that the result of checking the dtype cannot be memoized.
+
+    Args:
+        dtype:  pandera dtype of the column.
+    Returns:
+        Result of checking.
+    """
+    from pandera.engines import pandas_engine
+
+    logical_dtypes = tuple(
+        getattr(pandas_engine, name)
+        for name in ('Decimal', 'Date', 'PythonGenericType', 'PydanticModel')
+        if hasattr(pandas_engine, name)
+    )
+    return isinstance(dtype, logical_dtypes) or bool(getattr(dtype, 'time_zone_agnostic', False))
+
+
+def _compile_column(name: Any, column: Column) -> Optional[_ColumnPlan]:
+    """
+    Compiles pandera.Column into fast-path checks.
+
+    Args:
+        name:    column name.
+        column:  pandera.Column to compile.
+    Returns:
+        Compiled checks or None if the column has checks that are not supported by the fast path.
+    """
+    if column.regex or getattr(column, 'on_missing', None) is not None or _is_element_wise_dtype(column.dtype):
+        return None
+    plan = _ColumnPlan(name, column)
+    for check in column.checks:
+        if (
+                getattr(check, 'groupby', None) is not None
+                or getattr(check, 'groups', None) is not None
+                or getattr(check, 'element_wise', False)
+                or not getattr(check, 'ignore_na', True)
+        ):
+            return None
+        check_name = check.name
+        statistics = dict(check.statistics or {})
+        if check_name in _BOUND_CHECKS:
+            for key, inclusive in _BOUND_CHECKS[check_name]:
+                plan.bounds.append((statistics[key], key == 'min_value', inclusive))
+        elif check_name == 'in_range':
+            plan.bounds.append((statistics['min_value'], True, bool(statistics.get('include_min', True))))
+            plan.bounds.append((statistics['max_value'], False, bool(statistics.get('include_max', True))))
+        elif check_name in _ELEMENT_CHECKS:
+            plan.element_checks.append((check_name, statistics))
+        else:
+            return None
+    return plan
+
+
+def _compile(schema: DataFrameSchema) -> Optional[_CompiledValidator]:
+    """
+    Compiles DataFrameSchema into a validator.
+
+    Args:
+        schema:  DataFrameSchema to compile.
+    Returns:
+        Compiled validator or None if the schema is not supported by the fast path.
+    """
+    if (
+            not is_data_preserving(schema)
+            or schema.checks
+            or schema.index is not None
+            or schema.dtype is not None
+            or getattr(schema, 'unique', None)
+            or getattr(schema, 'ordered', False)
+            or getattr(schema, 'on_missing_columns', None) is not None
+    ):
+        return None
+    plans = []
+    for name, column in schema.columns.items():
+        plan = _compile_column(name, column)
+        if plan is None:
+            return None
+        plans.append(plan)
+    return _CompiledValidator(schema, plans)
+
+
+_compiled_validators: Dict[int, Tuple['ref[DataFrameSchema]', Optional[_CompiledValidator]]] = {}
+_compiled_validators_lock = Lock()
+
+
+def _forget_compiled_validator(key: int) -> Callable[[Any], None]:
+    """
+    Returns weakref callback that removes the compiled validator of a garbage-collected DataFrameSchema.
+
+    Args:
+        key:  id of the DataFrameSchema.
+    Returns:
+        Weakref callback.
+    """
+    # The registry is bound as default arguments, since callbacks may run during interpreter shutdown.
+    def callback(schema_ref: 'ref[DataFrameSchema]',
+                 validators: Dict[int, Any] = _compiled_validators,
+                 lock: Lock = _compiled_validators_lock) -> None:
+        with lock:
+            entry = validators.get(key)
+            if entry is not None and entry[0] is schema_ref:
+                del validators[key]
+
+    return callback
+
+
+def compile_validator(schema: DataFrameSchema) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """
+    Returns the validator compiled from DataFrameSchema. Column presence, dtypes, nullability, uniqueness
+    and built-in range, equality and membership checks run as fused vectorized checks, and schemas without
+    columns and checks (like AnyDataFrame) validate nothing. DataFrames that fail the fast path are validated
+    by the schema itself, so that pandera raises its usual errors; valid DataFrames are returned without copying.
+    Schemas with other checks or with data transformations are always validated by pandera.
+    Compiled validators are memoized for every DataFrameSchema instance.
+
+    Args:
+        schema:  DataFrameSchema to compile.
+    Returns:
+        Callable that validates DataFrames.
+    """
+    key = id(schema)
+    entry = _compiled_validators.get(key)
+    if entry is not None and entry[0]() is schema:
+        validator = entry[1]
+    else:
+        validator = _compile(schema)
+        with _compiled_validators_lock:
+            _compiled_validators[key] = (ref(schema, _forget_compiled_validator(key)), validator)
+    return schema.validate if validator is None else validator
@@ -0,0 +1,83 @@
+import gc
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from pandakeeper.dataloader import DataFrameAdapter
+from pandakeeper.dataprocessor.cacher import SingleInputRuntimeCacher
+from pandakeeper.errors import LoopedGraphError
+from pandakeeper.node import Node
+
+N_BUILDS = 100_000
+WARMUP_BUILDS = 1_000
+
+
+class _Identity(SingleInputRuntimeCacher):
+    __slots__ = ()
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+
+def _graph_size() -> int:
+    return len(Node._Node__parental_graph) + len(Node._Node__children_graph)  # type: ignore
+
+
+def _build_graph(df: pd.DataFrame) -> None:
+    loader = DataFrameAdapter(df)
+    first = _Identity()
+    first.connect_input_node(loader)
+    second = _Identity()
+    second.connect_input_node(first)
+
+
+def test_memory_stays_flat_over_graph_builds():
+    df = pd.DataFrame({'x': [1, 2, 3]})
+    for _ in range(WARMUP_BUILDS):
+        _build_graph(df)
+    gc.collect()
+    initial_graph_size = _graph_size()
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for i in range(N_BUILDS):
+            _build_graph(df)
+            if i % 10_000 == 0:
+                gc.collect()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert _graph_size() <= initial_graph_size
+    # Dropped graphs are freed, so memory does not grow with the number of builds.
+    assert current - baseline < 256 * 1024
+    assert peak - baseline < 1024 * 1024
+
+
+def test_cached_output_is_freed_with_graph():
+    gc.collect()
+    initial_graph_size = _graph_size()
+    cacher = _Identity()
+    cacher.connect_input_node(DataFrameAdapter(pd.DataFrame({'x': range(1000)})))
+    cacher.extract_data()
+    assert cacher.already_cached
+    del cacher
+    gc.collect()
+    assert _graph_size() == initial_graph_size
+
+
+def test_failed_connect_input_nodes_leaves_no_connections():
+    loader = DataFrameAdapter(pd.DataFrame({'x': [1, 2, 3]}))
+    processor = _Identity()
+    looped_child = _Identity()
+    looped_child.connect_input_node(processor)
+
+    with pytest.raises(LoopedGraphError):
+        processor.connect_input_nodes(loader, looped_child)
+
+    assert processor.positional_input_nodes == ()
+    assert processor._parent_nodes == frozenset()
+    assert loader._child_nodes == frozenset()
@@ -0,0 +1,56 @@
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+
+from pandakeeper.dataloader import DataFrameAdapter
+from pandakeeper.dataprocessor.cacher import SingleInputRuntimeCacher, RuntimeCacher
+
+N_LAYERS = 30
+
+
+class _CountingAdapter(DataFrameAdapter):
+    __slots__ = ('visits',)
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        super().__init__(df)
+        self.visits = 0
+
+    def _fingerprint_parts(self) -> Optional[Tuple[Any, ...]]:
+        self.visits += 1
+        return super()._fingerprint_parts()
+
+
+class _Identity(SingleInputRuntimeCacher):
+    __slots__ = ()
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+
+class _Sum(RuntimeCacher):
+    __slots__ = ()
+
+    def _load_non_cached(self) -> pd.DataFrame:
+        left, right = self.positional_input_nodes
+        return left.extract_data() + right.extract_data()
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+
+def test_stacked_diamonds_fingerprint_every_node_once():
+    source = _CountingAdapter(pd.DataFrame({'x': range(100)}))
+    node = source
+    for _ in range(N_LAYERS):
+        left = _Identity()
+        left.connect_input_node(node)
+        right = _Identity()
+        right.connect_input_node(node)
+        node = _Sum()
+        node.connect_input_nodes(left, right)
+
+    assert node._fingerprint is not None
+    assert source.visits == 1
+    # The memo only lives for the duration of one fingerprint computation.
+    assert node._fingerprint is not None
+    assert source.visits == 2
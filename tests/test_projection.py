@@ -0,0 +1,66 @@
+import sqlite3
+from contextlib import ExitStack, closing
+
+import pandas as pd
+import pytest
+
+from pandakeeper.dataloader import CsvLoader, DataLoader
+from pandakeeper.dataloader.sql import SqlLoader
+from pandakeeper.dataprocessor.cacher import SingleInputRuntimeCacher
+from pandakeeper.dataprocessor.core import NodeConnection
+from pandakeeper.execution import GraphExecutor
+from pandakeeper.validators import AnyDataFrame
+
+_FRAME = pd.DataFrame({'id': [1, 2, 3], 'a': [4, 5, 6], 'b': [7, 8, 9]})
+
+
+class _Identity(SingleInputRuntimeCacher):
+    __slots__ = ()
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+
+def _connect(exit_stack: ExitStack, path: str) -> sqlite3.Connection:
+    return exit_stack.enter_context(closing(sqlite3.connect(path)))
+
+
+def _extract_projected(loader: DataLoader) -> pd.DataFrame:
+    processor = _Identity()
+    processor.connect_input_node(NodeConnection(loader, columns=['a']))
+    return GraphExecutor(processor, project_columns=True).extract_data()
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = str(tmp_path / 'projection.csv')
+    _FRAME.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    path = str(tmp_path / 'projection.sqlite')
+    with closing(sqlite3.connect(path)) as conn:
+        _FRAME.to_sql('data', conn, index=False)
+    return path
+
+
+def test_csv_projection_keeps_index_col(csv_path):
+    result = _extract_projected(CsvLoader(csv_path, index_col='id'))
+
+    pd.testing.assert_frame_equal(result, _FRAME.set_index('id')[['a']])
+
+
+def test_sql_projection_keeps_index_col(sqlite_path):
+    loader = SqlLoader(
+        _connect,
+        'SELECT * FROM data',
+        context_creator_args=(sqlite_path,),
+        read_sql_kwargs={'index_col': 'id'},
+        output_validator=AnyDataFrame
+    )
+
+    result = _extract_projected(loader)
+
+    pd.testing.assert_frame_equal(result, _FRAME.set_index('id')[['a']])
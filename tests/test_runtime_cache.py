@@ -0,0 +1,31 @@
+import pandas as pd
+
+from pandakeeper.dataloader import DataFrameAdapter
+from pandakeeper.dataprocessor.cacher import SingleInputRuntimeCacher
+
+
+class _Counting(SingleInputRuntimeCacher):
+    __slots__ = ('computations',)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.computations = 0
+
+    def transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        self.computations += 1
+        return data
+
+
+def test_cache_evicted_during_extraction_is_recomputed():
+    df = pd.DataFrame({'x': [1, 2, 3]})
+    cacher = _Counting()
+    cacher.connect_input_node(DataFrameAdapter(df))
+    cacher.extract_data()
+    assert cacher.already_cached
+
+    # Another thread evicts the cache after the Node has checked that it is cached.
+    cacher._RuntimeCacher__dataframe = None  # type: ignore
+
+    pd.testing.assert_frame_equal(cacher.extract_data(), df)
+    assert cacher.computations == 2
+    assert cacher.already_cached
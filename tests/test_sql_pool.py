@@ -0,0 +1,92 @@
+import sqlite3
+import threading
+from contextlib import ExitStack, closing
+from typing import List
+
+import pandas as pd
+import pytest
+
+from pandakeeper.dataloader.sql import SqlLoader, SqlContextPool, range_partitions
+from pandakeeper.validators import AnyDataFrame
+
+_connections: List[sqlite3.Connection] = []
+
+
+def _connect(exit_stack: ExitStack, path: str) -> sqlite3.Connection:
+    conn = exit_stack.enter_context(closing(sqlite3.connect(path, check_same_thread=False)))
+    _connections.append(conn)
+    return conn
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / 'pool.sqlite')
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute('CREATE TABLE data (id INTEGER, value REAL)')
+        conn.executemany('INSERT INTO data VALUES (?, ?)', [(i, i / 2) for i in range(100)])
+        conn.commit()
+    _connections.clear()
+    yield path
+    SqlContextPool.shared(_connect, (path,)).close()
+
+
+def _loader(path: str, sql_query: str = 'SELECT * FROM data ORDER BY id', **kwargs) -> SqlLoader:
+    return SqlLoader(_connect, sql_query, context_creator_args=(path,), output_validator=AnyDataFrame, **kwargs)
+
+
+def test_pooled_loader_reuses_connection(database):
+    expected = _loader(database).extract_data()
+    _connections.clear()
+
+    results = [_loader(database, pooled=True).extract_data() for _ in range(5)]
+
+    for result in results:
+        pd.testing.assert_frame_equal(result, expected)
+    assert len(_connections) == 1
+    assert SqlContextPool.shared(_connect, (database,)).idle_size == 1
+
+
+def test_pooled_connections_are_shared_across_threads(database):
+    loader = _loader(database, pooled=True, partition_predicates=range_partitions('id', [25, 50, 75]))
+    expected = _loader(database).extract_data()
+
+    for _ in range(3):
+        pd.testing.assert_frame_equal(loader.extract_data(), expected)
+
+    errors: List[BaseException] = []
+
+    def extract() -> None:
+        try:
+            pd.testing.assert_frame_equal(_loader(database, pooled=True).extract_data(), expected)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=extract) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(_connections) <= SqlContextPool.shared(_connect, (database,)).max_size
+
+
+def test_connection_is_closed_after_failed_query(database):
+    with pytest.raises(Exception):
+        _loader(database, 'SELECT * FROM missing_table', pooled=True).extract_data()
+
+    pool = SqlContextPool.shared(_connect, (database,))
+    assert pool.idle_size == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        _connections[0].execute('SELECT 1')
+
+
+def test_pool_limits_borrowed_connections(database):
+    pool = SqlContextPool(_connect, context_creator_args=(database,), max_size=1, acquire_timeout=0.01)
+    with ExitStack() as exit_stack:
+        pool(exit_stack)
+        with pytest.raises(TimeoutError):
+            pool(ExitStack())
+    with ExitStack() as exit_stack:
+        pool(exit_stack)
+    assert len(_connections) == 1
+    pool.close()
@@ -0,0 +1,142 @@
+import sqlite3
+from contextlib import ExitStack, closing
+from typing import List
+
+import pandas as pd
+import pandera as pa
+import pytest
+
+from pandakeeper.dataloader.sql import SqlLoader, SqlRelation, SqlRelationProcessor
+from pandakeeper.execution import GraphExecutor
+from pandakeeper.validators import AnyDataFrame
+
+_queries: List[str] = []
+
+
+def _connect(exit_stack: ExitStack, path: str) -> sqlite3.Connection:
+    conn = exit_stack.enter_context(closing(sqlite3.connect(path)))
+    conn.set_trace_callback(_queries.append)
+    return conn
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / 'relation.sqlite')
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute('CREATE TABLE orders (order_id INTEGER, customer_id INTEGER, amount REAL)')
+        conn.executemany(
+            'INSERT INTO orders VALUES (?, ?, ?)',
+            [(i, i % 4, float(i * 10)) for i in range(20)]
+        )
+        conn.execute('CREATE TABLE customers (customer_id INTEGER, name TEXT)')
+        conn.executemany('INSERT INTO customers VALUES (?, ?)', [(i, f'customer_{i}') for i in range(4)])
+        conn.commit()
+    _queries.clear()
+    return path
+
+
+def _loader(path: str, sql_query: str, output_validator: pa.DataFrameSchema = AnyDataFrame) -> SqlLoader:
+    return SqlLoader(_connect, sql_query, context_creator_args=(path,), output_validator=output_validator)
+
+
+def _read_table(path: str, table: str) -> pd.DataFrame:
+    with closing(sqlite3.connect(path)) as conn:
+        return pd.read_sql(f'SELECT * FROM {table}', conn)
+
+
+def test_compiled_operations_run_as_single_query(database):
+    relation = (
+        SqlRelation(_loader(database, 'SELECT * FROM orders'))
+        .filter('amount', '>=', 50.0)
+        .select('order_id', 'amount')
+        .order_by('amount', ascending=False)
+        .limit(3)
+    )
+    sql_query, remaining_operations = relation.compile()
+    assert remaining_operations == ()
+
+    result = relation.evaluate()
+
+    orders = _read_table(database, 'orders')
+    expected = orders.loc[orders['amount'] >= 50.0, ['order_id', 'amount']]
+    expected = expected.sort_values('amount', ascending=False).head(3).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert _queries == [sql_query]
+
+
+def test_aggregation_and_join_are_compiled(database):
+    totals = SqlRelation(_loader(database, 'SELECT * FROM orders')).aggregate(
+        by=('customer_id',), total=('amount', 'sum'), orders=('order_id', 'count')
+    )
+    customers = SqlRelation(_loader(database, 'SELECT * FROM customers'))
+    relation = totals.join(customers, on=('customer_id',)).order_by('customer_id')
+    assert relation.compile()[1] == ()
+
+    result = relation.evaluate()
+
+    orders = _read_table(database, 'orders')
+    expected = orders.groupby('customer_id', as_index=False).agg(
+        total=('amount', 'sum'), orders=('order_id', 'count')
+    ).merge(_read_table(database, 'customers'), on='customer_id')
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    assert len(_queries) == 1
+
+
+def test_operations_after_transform_run_in_pandas(database):
+    relation = (
+        SqlRelation(_loader(database, 'SELECT * FROM orders'))
+        .filter('customer_id', '=', 1)
+        .transform(lambda df: df.assign(amount=df['amount'] * 2))
+        .filter('amount', '>', 100.0)
+    )
+    _, remaining_operations = relation.compile()
+    assert len(remaining_operations) == 2
+
+    result = relation.evaluate().reset_index(drop=True)
+
+    orders = _read_table(database, 'orders')
+    expected = orders[orders['customer_id'] == 1].assign(amount=lambda df: df['amount'] * 2)
+    expected = expected[expected['amount'] > 100.0].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(_queries) == 1
+
+
+def test_executor_does_not_load_source_tables(database):
+    relation = SqlRelation(_loader(database, 'SELECT * FROM orders')).filter('order_id', '<', 5).select('order_id')
+    processor = SqlRelationProcessor(relation)
+    assert not processor._parent_nodes
+
+    result = GraphExecutor(processor).extract_data()
+
+    assert result['order_id'].tolist() == [0, 1, 2, 3, 4]
+    assert _queries == [relation.compile()[0]]
+
+
+def test_compiled_result_is_validated_by_source_loader(database):
+    validator = pa.DataFrameSchema({
+        'order_id': pa.Column(int),
+        'customer_id': pa.Column(int),
+        'amount': pa.Column(float, pa.Check.le(100.0))
+    }, strict=True)
+    relation = SqlRelation(_loader(database, 'SELECT * FROM orders', validator)).filter('amount', '>=', 50.0)
+    assert relation.compile()[1] == ()
+
+    with pytest.raises(pa.errors.SchemaError):
+        relation.evaluate()
+    assert relation.select('order_id').evaluate()['order_id'].tolist() == list(range(5, 20))
+
+
+def test_aggregation_over_validated_loader_runs_in_pandas(database):
+    validator = pa.DataFrameSchema({'amount': pa.Column(float, pa.Check.le(100.0))})
+    relation = (
+        SqlRelation(_loader(database, 'SELECT * FROM orders', validator))
+        .filter('amount', '<', 50.0)
+        .aggregate(total=('amount', 'sum'))
+    )
+    sql_query, remaining_operations = relation.compile()
+    assert len(remaining_operations) == 1
+
+    result = relation.evaluate()
+
+    assert result['total'].tolist() == [100.0]
+    assert _queries == [sql_query]
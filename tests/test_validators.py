@@ -0,0 +1,15 @@
+import pandas as pd
+import pandera as pa
+
+from pandakeeper.validators import compile_validator
+
+
+def test_fast_path_does_not_alias_input():
+    df = pd.DataFrame({'a': [1, 2, 3]})
+    validator = compile_validator(pa.DataFrameSchema({'a': pa.Column(int, pa.Check.ge(0))}))
+
+    validated = validator(df)
+    validated.loc[0, 'a'] = 100
+
+    assert validated is not df
+    assert df['a'].tolist() == [1, 2, 3]